@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Optional
 
 from algoritmia.datastructures.graphs import UndirectedGraph
@@ -24,23 +25,25 @@ def find_treasure_breadthfirst(g: UndirectedGraph[Vertex],
     return None
 
 
+# Con una pila de iteradores de sucesores en lugar de recursión: no hay límite de profundidad
 def find_treasure_depthfirst(g: UndirectedGraph[Vertex],
                              v_start: Vertex,
                              v_treasure: Vertex) -> Optional[Vertex]:
-    def explorar_desde(v: Vertex) -> Optional[Vertex]:
-        seen.add(v)
-        if v == v_treasure:  # preorder
-            return v  # preorder
-        for suc in g.succs(v):
+    seen: set[Vertex] = {v_start}
+    if v_start == v_treasure:  # preorder
+        return v_start  # preorder
+    stack: list[Iterator[Vertex]] = [iter(g.succs(v_start))]
+    while len(stack) > 0:
+        for suc in stack[-1]:
             if suc not in seen:
-                res = explorar_desde(suc)
-                if res is not None:
-                    return res
-        # if v == v_treasure:     # postorder
-        #    return v             # postorder
-
-    seen = set()
-    return explorar_desde(v_start)
+                seen.add(suc)
+                if suc == v_treasure:  # preorder
+                    return suc  # preorder
+                stack.append(iter(g.succs(suc)))
+                break
+        else:
+            stack.pop()
+    return None
 
 
 # Main program -------------------------------------------------------------------------
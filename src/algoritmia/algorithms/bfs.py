@@ -0,0 +1,184 @@
+from array import array
+from collections.abc import Iterable
+
+from algoritmia.datastructures.csrgraphs import CSRGraph
+
+# Búsqueda en anchura por niveles sobre los enteros de los vértices de un CSRGraph (ver vertex_index).
+# Para otros grafos, crea antes su versión CSR: CSRGraph.from_graph(g).
+#
+# direction_optimizing_bfs(): en lugar de generar las aristas de una en una (traverse_bf), expande un
+# nivel completo en cada paso y elige en cada uno la dirección más barata (Beamer et al.):
+#   - top-down: cada vértice de la frontera visita sus sucesores aún no alcanzados.
+#   - bottom-up: cada vértice no alcanzado busca entre sus predecesores uno de la frontera (marcada en un
+#     bytearray) y se detiene en el primero. Es mucho más barato cuando la frontera es enorme, como en
+#     los niveles centrales de los grafos de diámetro pequeño.
+# Se pasa a bottom-up cuando las aristas que salen de la frontera (m_f) superan a las de los vértices
+# no alcanzados (m_u) divididas entre alpha, y se vuelve a top-down cuando la frontera tiene menos de
+# |V| / beta vértices.
+# Devuelve dos arrays indexados por el entero de cada vértice:
+#   - parent: el entero del vértice desde el que se alcanzó (el origen es su propio padre)
+#   - level: la distancia en aristas desde el origen
+# En los dos, -1 indica que el vértice no es alcanzable.
+#
+# bfs_distances(): distancias en aristas desde varios orígenes, sin un recorrido independiente por origen.
+#   - mode='nearest': una sola búsqueda que empieza a la vez en todos los orígenes. Devuelve dos arrays
+#     indexados por el entero de cada vértice: la distancia al origen más cercano y la posición de ese
+#     origen en 'sources' (si hay empate, uno cualquiera de ellos).
+#   - mode='matrix': una fila por origen con la distancia a cada vértice. Los orígenes se procesan en
+#     lotes de 'batch' (64 por defecto) con una búsqueda paralela por bits: cada vértice guarda un entero
+#     con un bit por origen del lote, de modo que cada arista se recorre una vez por nivel para todo
+#     el lote en lugar de una vez por origen.
+#   En los dos casos -1 indica que el vértice no es alcanzable.
+
+
+def _check_csr(g, name: str):
+    if not hasattr(g, 'csr_arrays'):
+        raise TypeError(f"{name} - {g.__class__.__name__} is not a CSRGraph")
+
+
+# O(|V| + |E|)
+def direction_optimizing_bfs[T](g: CSRGraph[T], v_initial: T,
+                                direction: str = 'auto',
+                                alpha: float = 14, beta: float = 24) -> tuple[array, array]:
+    if direction not in ('auto', 'top-down', 'bottom-up'):
+        raise ValueError(f"direction_optimizing_bfs - Unknown direction '{direction}'")
+    _check_csr(g, 'direction_optimizing_bfs')
+    s_off, s_tgt, p_off, p_tgt = g.csr_arrays()
+    n = len(s_off) - 1
+    # Listas y bytearrays durante el recorrido (acceso más rápido que array), arrays compactos al final
+    parent = [-1] * n
+    level = [-1] * n
+    visited = bytearray(n)
+    source = g.vertex_index[v_initial]
+    parent[source] = source
+    level[source] = 0
+    visited[source] = 1
+
+    frontier = [source]
+    unvisited: list[int] = []  # Se crea en el primer paso bottom-up y solo se mantiene en ellos
+    m_u = len(s_tgt) - (s_off[source + 1] - s_off[source])  # Aristas de los vértices no alcanzados
+    bottom_up = direction == 'bottom-up'
+    was_bottom_up = False
+    depth = 0
+    while len(frontier) > 0:
+        depth += 1
+        if direction == 'auto':
+            m_f = sum(s_off[u + 1] - s_off[u] for u in frontier)  # Aristas que salen de la frontera
+            if not bottom_up and m_f > m_u / alpha:
+                bottom_up = True
+            elif bottom_up and len(frontier) < n / beta:
+                bottom_up = False
+        next_frontier: list[int] = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+            if not was_bottom_up:  # Los no alcanzados pueden haber cambiado en los pasos top-down
+                unvisited = [v for v in range(n) if not visited[v]]
+            still_unvisited: list[int] = []
+            for v in unvisited:
+                for u in p_tgt[p_off[v]:p_off[v + 1]]:
+                    if in_frontier[u]:  # Basta con el primer predecesor que esté en la frontera
+                        parent[v] = u
+                        level[v] = depth
+                        next_frontier.append(v)
+                        break
+                else:
+                    still_unvisited.append(v)
+            for v in next_frontier:
+                visited[v] = 1
+            unvisited = still_unvisited
+        else:
+            for u in frontier:
+                new = [v for v in s_tgt[s_off[u]:s_off[u + 1]] if not visited[v]]
+                for v in new:
+                    visited[v] = 1
+                    parent[v] = u
+                    level[v] = depth
+                next_frontier.extend(new)
+        was_bottom_up = bottom_up
+        m_u -= sum(s_off[v + 1] - s_off[v] for v in next_frontier)
+        frontier = next_frontier
+    return array('q', parent), array('q', level)
+
+
+# nearest: O(|V| + |E|), matrix: O(|sources| |V| + ceil(|sources| / batch) * diámetro * |E|)
+def bfs_distances[T](g: CSRGraph[T], sources: Iterable[T],
+                     mode: str = 'nearest', batch: int = 64) -> tuple[array, array] | list[array]:
+    if mode not in ('nearest', 'matrix'):
+        raise ValueError(f"bfs_distances - Unknown mode '{mode}'")
+    _check_csr(g, 'bfs_distances')
+    s_off, s_tgt, _, _ = g.csr_arrays()
+    n = len(s_off) - 1
+    ids = g.vertex_index.ids(sources)
+    if mode == 'nearest':
+        return _bfs_nearest(s_off, s_tgt, n, ids)
+    rows = [array('i', [-1]) * n for _ in ids]
+    for start in range(0, len(ids), batch):
+        _bfs_bit_parallel(s_off, s_tgt, n, ids[start:start + batch], rows[start:start + batch])
+    return rows
+
+
+# Búsqueda en anchura desde todos los orígenes a la vez: O(|V| + |E|)
+def _bfs_nearest(s_off, s_tgt, n: int, ids: list[int]) -> tuple[array, array]:
+    dist = [-1] * n
+    nearest = [-1] * n
+    frontier: list[int] = []
+    for k, i in enumerate(ids):
+        if dist[i] == -1:
+            dist[i] = 0
+            nearest[i] = k
+            frontier.append(i)
+    depth = 0
+    while len(frontier) > 0:
+        depth += 1
+        next_frontier: list[int] = []
+        for u in frontier:
+            for v in s_tgt[s_off[u]:s_off[u + 1]]:
+                if dist[v] == -1:
+                    dist[v] = depth
+                    nearest[v] = nearest[u]
+                    next_frontier.append(v)
+        frontier = next_frontier
+    return array('i', dist), array('i', nearest)
+
+
+# Búsqueda en anchura paralela por bits: el bit b de seen[v] indica que el origen ids[b] ya ha alcanzado v
+# y frontier[v] tiene los bits de los orígenes que alcanzaron v en el último nivel. Rellena 'rows'
+def _bfs_bit_parallel(s_off, s_tgt, n: int, ids: list[int], rows: list[array]):
+    seen = [0] * n
+    frontier: dict[int, int] = {}
+    for b, i in enumerate(ids):
+        seen[i] |= 1 << b
+        frontier[i] = frontier.get(i, 0) | 1 << b
+        rows[b][i] = 0
+    depth = 0
+    while len(frontier) > 0:
+        depth += 1
+        next_frontier: dict[int, int] = {}
+        for u, mask in frontier.items():
+            for v in s_tgt[s_off[u]:s_off[u + 1]]:
+                new = mask & ~seen[v]
+                if new:
+                    seen[v] |= new
+                    next_frontier[v] = next_frontier.get(v, 0) | new
+        for v, new in next_frontier.items():
+            while new:  # Un bit por origen que alcanza v en este nivel
+                low = new & -new
+                rows[low.bit_length() - 1][v] = depth
+                new ^= low
+        frontier = next_frontier
+
+
+if __name__ == '__main__':
+    from algoritmia.data.iberia import iberia
+
+    g0 = CSRGraph.from_graph(iberia)
+    parent0, level0 = direction_optimizing_bfs(g0, 'Madrid')
+    index0 = g0.vertex_index
+    print(max(level0), [index0.label(i) for i in range(len(index0)) if level0[i] == max(level0)])
+    print(index0.label(parent0[index0['Bilbao']]))
+    depots = ['Madrid', 'Barcelona', 'Sevilla']
+    dist0, nearest0 = bfs_distances(g0, depots)
+    print(depots[nearest0[index0['Bilbao']]], dist0[index0['Bilbao']])
+    print([row[index0['Bilbao']] for row in bfs_distances(g0, depots, 'matrix')])
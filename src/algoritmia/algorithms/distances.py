@@ -0,0 +1,178 @@
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from algoritmia.algorithms.traverse import traverse_dijkstra_distances
+from algoritmia.datastructures.graphs import IGraph, WeightingFunction, Weight
+from algoritmia.graphio import load_graph, file_source
+from algoritmia.utils import infinity
+
+# Distancias (costes de los caminos más cortos) en grafos ponderados positivos, sin reconstruir caminos.
+#
+# distance_matrix(): matriz de distancias de cada vértice de 'sources' a cada vértice de 'targets', por ejemplo
+# para los costes de un problema de rutas de vehículos. Una sola búsqueda de Dijkstra por origen (en lugar de
+# una por par) que se detiene en cuanto ha asentado todos los destinos. Devuelve una fila array('d') por
+# origen, en el orden de 'sources', con infinity para los destinos no alcanzables.
+# Con workers > 1, los orígenes se reparten entre procesos. El grafo y los pesos se envían una sola vez a cada
+# proceso (los comparten todas sus búsquedas) y solo viajan los orígenes y las filas. Deben poderse serializar
+# con pickle, salvo el grafo y los pesos de load_graph(): a cada proceso solo se le envía su atributo source
+# y vuelve a abrir el fichero (mmap), de modo que todos comparten sus páginas en lugar de recibir una copia.
+# Si el fichero ha cambiado desde load_graph(), el grafo y los pesos se envían como cualquier otro (con pickle,
+# lo que falla con las vistas de mmap salvo con el método de arranque 'fork', en el que se heredan).
+#
+# dijkstra_tree(): árbol de caminos más cortos desde un origen (ShortestPathTree), con la distancia (dist) y el
+# predecesor (parent) de cada vértice alcanzable. Tras una sola búsqueda, distance_to(v) es O(1) y path_to(v)
+# es O(longitud del camino), en lugar de un path_recover() O(|V|) por destino.
+#
+# dijkstra_within() y dijkstra_k_nearest(): vértices a distancia como mucho 'radius' del origen y los k vértices
+# (de 'targets', si se indica) más cercanos al origen. Devuelven pares (vértice, distancia) ordenados por
+# distancia. Dijkstra asienta los vértices en orden de distancia, así que la búsqueda se detiene en cuanto se
+# alcanza el límite: el coste depende de la bola explorada, no del tamaño del grafo.
+
+
+class ShortestPathTree[T]:
+    # O(1)
+    def __init__(self, source: T, dist: dict[T, Weight], parent: dict[T, T]):
+        self.source = source
+        self.dist = dist
+        self.parent = parent  # El origen es su propio padre
+
+    # O(1): infinity si v no es alcanzable
+    def distance_to(self, v: T) -> Weight:
+        return self.dist.get(v, infinity)
+
+    # O(longitud del camino): KeyError si v no es alcanzable
+    def path_to(self, v: T) -> list[T]:
+        if v not in self.parent:
+            raise KeyError(f"ShortestPathTree - {v!r} is not reachable from {self.source!r}")
+        parent = self.parent
+        path = [v]
+        while v != parent[v]:
+            v = parent[v]
+            path.append(v)
+        path.reverse()
+        return path
+
+    # O(1)*
+    def __contains__(self, v: T) -> bool:
+        return v in self.dist
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.source!r}, {len(self.dist)} vertices)"
+
+
+# O((|V| + |E|) log |E|)
+def dijkstra_tree[T](g: IGraph[T], d: WeightingFunction[T], v_source: T) -> ShortestPathTree[T]:
+    dist: dict[T, Weight] = {}
+    parent: dict[T, T] = {}
+    for u, v, dv in traverse_dijkstra_distances(g, d, v_source):
+        dist[v] = dv
+        parent[v] = u
+    return ShortestPathTree(v_source, dist, parent)
+
+
+# O((|B| + |E_B|) log |E_B|), donde B es la bola de radio 'radius' y E_B, sus aristas
+def dijkstra_within[T](g: IGraph[T], d: WeightingFunction[T], v_source: T,
+                       radius: Weight) -> list[tuple[T, Weight]]:
+    result = []
+    for _, v, dv in traverse_dijkstra_distances(g, d, v_source):
+        if dv > radius:
+            break
+        result.append((v, dv))
+    return result
+
+
+# O((|B| + |E_B|) log |E_B|), donde B es la bola que contiene los k vértices más cercanos
+def dijkstra_k_nearest[T](g: IGraph[T], d: WeightingFunction[T], v_source: T, k: int,
+                          targets: Optional[Iterable[T]] = None) -> list[tuple[T, Weight]]:
+    if k < 0:
+        raise ValueError("dijkstra_k_nearest - k must be non negative")
+    targets = None if targets is None else set(targets)
+    result = []
+    if k == 0:
+        return result
+    for _, v, dv in traverse_dijkstra_distances(g, d, v_source):
+        if targets is None or v in targets:
+            result.append((v, dv))
+            if len(result) == k:
+                break
+    return result
+
+
+# Fila de distancias de 'source' a los destinos; columns[v] son las columnas del destino v
+# O((|V| + |E|) log |E|), menos si los destinos están cerca
+def _distance_row[T](g: IGraph[T], d: WeightingFunction[T], source: T, columns: dict[T, list[int]],
+                     width: int) -> array:
+    row = array('d', [infinity]) * width
+    pending = len(columns)
+    for _, v, dv in traverse_dijkstra_distances(g, d, source):
+        js = columns.get(v)
+        if js is not None:
+            for j in js:
+                row[j] = dv
+            pending -= 1
+            if pending == 0:
+                break
+    return row
+
+
+# Estado de cada proceso de ProcessPoolExecutor: el grafo, sus pesos y los destinos se envían una sola vez
+_worker_args: tuple = ()
+
+
+def _init_worker(g, d, columns, width):
+    global _worker_args
+    _worker_args = g, d, columns, width
+
+
+def _init_worker_from_file(file_id, columns, width):
+    g, d, _ = load_graph(file_id[0])
+    if g.source != file_id:  # El fichero se ha sustituido tras comprobarlo en distance_matrix()
+        raise ValueError(f"distance_matrix - '{file_id[0]}' has changed since it was loaded")
+    _init_worker(g, d, columns, width)
+
+
+def _worker_row(source) -> array:
+    g, d, columns, width = _worker_args
+    return _distance_row(g, d, source, columns, width)
+
+
+# O(|sources| (|V| + |E|) log |E|)
+def distance_matrix[T](g: IGraph[T], d: WeightingFunction[T], sources: Iterable[T], targets: Iterable[T],
+                       workers: Optional[int] = None) -> list[array]:
+    sources = list(sources)
+    columns: dict[T, list[int]] = {}
+    width = 0
+    for j, v in enumerate(targets):
+        if not g.contains_vertex(v):
+            raise KeyError(f"distance_matrix - {v!r} is not a vertex of the graph")
+        columns.setdefault(v, []).append(j)
+        width += 1
+    for u in sources:
+        if not g.contains_vertex(u):
+            raise KeyError(f"distance_matrix - {u!r} is not a vertex of the graph")
+    if width == 0:
+        return [array('d') for _ in sources]
+    if workers is not None and workers > 1 and len(sources) > 1:
+        file_id = getattr(g, 'source', None)  # Ver load_graph()
+        if file_id is not None and getattr(d, 'source', None) == file_id and file_source(file_id[0]) == file_id:
+            initializer, initargs = _init_worker_from_file, (file_id, columns, width)
+        else:
+            initializer, initargs = _init_worker, (g, d, columns, width)
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+            chunksize = max(1, len(sources) // (4 * workers))
+            return list(executor.map(_worker_row, sources, chunksize=chunksize))
+    return [_distance_row(g, d, u, columns, width) for u in sources]
+
+
+if __name__ == '__main__':
+    from algoritmia.data.iberia import iberia, km
+
+    cities = ['Madrid', 'Barcelona', 'Sevilla', 'Bilbao', 'Zaragoza']
+    for city, row in zip(cities, distance_matrix(iberia, km, cities, cities)):
+        print(f'{city:>10}', ' '.join(f'{dv:8.1f}' for dv in row))
+    tree = dijkstra_tree(iberia, km, 'Madrid')
+    print(tree, tree.distance_to('Bilbao'), tree.path_to('Bilbao'))
+    print(dijkstra_within(iberia, km, 'Madrid', 50))
+    print(dijkstra_k_nearest(iberia, km, 'Madrid', 2, targets=cities))
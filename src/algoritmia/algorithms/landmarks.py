@@ -0,0 +1,204 @@
+import mmap
+import random
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from algoritmia.algorithms.traverse import traverse_dijkstra_distances
+from algoritmia.datastructures.graphs import IGraph, WeightingFunction, VertexIndex
+from algoritmia.graphio import _label_kind, _write_labels, _read_labels, _write_section
+from algoritmia.utils import infinity
+
+# LandmarkIndex: índice ALT (A*, landmarks, triangle inequality) para responder muchas consultas de camino
+# más corto sobre el mismo grafo ponderado positivo.
+# - Se eligen k vértices de referencia (landmarks) L y se guardan, para cada uno, las distancias d(L, v) de
+#   L a todos los vértices y, en los digrafos, las distancias d(v, L) de todos los vértices a L.
+# - Por la desigualdad triangular, para cualquier par u, t:
+#       d(u, t) >= d(L, t) - d(L, u)      y      d(u, t) >= d(u, L) - d(t, L)
+#   El máximo de estas cotas para todos los landmarks es una cota inferior consistente de d(u, t), mucho
+#   más ajustada en redes de carreteras que la distancia euclídea.
+# - El índice es invocable: index(u, t) devuelve esa cota, por lo que se usa directamente como 'dist' en
+#   shortest_path_metric_graph() o traverse_astar().
+# Elección de los landmarks:
+#   - 'farthest': el primero es el vértice más lejano a uno elegido al azar y cada uno de los siguientes,
+#     el más lejano a los ya elegidos. Quedan en la periferia del grafo, donde dan las mejores cotas.
+#   - 'random': al azar.
+# Cada landmark necesita un recorrido de Dijkstra completo. Con workers > 1, los recorridos que no dependen
+# de la elección (todos con 'random'; los de las distancias hacia los landmarks en los digrafos) se reparten
+# entre procesos. Con 'farthest', cada landmark depende de los recorridos de los anteriores.
+#
+# Formato binario de save()/load():
+#   - Cabecera: ver _HEADER
+#   - Secciones alineadas a 8 bytes: enteros de los landmarks (int64, k), distancias desde los landmarks
+#     (float64, k |V|), solo digrafos: distancias hacia los landmarks (float64, k |V|), tabla de etiquetas
+#     de los vértices (como en algoritmia/graphio.py)
+#   load() proyecta el fichero en memoria (mmap): las distancias no se copian.
+
+_MAGIC = b'ALGALT\x00\x00'
+_FORMAT_VERSION = 1
+# magic, version, byte order, directed, |V|, k, label kind
+_HEADER = struct.Struct('=8sHcBQQB7x')
+
+
+# Distancias (según los enteros de 'index') desde el vértice 'landmark' o, con reverse=True, hacia él
+# O((|V| + |E|) log |E|)
+def _distances[T](g: IGraph[T], d: WeightingFunction[T], index: VertexIndex[T],
+                  landmark: T, reverse: bool) -> array:
+    dist = array('d', [infinity]) * len(index)
+    for _, v, dv in traverse_dijkstra_distances(g, d, landmark, reverse):
+        dist[index[v]] = dv
+    return dist
+
+
+# Estado de cada proceso de ProcessPoolExecutor: el grafo y sus pesos se envían una sola vez
+_worker_args: tuple = ()
+
+
+def _init_worker(g, d, index):
+    global _worker_args
+    _worker_args = g, d, index
+
+
+def _worker_distances(task: tuple) -> array:
+    landmark, reverse = task
+    return _distances(*_worker_args, landmark, reverse)
+
+
+class LandmarkIndex[T]:
+    # O(1): crea el índice a partir de sus arrays (ver from_graph() y load())
+    def __init__(self, vertex_index: VertexIndex[T], landmarks: Sequence[int],
+                 forward: Sequence[Sequence[float]], backward: Optional[Sequence[Sequence[float]]] = None):
+        self.vertex_index = vertex_index
+        self._landmarks = landmarks
+        self._forward = forward  # forward[j][i]: distancia del landmark j al vértice i
+        self._backward = forward if backward is None else backward  # backward[j][i]: del vértice i al landmark j
+        self._target: Optional[T] = None  # Columna del último destino consultado
+        self._target_f: list[float] = []
+        self._target_b: list[float] = []
+
+    # O(k (|V| + |E|) log |E|)
+    @classmethod
+    def from_graph(cls, g: IGraph[T], d: WeightingFunction[T], k: int = 16,
+                   selection: str = 'farthest', workers: Optional[int] = None,
+                   seed: Optional[int] = None) -> "LandmarkIndex[T]":
+        if selection not in ('farthest', 'random'):
+            raise ValueError(f"{cls.__name__} - Unknown selection '{selection}'")
+        index = VertexIndex(sorted(g.V, key=repr))  # Orden fijo (g.V es un conjunto): con 'seed' el resultado se repite
+        n = len(index)
+        k = min(k, n)
+        rnd = random.Random(seed)
+        forward: list[Optional[array]] = []
+        if selection == 'random':
+            landmarks = rnd.sample(range(n), k)
+            forward = [None] * k
+        else:
+            landmarks = []
+            # La distancia de cada vértice al landmark más cercano; la primera vez, a un vértice al azar
+            nearest = _distances(g, d, index, index.label(rnd.randrange(n)), False)
+            for _ in range(k):
+                # El más lejano: los no alcanzables (infinito) primero, así se cubren todas las componentes
+                i = max((i for i in range(n) if i not in landmarks), key=nearest.__getitem__)
+                landmarks.append(i)
+                forward.append(_distances(g, d, index, index.label(i), False))
+                nearest = array('d', map(min, nearest, forward[-1]))
+
+        # Recorridos pendientes: (landmark, reverse)
+        tasks = [(index.label(i), False) for i, f in zip(landmarks, forward) if f is None]
+        if g.is_directed():
+            tasks.extend((index.label(i), True) for i in landmarks)
+        if workers is not None and workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(g, d, index)) as executor:
+                results = list(executor.map(_worker_distances, tasks))
+        else:
+            results = [_distances(g, d, index, landmark, reverse) for landmark, reverse in tasks]
+        results.reverse()
+        forward = [f if f is not None else results.pop() for f in forward]
+        backward = [results.pop() for _ in landmarks] if g.is_directed() else None
+        return cls(index, landmarks, forward, backward)
+
+    # O(1)
+    @property
+    def landmarks(self) -> list[T]:
+        return self.vertex_index.labels(self._landmarks)
+
+    # O(k): cota inferior de la distancia de u a v
+    def __call__(self, u: T, v: T) -> float:
+        if v != self._target:  # Las consultas de A* repiten el destino: sus distancias se guardan una vez
+            j = self.vertex_index[v]
+            self._target = v
+            self._target_f = [f[j] for f in self._forward]
+            self._target_b = [b[j] for b in self._backward]
+        i = self.vertex_index[u]
+        bound = 0.0
+        for f, b, tf, tb in zip(self._forward, self._backward, self._target_f, self._target_b):
+            fu, bu = f[i], b[i]
+            if fu != infinity and tf != infinity and tf - fu > bound:
+                bound = tf - fu
+            if bu != infinity and tb != infinity and bu - tb > bound:
+                bound = bu - tb
+        return bound
+
+    # O(k |V|)
+    def save(self, path: str):
+        labels = list(self.vertex_index)
+        kind = _label_kind(labels)
+        directed = self._backward is not self._forward
+        with open(path, 'wb') as f:
+            byteorder = b'<' if sys.byteorder == 'little' else b'>'
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, byteorder, directed, len(labels),
+                                 len(self._landmarks), kind))
+            _write_section(f, array('q', self._landmarks))
+            for dist in self._forward:
+                _write_section(f, array('d', dist))
+            if directed:
+                for dist in self._backward:
+                    _write_section(f, array('d', dist))
+            _write_labels(f, labels, kind)
+
+    # O(|V|) para la tabla de etiquetas, las distancias se proyectan en memoria (mmap) sin copiarlas.
+    # No sobrescribas el fichero mientras haya índices abiertos sobre él.
+    @classmethod
+    def load(cls, path: str) -> "LandmarkIndex":
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mv = memoryview(mm)
+        if len(mv) < _HEADER.size:
+            raise ValueError(f"{cls.__name__} - '{path}' is not a landmark index file")
+        magic, version, byteorder, directed, n, k, kind = _HEADER.unpack_from(mv)
+        if magic != _MAGIC:
+            raise ValueError(f"{cls.__name__} - '{path}' is not a landmark index file")
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"{cls.__name__} - Unsupported format version {version} in '{path}'")
+        if byteorder != (b'<' if sys.byteorder == 'little' else b'>'):
+            raise ValueError(f"{cls.__name__} - '{path}' was written with a different byte order")
+        pos = _HEADER.size
+        landmarks = mv[pos:pos + 8 * k].cast('q')
+        pos += 8 * k
+        forward = []
+        for _ in range(k):
+            forward.append(mv[pos:pos + 8 * n].cast('d'))
+            pos += 8 * n
+        backward = None
+        if directed:
+            backward = []
+            for _ in range(k):
+                backward.append(mv[pos:pos + 8 * n].cast('d'))
+                pos += 8 * n
+        index, _ = _read_labels(mv, pos, n, kind)
+        return cls(index, landmarks, forward, backward)
+
+
+if __name__ == '__main__':
+    from algoritmia.algorithms.shortest_path import shortest_path_metric_graph, euclidean_distance
+    from algoritmia.data.iberia import iberia, km, coords2d
+
+    alt = LandmarkIndex.from_graph(iberia, km, k=8, seed=0)
+    print('landmarks:', alt.landmarks)
+    for name, h in ('euclidean', euclidean_distance(coords2d)), ('ALT', alt):
+        stats = {}
+        path = shortest_path_metric_graph(iberia, km, h, 'Cádiz', 'Girona', stats=stats)
+        print(f'{name}: {stats["expanded"]} expanded vertices, {len(path)} vertices in the path')
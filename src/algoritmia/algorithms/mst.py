@@ -1,5 +1,5 @@
-from algoritmia.datastructures.graphs import UndirectedGraph, WeightingFunction, Edge
-from algoritmia.datastructures.mergefindsets import MergeFindSet
+from algoritmia.datastructures.graphs import UndirectedGraph, WeightingFunction, Edge, Weight, VertexIndex, weighted_succs
+from algoritmia.datastructures.mergefindsets import DenseMergeFindSet
 from algoritmia.datastructures.prioritymaps import MinHeapMap
 from algoritmia.utils import argmin
 
@@ -10,55 +10,59 @@ from algoritmia.utils import argmin
 def kruskal[T](g: UndirectedGraph[T],
                d: WeightingFunction[T]) -> UndirectedGraph[T]:
     edges: list[Edge[T]] = []
-    forest: MergeFindSet[T] = MergeFindSet((v,) for v in g.V)
-    n = 0
+    index: VertexIndex[T] = VertexIndex(g.V)  # El MFSet trabaja con los enteros de los vértices
+    forest = DenseMergeFindSet(len(index))
+    n, n_target = 0, len(index) - 1  # len(g.V) puede ser O(|V|) (p.e. en SubgraphView)
     for (u, v) in sorted(g.E, key=lambda e: d(e)):
-        if forest.find(u) != forest.find(v):
-            forest.merge(u, v)
+        iu, iv = index[u], index[v]
+        if forest.find(iu) != forest.find(iv):
+            forest.merge(iu, iv)
             edges.append((u, v))
             n += 1
-            if n == len(g.V) - 1:
+            if n == n_target:
                 break
     return UndirectedGraph(E=edges)
 
 
 def prim_dic[T](g: UndirectedGraph[T],
                 d: WeightingFunction[T]) -> UndirectedGraph[T]:
+    succs_w = weighted_succs(g, d)  # Sucesores con el peso de la arista
     edges: list[Edge[T]] = []
     fixed: set[T] = set()
     for u in g.V:
         if u not in fixed:
             fixed.add(u)
-            bp: dict[T, T] = dict((v, u) for v in g.succs(u))
+            bp: dict[T, tuple[T, Weight]] = dict((v, (u, d_uv)) for v, d_uv in succs_w(u))
             while len(bp) > 0:
-                (v, u) = argmin(bp.items(), d)
-                del bp[v]
+                v = argmin(bp.keys(), lambda x: bp[x][1])
+                u, _ = bp.pop(v)
                 fixed.add(v)
                 edges.append((u, v))
-                for w in g.succs(v):
+                for w, d_vw in succs_w(v):
                     if w in fixed: continue
-                    if w not in bp or d(v, w) < d(bp[w], w):
-                        bp[w] = v
+                    if w not in bp or d_vw < bp[w][1]:
+                        bp[w] = v, d_vw
     return UndirectedGraph(E=edges)
 
 
 # Uses MinHeapMap[Vertex, tuple[Weight, Vertex]]
 def prim[T](g: UndirectedGraph[T],
             d: WeightingFunction[T]) -> UndirectedGraph[T]:
+    succs_w = weighted_succs(g, d)  # Sucesores con el peso de la arista
     edges: list[Edge[T]] = []
     fixed: set[T] = set()
     for u in g.V:
         if u not in fixed:
             fixed.add(u)
-            min_hm = MinHeapMap((v, (d(u, v), u)) for v in g.succs(u))
+            min_hm = MinHeapMap((v, (d_uv, u)) for v, d_uv in succs_w(u))
             while len(min_hm) > 0:
                 (v, (_, u)) = min_hm.extract_opt_item()
                 fixed.add(v)
                 edges.append((u, v))
-                for w in g.succs(v):
+                for w, d_vw in succs_w(v):
                     if w in fixed: continue
-                    if w not in min_hm or d(v, w) < d(min_hm[w][1], w):
-                        min_hm[w] = (d(v, w), v)
+                    if w not in min_hm or d_vw < min_hm[w][0]:  # min_hm[w][0] es el peso de la mejor arista a w
+                        min_hm[w] = (d_vw, v)
     return UndirectedGraph(E=edges)
 
 
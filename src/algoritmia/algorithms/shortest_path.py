@@ -1,17 +1,30 @@
+import math
+import weakref
+from collections import deque
 from collections.abc import Iterable, Callable
-
-from algoritmia.algorithms.traverse import traverse_bf, traverse_dijkstra_dict, traverse_dijkstra_metric_dict
-from algoritmia.datastructures.graphs import IGraph, Digraph, Edge, WeightingFunction
+from heapq import heappush, heappop
+from itertools import count
+from math import log2
+from typing import Optional
+
+from algoritmia.algorithms.distances import ShortestPathTree
+from algoritmia.algorithms.traverse import (traverse_bf, traverse_dijkstra_dict, traverse_dijkstra_heapmap,
+                                            traverse_dijkstra_heapq, traverse_dijkstra_dial, traverse_dijkstra_radix,
+                                            traverse_dijkstra_metric_dict, traverse_astar)
+from algoritmia.datastructures.graphs import (IGraph, Digraph, Edge, WeightingFunction, Weight, VertexIndex,
+                                              weighted_succs, weighted_preds)
 from algoritmia.utils import infinity
 
 # Cinco algoritmos para obtener el camino más corto entre dos vertices de un grafo:
 # - Tres basados en recorredores:
-#   - shortest_path_unweighted_graph(): Para grafos no ponderados
+#   - shortest_path_unweighted_graph(): Para grafos no ponderados (o shortest_path_bidirectional_bfs())
 #   - shortest_path_positive_weighted_graph(): Para grafos ponderados positivos (algoritmo de Dijkstra)
+#     (o shortest_path_bidirectional_dijkstra())
 #   - shortest_path_metric_graph(): Para grafos métricos (algoritmo de Dijkstra modificado)
 # - Dos que utilizan programación dinamica:
 #   - shortest_path_acyclic_digraph(): Para digrafos ponderados acíclicos
 #   - shortest_path_digraph()/bellman_ford(): Para digrafos ponderados sin ciclos negativos (algoritmo de Bellman-Ford)
+#     (también bellman_ford_tree() para todos los destinos y negative_cycle() para encontrar ciclos negativos)
 
 type Path[T] = list[T]  # T es el tipo de los vértices
 
@@ -22,31 +35,228 @@ type Path[T] = list[T]  # T es el tipo de los vértices
 
 
 # Devuelve el camino más corto entre dos vértices en grafos no ponderados
+# Con bidirectional=True utiliza shortest_path_bidirectional_bfs()
 # Coste temporal: O(|V| + |E|)
-def shortest_path_unweighted_graph[T](g: IGraph[T], v_source: T, v_target: T) -> Path[T]:
+def shortest_path_unweighted_graph[T](g: IGraph[T], v_source: T, v_target: T,
+                                      bidirectional: bool = False) -> Path[T]:
+    if bidirectional:
+        return shortest_path_bidirectional_bfs(g, v_source, v_target)
     edges = traverse_bf(g, v_source)
     return path_recover(edges, v_target)
 
 
+# Devuelve el camino más corto entre dos vértices en grafos no ponderados con una búsqueda en anchura
+# bidireccional: una desde el origen por los sucesores y otra desde el destino por los predecesores.
+# En cada paso se expande un nivel completo de la frontera más pequeña y se termina al encontrar
+# un vértice ya visto por la otra búsqueda (de entre los de ese nivel, el que da el camino más corto).
+# Suele visitar una parte muy pequeña de los vértices: si las dos búsquedas llegan a profundidad k/2,
+# con grado medio b se visitan unos 2 b^(k/2) vértices en lugar de b^k.
+# Si el destino no es alcanzable desde el origen lanza KeyError, como path_recover()
+# Coste temporal: O(|V| + |E|) en el peor caso
+def shortest_path_bidirectional_bfs[T](g: IGraph[T], v_source: T, v_target: T) -> Path[T]:
+    if v_source == v_target:
+        return [v_source]
+    bp_f: dict[T, T] = {v_source: v_source}  # Punteros hacia atrás de la búsqueda desde el origen
+    bp_b: dict[T, T] = {v_target: v_target}  # Punteros hacia delante de la búsqueda desde el destino
+    D_f: dict[T, int] = {v_source: 0}
+    D_b: dict[T, int] = {v_target: 0}
+    frontier_f: list[T] = [v_source]
+    frontier_b: list[T] = [v_target]
+    while len(frontier_f) > 0 and len(frontier_b) > 0:
+        forward = len(frontier_f) <= len(frontier_b)
+        if forward:
+            frontier, bp, D, bp_other, D_other, next_vertices = frontier_f, bp_f, D_f, bp_b, D_b, g.succs
+        else:
+            frontier, bp, D, bp_other, D_other, next_vertices = frontier_b, bp_b, D_b, bp_f, D_f, g.preds
+        best: Optional[tuple[int, T, T]] = None  # (longitud, vértice de esta búsqueda, vértice de la otra)
+        new_frontier: list[T] = []
+        for v in frontier:
+            for w in next_vertices(v):
+                if w in bp_other:
+                    length = D[v] + 1 + D_other[w]
+                    if best is None or length < best[0]:
+                        best = length, v, w
+                if w not in bp:
+                    bp[w] = v
+                    D[w] = D[v] + 1
+                    new_frontier.append(w)
+        if best is not None:
+            _, v, w = best
+            u_f, u_b = (v, w) if forward else (w, v)  # Arista (u_f, u_b) en la que se encuentran
+            path = [u_f]
+            while path[-1] != v_source:
+                path.append(bp_f[path[-1]])
+            path.reverse()
+            path.append(u_b)
+            while path[-1] != v_target:
+                path.append(bp_b[path[-1]])
+            return path
+        if forward:
+            frontier_f = new_frontier
+        else:
+            frontier_b = new_frontier
+    raise KeyError(v_target)
+
+
 # Devuelve el camino más corto entre dos vértices en grafos ponderados positivos (algoritmo de Dijkstra)
-# Coste temporal: O(|V|^2)
+# strategy elige el recorredor:
+#   - 'dict': traverse_dijkstra_dict(), O(|V|^2)
+#   - 'heapmap': traverse_dijkstra_heapmap(), O(|V| + |E| log |V|)
+#   - 'heapq': traverse_dijkstra_heapq(), O(|V| + |E| log |E|)
+#   - 'dial': traverse_dijkstra_dial(), O(|E| + D) (D: distancia máxima), solo pesos enteros no negativos
+#   - 'radix': traverse_dijkstra_radix(), O(|E| + |V| log C) (C: peso máximo), solo pesos enteros no negativos
+#   - 'auto': elige con dijkstra_strategy(g, d)
 def shortest_path_positive_weighted_graph[T](g: IGraph[T], d: WeightingFunction,
-                                             v_source: T, v_target: T) -> Path[T]:
-    edges = traverse_dijkstra_dict(g, d, v_source)  # Con diccionario: O(|V|^2)
-    # edges = traverse_dijkstra_heapmap(g, d, v_source)  # Con diccionario de prioridad: O(|V| + |E| log |V|)
+                                             v_source: T, v_target: T,
+                                             strategy: str = 'auto') -> Path[T]:
+    if strategy == 'auto':
+        strategy = dijkstra_strategy(g, d)
+    if strategy not in _dijkstra_traversers:
+        raise ValueError(f"shortest_path_positive_weighted_graph - Unknown strategy '{strategy}'")
+    edges = _dijkstra_traversers[strategy](g, d, v_source)
     return path_recover(edges, v_target)
 
 
+_dijkstra_traversers = {'dict': traverse_dijkstra_dict,
+                        'heapmap': traverse_dijkstra_heapmap,
+                        'heapq': traverse_dijkstra_heapq,
+                        'dial': traverse_dijkstra_dial,
+                        'radix': traverse_dijkstra_radix}
+
+
+# Grafo -> (versiones, referencia débil a los pesos, estrategia) de la última llamada a dijkstra_strategy()
+_strategy_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+# Estrategia de Dijkstra:
+#   - 'dial' si se da la función de pesos, guarda sus pesos (WeightingFunction, CSRWeightingFunction) y todos son
+#     enteros entre 0 y dial_max_weight
+#   - si no, según la densidad del grafo: 'dict' si |E| log |V| > |V|^2, 'heapq' si no
+# 'radix' no se elige nunca: en Python, heapq (escrito en C) es algo más rápido que RadixHeap
+# La decisión se guarda, para cada grafo, en _strategy_cache con las versiones de g y d (ver IGraph.version y
+# WeightingFunction.version): mientras no cambien, las siguientes llamadas no recorren el grafo ni los pesos.
+# La caché no mantiene vivos ni el grafo ni los pesos (referencias débiles) y no modifica ninguno de los dos.
+# No se guarda para los diccionarios sin versión, cuyos cambios no se pueden detectar.
+# Coste temporal: O(1) si la decisión está guardada; si no, O(|V|) más, si d guarda pesos enteros, O(|E|)
+# para comprobarlos
+def dijkstra_strategy[T](g: IGraph[T], d: Optional[WeightingFunction] = None, dial_max_weight: int = 64) -> str:
+    versions = getattr(g, 'version', None), getattr(d, 'version', None), dial_max_weight
+    if versions[0] is None or (isinstance(d, dict) and versions[1] is None):
+        return _dijkstra_strategy(g, d, dial_max_weight)
+    try:
+        d_ref = None if d is None else weakref.ref(d)
+        cached = _strategy_cache.get(g)
+    except TypeError:  # Sin referencias débiles (p.e. funciones integradas): no se guarda
+        return _dijkstra_strategy(g, d, dial_max_weight)
+    if cached is not None and cached[0] == versions and (None if cached[1] is None else cached[1]()) is d:
+        return cached[2]
+    strategy = _dijkstra_strategy(g, d, dial_max_weight)
+    _strategy_cache[g] = versions, d_ref, strategy
+    return strategy
+
+
+def _dijkstra_strategy[T](g: IGraph[T], d: Optional[WeightingFunction], dial_max_weight: int) -> str:
+    if d is not None and _small_int_weights(d, dial_max_weight):
+        return 'dial'
+    n = len(g.V)
+    m = sum(g.out_degree(v) for v in g.V)  # Aristas que se pueden relajar
+    return 'dict' if m * log2(max(n, 2)) > n * n else 'heapq'
+
+
+# Si todos los pesos guardados en d son enteros entre 0 y max_weight. Se detiene en el primero que no lo es
+def _small_int_weights(d, max_weight: int) -> bool:
+    if isinstance(d, dict):
+        weights = d.values()
+    elif hasattr(d, 'weight_arrays'):
+        weights = d.weight_arrays()[0]
+    else:
+        return False
+    return all(type(w) is int and 0 <= w <= max_weight for w in weights)
+
+
 # Devuelve el camino más corto entre dos vértices en grafos métricos (algoritmo de Dijkstra modificado)
-# Coste temporal: O(|V|^2)
-# En la práctica es O(|V|) para grafos densos y O(sqrt(|V|)) para grafos dispersos.
+# strategy elige el recorredor:
+#   - 'heapq': traverse_astar(), A* con montículo. Coste temporal: O((|V| + |E|) log |E|)
+#   - 'dict': traverse_dijkstra_metric_dict(). Coste temporal: O(|V|^2)
+#     En la práctica es O(|V|) para grafos densos y O(sqrt(|V|)) para grafos dispersos.
+# Si se da el diccionario stats, en stats['expanded'] se devuelve el número de vértices expandidos (solo 'heapq')
 def shortest_path_metric_graph[T](g: IGraph[T], d: WeightingFunction,
                                   dist: Callable[[T, T], float],
-                                  v_source: T, v_target: T) -> Path[T]:
-    edges = traverse_dijkstra_metric_dict(g, d, dist, v_source, v_target)
+                                  v_source: T, v_target: T,
+                                  strategy: str = 'heapq',
+                                  stats: Optional[dict[str, int]] = None) -> Path[T]:
+    if strategy == 'heapq':
+        edges = traverse_astar(g, d, dist, v_source, v_target, stats=stats)
+    elif strategy == 'dict':
+        edges = traverse_dijkstra_metric_dict(g, d, dist, v_source, v_target)
+    else:
+        raise ValueError(f"shortest_path_metric_graph - Unknown strategy '{strategy}'")
     return path_recover(edges, v_target)
 
 
+# Devuelve la distancia euclídea entre vértices a partir de un diccionario con sus coordenadas (de
+# cualquier dimensión). math.dist hace el cálculo en C. Para shortest_path_metric_graph()
+def euclidean_distance[T](coords: dict[T, tuple[float, ...]]) -> Callable[[T, T], float]:
+    return lambda u, v: math.dist(coords[u], coords[v])
+
+
+# Devuelve el coste y el camino más corto entre dos vértices en grafos ponderados positivos con el algoritmo
+# de Dijkstra bidireccional: una búsqueda desde el origen por los sucesores y otra desde el destino por los
+# predecesores. En cada paso avanza la búsqueda con el menor valor en su montículo. Al relajar una arista
+# que llega a un vértice alcanzado por la otra búsqueda se actualiza el mejor camino conocido, 'best'. Se
+# termina cuando la suma de los mínimos de los dos montículos es mayor o igual que 'best'.
+# Suele fijar la mitad de vértices que shortest_path_positive_weighted_graph().
+# Si el destino no es alcanzable devuelve (infinity, []), como shortest_path_acyclic_digraph()
+# Si se da el diccionario stats, en stats['settled'] se devuelve el número de vértices fijados
+# Coste temporal: O((|V| + |E|) log |E|)
+def shortest_path_bidirectional_dijkstra[T](g: IGraph[T], d: WeightingFunction,
+                                            v_source: T, v_target: T,
+                                            stats: Optional[dict[str, int]] = None) -> tuple[Weight, Path[T]]:
+    if stats is not None:
+        stats['settled'] = 0
+    if v_source == v_target:
+        return 0, [v_source]
+    tiebreak = count()
+    # Para cada sentido: función de vecinos con pesos, distancias, punteros, fijados y montículo
+    next_w = [weighted_succs(g, d), weighted_preds(g, d)]
+    D: list[dict[T, Weight]] = [{v_source: 0}, {v_target: 0}]
+    bp: list[dict[T, T]] = [{v_source: v_source}, {v_target: v_target}]
+    fixed: list[set[T]] = [set(), set()]
+    heaps: list[list[tuple[Weight, int, T]]] = [[(0, next(tiebreak), v_source)], [(0, next(tiebreak), v_target)]]
+    best: Weight = infinity
+    meeting: Optional[tuple[T, T]] = None  # Arista (u, v) en la que se unen los dos caminos
+    while len(heaps[0]) > 0 and len(heaps[1]) > 0:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dv, _, v = heappop(heaps[side])
+        if v in fixed[side]:  # Entrada obsoleta
+            continue
+        fixed[side].add(v)
+        if stats is not None:
+            stats['settled'] += 1
+        D_side, D_other = D[side], D[1 - side]
+        for w, weight in next_w[side](v):
+            if w not in fixed[side] and dv + weight < D_side.get(w, infinity):
+                D_side[w] = dv + weight
+                bp[side][w] = v
+                heappush(heaps[side], (dv + weight, next(tiebreak), w))
+            if w in D_other and dv + weight + D_other[w] < best:
+                best = dv + weight + D_other[w]
+                meeting = (v, w) if side == 0 else (w, v)
+    if meeting is None:
+        return infinity, []
+    u, v = meeting
+    path = [u]
+    while path[-1] != v_source:
+        path.append(bp[0][path[-1]])
+    path.reverse()
+    path.append(v)
+    while path[-1] != v_target:
+        path.append(bp[1][path[-1]])
+    return best, path
+
+
 # Dada la lista de aristas que devuelve un recorredor y un vértice final,
 # devuelve el camino desde el vértice inicial al final
 # Coste temporal: O(|V|), porque los recorredores devuelven una arista por vértice: len(edges) = |V|
@@ -79,7 +289,6 @@ type Score = int | float
 type ScoredSolution[T] = tuple[Score, Solution[T]]
 
 type SParams[T] = T  # Para sp_acyclic_digraph()
-type SParams2[T] = tuple[T, int]  # Para sp_digraph()/bellman_ford()
 
 
 # Devuelve el camino más corto entre dos vértices en dígrafos ponderados acíclicos
@@ -115,39 +324,140 @@ def shortest_path_acyclic_digraph[T](g: Digraph[T],
 
 
 # Devuelve el camino más corto entre dos vértices en digrafos ponderados sin ciclos negativos
-# Utiliza el algoritmo de Bellman-Ford (algoritmo de programación dinámica)
+# Utiliza el algoritmo de Bellman-Ford (ver _bellman_ford()). ValueError si hay un ciclo negativo alcanzable
 # Coste temporal: O(|V| |E|)
 def shortest_path_digraph[T](g: Digraph[T],
                              d: WeightingFunction[T],
                              v_initial: T,
                              v_final: T) -> ScoredSolution[T]:
-    def S(v: T, n: int) -> Score:
-        if v == v_initial:
-            return 0
-        if n == 0:
-            return infinity
-        if (v, n) not in mem:
-            res: list[tuple[Score, SParams2]] = []
-            for u in g.preds(v):
-                c_score: Score = S(u, n - 1) + d(u, v)
-                previous: SParams2 = u, n - 1
-                # La decision, u, se puede extraer del previous
-                res.append((c_score, previous))
-            mem[v, n] = min(res, default=infinity)
-        return mem[v, n][0]
+    tree = bellman_ford_tree(g, d, v_initial)
+    if v_final not in tree:
+        return infinity, []  # El vértice destino es inalcanzable desde el origen
+    return tree.distance_to(v_final), tree.path_to(v_final)
 
-    mem: dict[SParams2, tuple[Score, SParams2]] = {}
-    score: Score = S(v_final, len(g.V) - 1)
-    if score == infinity:
-        return score, []  # El vértice destino es inalcanzable desde el origen
-    v0 = v_final
-    n0 = len(g.V) - 1
-    sol: list[T] = [v0]
-    while v0 != v_initial:
-        _, (v0, n0) = mem[v0, n0]
-        sol.append(v0)
-    sol.reverse()
-    return score, sol
+
+# Árbol de caminos más cortos desde v_source con el algoritmo de Bellman-Ford (admite pesos negativos)
+# mode: 'rounds' (rondas de relajación) o 'spfa' (cola de vértices, ver _bellman_ford())
+# ValueError si hay un ciclo negativo alcanzable desde v_source (negative_cycle() lo devuelve)
+# Coste temporal: O(|V| |E|)
+def bellman_ford_tree[T](g: IGraph[T], d: WeightingFunction[T], v_source: T,
+                         mode: str = 'rounds') -> ShortestPathTree[T]:
+    if not g.contains_vertex(v_source):
+        raise KeyError(f"bellman_ford_tree - {v_source!r} is not a vertex of the graph")
+    index, dist, parent, cycle = _bellman_ford(g, d, [v_source], mode)
+    if cycle is not None:
+        raise ValueError(f"bellman_ford_tree - Negative cycle {index.labels(cycle)}")
+    return ShortestPathTree(v_source,
+                            dict((index.label(i), dist[i]) for i in range(len(dist)) if parent[i] != -1),
+                            dict((index.label(i), index.label(parent[i])) for i in range(len(dist)) if parent[i] != -1))
+
+
+# Un ciclo de peso negativo alcanzable desde v_source (desde cualquier vértice si v_source es None), o None si
+# no hay ninguno. Cada vértice de la lista va seguido de su sucesor en el ciclo; el último, del primero
+# Coste temporal: O(|V| |E|)
+def negative_cycle[T](g: IGraph[T], d: WeightingFunction[T], v_source: Optional[T] = None,
+                      mode: str = 'rounds') -> Optional[list[T]]:
+    if v_source is not None and not g.contains_vertex(v_source):
+        raise KeyError(f"negative_cycle - {v_source!r} is not a vertex of the graph")
+    sources = list(g.V) if v_source is None else [v_source]
+    index, _, _, cycle = _bellman_ford(g, d, sources, mode)
+    return None if cycle is None else index.labels(cycle)
+
+
+# Motor de relajación de Bellman-Ford, iterativo y sobre los enteros de los vértices (VertexIndex): además
+# del grafo, solo usa memoria O(|V|) (distancias, padres y la lista de vértices pendientes).
+# Todos los orígenes empiezan con distancia 0 y son su propio padre; -1 es el padre de los no alcanzados.
+# - mode='rounds': en cada ronda solo se relajan las aristas de los vértices cuya distancia cambió en la
+#   anterior, y termina en cuanto una ronda no cambia nada. Sin ciclos negativos bastan |V| - 1 rondas:
+#   si la ronda |V| aún cambia algo, hay un ciclo negativo.
+# - mode='spfa': cola FIFO de vértices cuya distancia ha cambiado (cada vértice está en ella como mucho una
+#   vez). Suele relajar muchas menos aristas, pero no tiene rondas: cada |V| relajaciones se buscan ciclos
+#   en el grafo de padres.
+# Todo ciclo del grafo de padres es un ciclo negativo y, si hay uno alcanzable, acaba apareciendo en él,
+# así que el ciclo se extrae de ahí (_parent_cycle()).
+# Devuelve el índice de los vértices, las distancias, los padres y el ciclo negativo (o None)
+def _bellman_ford[T](g: IGraph[T], d: WeightingFunction[T], sources: list[T],
+                     mode: str) -> tuple[VertexIndex[T], list[Weight], list[int], Optional[list[int]]]:
+    if mode not in ('rounds', 'spfa'):
+        raise ValueError(f"bellman_ford - Unknown mode '{mode}'")
+    succs_w = weighted_succs(g, d)
+    index = VertexIndex(g.V)
+    label = index.label
+    n = len(index)
+    dist: list[Weight] = [infinity] * n
+    parent = [-1] * n
+    changed: list[int] = []
+    for i in index.ids(sources):
+        if parent[i] == -1:
+            dist[i] = 0
+            parent[i] = i
+            changed.append(i)
+
+    if mode == 'rounds':
+        for _ in range(n):
+            if len(changed) == 0:
+                return index, dist, parent, None
+            in_next = bytearray(n)
+            next_changed: list[int] = []
+            for i in changed:
+                di = dist[i]
+                for v, w in succs_w(label(i)):
+                    j = index[v]
+                    if di + w < dist[j]:
+                        dist[j] = di + w
+                        parent[j] = i
+                        if not in_next[j]:
+                            in_next[j] = 1
+                            next_changed.append(j)
+            changed = next_changed
+        return index, dist, parent, (_parent_cycle(parent) if len(changed) > 0 else None)
+
+    queue = deque(changed)
+    in_queue = bytearray(n)
+    for i in changed:
+        in_queue[i] = 1
+    relaxations = 0
+    while len(queue) > 0:
+        i = queue.popleft()
+        in_queue[i] = 0
+        di = dist[i]
+        for v, w in succs_w(label(i)):
+            j = index[v]
+            if di + w < dist[j]:
+                dist[j] = di + w
+                parent[j] = i
+                relaxations += 1
+                if relaxations % n == 0:
+                    cycle = _parent_cycle(parent)
+                    if cycle is not None:
+                        return index, dist, parent, cycle
+                if not in_queue[j]:
+                    in_queue[j] = 1
+                    queue.append(j)
+    return index, dist, parent, None
+
+
+# Un ciclo del grafo de padres (en el sentido de las aristas del grafo), o None si no tiene. O(|V|)
+def _parent_cycle(parent: list[int]) -> Optional[list[int]]:
+    state = bytearray(len(parent))  # 0: sin visitar, 1: en el camino actual, 2: terminado
+    for start in range(len(parent)):
+        walk = []
+        i = start
+        while state[i] == 0 and parent[i] != -1 and parent[i] != i:
+            state[i] = 1
+            walk.append(i)
+            i = parent[i]
+        if state[i] == 1:  # El camino ha vuelto a uno de sus vértices: i está en un ciclo
+            cycle = [i]
+            j = parent[i]
+            while j != i:
+                cycle.append(j)
+                j = parent[j]
+            cycle.reverse()
+            return cycle
+        for j in walk:
+            state[j] = 2
+    return None
 
 
 bellman_ford = shortest_path_digraph  # Creamos un alias para la función
@@ -166,6 +476,7 @@ def example_shortest_path_unweighted_graph():
     v_initial0 = (0, 0)
     v_final0 = (1, 3)
     print('shortest_path_unweighted_graph:', shortest_path_unweighted_graph(g, v_initial0, v_final0))
+    print('shortest_path_bidirectional_bfs:', shortest_path_bidirectional_bfs(g, v_initial0, v_final0))
 
 
 def example_shortest_path_positive_weighted_graph():
@@ -173,6 +484,8 @@ def example_shortest_path_positive_weighted_graph():
 
     print('shortest_path_positive_weighted_graph:',
           shortest_path_positive_weighted_graph(iberia, km, 'Madrid', 'Bilbao'))
+    print('shortest_path_bidirectional_dijkstra:',
+          shortest_path_bidirectional_dijkstra(iberia, km, 'Madrid', 'Bilbao'))
 
 
 def example_shortest_path_metric_graph():
@@ -184,6 +497,9 @@ def example_shortest_path_metric_graph():
         return (dx * dx + dy * dy) ** 0.5
 
     print('shortest_path_metric_graph:', shortest_path_metric_graph(iberia, km, eu_dist0, 'Madrid', 'Bilbao'))
+    stats = {}
+    shortest_path_metric_graph(iberia, km, euclidean_distance(coords2d), 'Madrid', 'Bilbao', stats=stats)
+    print('  expanded vertices:', stats['expanded'], 'of', len(iberia.V))
 
 
 def example_shortest_path_acyclic_digraph():
@@ -199,6 +515,9 @@ def example_shortest_path_digraph():
     g = Digraph(E=data.keys())
     wf = WeightingFunction(data)
     print('shortest_path_digraph:', shortest_path_digraph(g, wf, 3, 2))
+    print('bellman_ford_tree:', bellman_ford_tree(g, wf, 3, 'spfa').dist)
+    wf[1, 2] = -1
+    print('negative_cycle:', negative_cycle(g, wf))
 
 
 # ----------------------------------------------------------------
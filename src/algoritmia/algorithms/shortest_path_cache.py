@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Optional
+
+from algoritmia.algorithms.distances import ShortestPathTree, dijkstra_tree
+from algoritmia.algorithms.shortest_path import shortest_path_metric_graph, Path
+from algoritmia.datastructures.graphs import IGraph, WeightingFunction, Weight
+from algoritmia.utils import infinity
+
+# ShortestPathCache: caché de consultas de camino más corto sobre un grafo ponderado positivo, para servicios
+# que repiten muchas veces las mismas consultas (origen, destino).
+# - path(s, t) y distance(s, t) guardan el coste y el camino de cada par consultado; una consulta repetida
+#   es un acceso a un diccionario.
+# - tree(s) guarda el árbol de caminos más cortos desde s (ver dijkstra_tree()). Las consultas de un par
+#   que no está en la caché usan el árbol de su origen, calculándolo si hace falta, así que los siguientes
+#   destinos de ese origen no necesitan otra búsqueda.
+#   Con 'dist' (cota inferior de la distancia, como en shortest_path_metric_graph()) las consultas de pares
+#   que no tienen el árbol de su origen en la caché usan A* en lugar de calcular el árbol completo.
+# - Las dos cachés son LRU: guardan como mucho 'maxsize' pares y 'maxtrees' árboles y, cuando se llenan,
+#   descartan los usados hace más tiempo.
+# - hits y misses cuentan las consultas respondidas con la caché de pares y las que no.
+# - La caché se vacía sola cuando cambia la versión del grafo o de la función de pesos (ver IGraph.version
+#   y WeightingFunction.version). Las funciones de pesos sin versión (funciones de Python, por ejemplo)
+#   no se vigilan: si cambian, llama a clear().
+
+
+class ShortestPathCache[T]:
+    # O(1)
+    def __init__(self, g: IGraph[T], d: WeightingFunction[T], dist: Optional[Callable[[T, T], Weight]] = None,
+                 maxsize: int = 1024, maxtrees: int = 16):
+        if maxsize < 0 or maxtrees < 0:
+            raise ValueError(f"{self.__class__.__name__} - maxsize and maxtrees must be non negative")
+        self.g = g
+        self.d = d
+        self.dist = dist
+        self.maxsize = maxsize
+        self.maxtrees = maxtrees
+        self.hits = 0
+        self.misses = 0
+        self._pairs: OrderedDict[tuple[T, T], tuple[Weight, Optional[Path[T]]]] = OrderedDict()
+        self._trees: OrderedDict[T, ShortestPathTree[T]] = OrderedDict()
+        self._versions = self._current_versions()
+
+    def _current_versions(self) -> tuple[Optional[int], Optional[int]]:
+        return getattr(self.g, 'version', None), getattr(self.d, 'version', None)
+
+    # O(1): vacía la caché si el grafo o los pesos han cambiado
+    def _check_versions(self):
+        versions = self._current_versions()
+        if versions != self._versions:
+            self._pairs.clear()
+            self._trees.clear()
+            self._versions = versions
+
+    # O(1): vacía la caché (los contadores no cambian)
+    def clear(self):
+        self._pairs.clear()
+        self._trees.clear()
+
+    # O(1) si el árbol de s está en la caché, O((|V| + |E|) log |E|) si no
+    def tree(self, s: T) -> ShortestPathTree[T]:
+        self._check_versions()
+        return self._tree(s)
+
+    def _tree(self, s: T) -> ShortestPathTree[T]:
+        tree = self._trees.get(s)
+        if tree is not None:
+            self._trees.move_to_end(s)
+            return tree
+        if not self.g.contains_vertex(s):
+            raise KeyError(f"{self.__class__.__name__} - {s!r} is not a vertex of the graph")
+        tree = dijkstra_tree(self.g, self.d, s)
+        if self.maxtrees > 0:
+            self._trees[s] = tree
+            if len(self._trees) > self.maxtrees:
+                self._trees.popitem(last=False)
+        return tree
+
+    # O(1) si el par está en la caché. Devuelve (coste, camino); el camino es None si t no es alcanzable
+    def _query(self, s: T, t: T) -> tuple[Weight, Optional[Path[T]]]:
+        self._check_versions()
+        key = s, t
+        entry = self._pairs.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._pairs.move_to_end(key)
+            return entry
+        self.misses += 1
+        if not self.g.contains_vertex(t):
+            raise KeyError(f"{self.__class__.__name__} - {t!r} is not a vertex of the graph")
+        if self.dist is not None and s not in self._trees:
+            if not self.g.contains_vertex(s):
+                raise KeyError(f"{self.__class__.__name__} - {s!r} is not a vertex of the graph")
+            try:
+                path = shortest_path_metric_graph(self.g, self.d, self.dist, s, t)
+                entry = sum(self.d(u, v) for u, v in zip(path, path[1:])), path
+            except KeyError:  # t no es alcanzable
+                entry = infinity, None
+        else:
+            tree = self._tree(s)
+            entry = (tree.distance_to(t), tree.path_to(t)) if t in tree else (infinity, None)
+        if self.maxsize > 0:
+            self._pairs[key] = entry
+            if len(self._pairs) > self.maxsize:
+                self._pairs.popitem(last=False)
+        return entry
+
+    # Camino más corto de s a t (KeyError si t no es alcanzable, como shortest_path_positive_weighted_graph())
+    # Devuelve una lista nueva en cada llamada: modificarla no altera la caché
+    def path(self, s: T, t: T) -> Path[T]:
+        path = self._query(s, t)[1]
+        if path is None:
+            raise KeyError(f"{self.__class__.__name__} - {t!r} is not reachable from {s!r}")
+        return list(path)
+
+    # Coste del camino más corto de s a t (infinity si t no es alcanzable)
+    def distance(self, s: T, t: T) -> Weight:
+        return self._query(s, t)[0]
+
+    # O(1)
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(pairs={len(self._pairs)}/{self.maxsize}, "
+                f"trees={len(self._trees)}/{self.maxtrees}, hits={self.hits}, misses={self.misses})")
+
+
+if __name__ == '__main__':
+    from algoritmia.data.iberia import iberia, km
+
+    cache = ShortestPathCache(iberia, km)
+    for _ in range(3):
+        for city in 'Bilbao', 'Sevilla', 'Barcelona':
+            cache.path('Madrid', city)
+    print(cache, cache.distance('Madrid', 'Bilbao'))
+    km['Madrid', 'Venturada'] = km['Madrid', 'Venturada'] + 100  # Los pesos cambian: la caché se vacía
+    print(cache.path('Madrid', 'Bilbao'), cache)
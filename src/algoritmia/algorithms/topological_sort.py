@@ -3,23 +3,31 @@ from algoritmia.datastructures.graphs import Digraph
 
 # Ordenación topológica de un digrafo acíclico
 # Si el grafo tiene algún ciclo, el algoritmo lanza una excepción
+# Recorrido en profundidad (postorden) con una pila explícita, sin recursión: O(|V| + |E|)
 def topological_sort[T](g: Digraph[T]) -> list[T]:
-    def traverse_from(v: T, used: set[T]):
-        seen.add(v)
-        for suc_v in g.succs(v):
-            if suc_v in used:  # Cycle detection
-                raise Exception("The graph has at least one cycle")
-            used.add(suc_v)  # Cycle detection
-            if suc_v not in seen:
-                traverse_from(suc_v, used)
-            used.remove(suc_v)  # Cycle detection
-        lv.append(v)
-
     lv = []
     seen = set()
     for v in g.V:
         if len(g.preds(v)) == 0:
-            traverse_from(v, set())
+            seen.add(v)
+            used = {v}  # Cycle detection: vértices del camino actual
+            stack = [(v, iter(g.succs(v)))]
+            while len(stack) > 0:
+                u, succs_u = stack[-1]
+                for suc_u in succs_u:
+                    if suc_u in used:  # Cycle detection
+                        raise Exception("The graph has at least one cycle")
+                    if suc_u not in seen:
+                        seen.add(suc_u)
+                        used.add(suc_u)
+                        stack.append((suc_u, iter(g.succs(suc_u))))
+                        break
+                else:
+                    stack.pop()
+                    used.remove(u)
+                    lv.append(u)
+    if len(lv) < len(g.V):  # Hay vértices en ciclos que no se alcanzan desde ningún vértice sin predecesores
+        raise Exception("The graph has at least one cycle")
     lv.reverse()
     return lv
 
@@ -1,7 +1,11 @@
 from collections.abc import Iterator, Callable
+from heapq import heappush, heappop
+from itertools import count
+from typing import Optional
 
-from algoritmia.datastructures.graphs import IGraph, Edge, WeightingFunction, Weight
+from algoritmia.datastructures.graphs import IGraph, Edge, WeightingFunction, Weight, weighted_succs, weighted_preds
 from algoritmia.datastructures.prioritymaps import MinHeapMap
+from algoritmia.datastructures.priorityqueues import RadixHeap
 from algoritmia.datastructures.queues import Fifo
 from algoritmia.utils import argmin, infinity
 
@@ -10,6 +14,9 @@ type Traverse[T] = Callable[[IGraph[T], T], Iterator[Edge[T]]]
 
 def traverse_bf[T](graph: IGraph[T],
                    v_initial: T) -> Iterator[Edge[T]]:
+    if hasattr(graph, 'succ_ids'):  # Vértices indexados por enteros (p.e. CSRGraph)
+        yield from _traverse_bf_ids(graph, v_initial)
+        return
     queue: Fifo[Edge[T]] = Fifo()  # Cola de aristas
     seen: set[T] = set()  # Conjunto de vértices vistos
     queue.push((v_initial, v_initial))  # Añadimos la arista fantasma inicial
@@ -23,29 +30,57 @@ def traverse_bf[T](graph: IGraph[T],
                 seen.add(suc)
 
 
+# Recorrido en anchura sobre los enteros de los vértices: 'seen' es un bytearray
+def _traverse_bf_ids[T](graph: IGraph[T],
+                        v_initial: T) -> Iterator[Edge[T]]:
+    index = graph.vertex_index
+    label = index.label
+    queue: Fifo[tuple[int, int]] = Fifo()
+    seen = bytearray(len(index))
+    i_initial = index[v_initial]
+    queue.push((i_initial, i_initial))
+    seen[i_initial] = 1
+    while len(queue) > 0:
+        i, j = queue.pop()
+        yield label(i), label(j)
+        for k in graph.succ_ids(j):
+            if not seen[k]:
+                queue.push((j, k))
+                seen[k] = 1
+
+
+# Recorrido en profundidad con una pila explícita (sin recursión): no hay límite de profundidad y cada
+# arista se genera en O(1). Produce las mismas aristas, en el mismo orden, que la versión recursiva:
+# cada elemento de la pila es la arista por la que se llegó a un vértice y el iterador de sus sucesores
+# pendientes, es decir, lo que guardaría la llamada recursiva de ese vértice.
 def traverse_df[T](graph: IGraph[T],
                    v_initial: T,
                    preorder: bool = True) -> Iterator[Edge[T]]:
-    def traverse_from(u: T, v: T) -> Iterator[Edge[T]]:
-        seen.add(v)
-        if preorder:
-            yield u, v  # Generamos una arista (recorrido en preorden)
-        for suc_v in graph.succs(v):
+    seen: set[T] = {v_initial}
+    if preorder:
+        yield v_initial, v_initial  # Arista fantasma inicial (recorrido en preorden)
+    stack: list[tuple[T, T, Iterator[T]]] = [(v_initial, v_initial, iter(graph.succs(v_initial)))]
+    while len(stack) > 0:
+        u, v, succs_v = stack[-1]
+        for suc_v in succs_v:
             if suc_v not in seen:
-                yield from traverse_from(v, suc_v)
-        if not preorder:
-            yield u, v  # Generamos una arista (recorrido en postorden)
-
-    seen: set[T] = set()
-    return traverse_from(v_initial, v_initial)  # Arista fantasma inicial
+                seen.add(suc_v)
+                if preorder:
+                    yield v, suc_v  # Generamos una arista (recorrido en preorden)
+                stack.append((v, suc_v, iter(graph.succs(suc_v))))
+                break
+        else:  # Sin sucesores pendientes: 'volvemos' de v
+            stack.pop()
+            if not preorder:
+                yield u, v  # Generamos una arista (recorrido en postorden)
 
 
 # Con diccionario: O(|V|^2)
 def traverse_dijkstra_dict[T](g: IGraph[T],
                               d: WeightingFunction[T],
                               v_initial: T) -> Iterator[Edge[T]]:
-    D: dict[T, Weight] = dict((v, infinity) for v in g.V)
-    D[v_initial] = 0
+    succs_w = weighted_succs(g, d)  # Sucesores con el peso de la arista
+    D: dict[T, Weight] = {v_initial: 0}  # Los vértices aún no alcanzados no están (distancia infinita)
     bp: dict[T, T] = {v_initial: v_initial}
     fixed: set[T] = set()
     while len(bp) > 0:  # O(|V|) veces
@@ -54,9 +89,9 @@ def traverse_dijkstra_dict[T](g: IGraph[T],
         pred_v = bp[v]
         yield pred_v, v
         del bp[v]
-        for suc_v in g.succs(v):  # O(|V|)
-            if suc_v not in fixed and D[v] + d(v, suc_v) < D[suc_v]:
-                D[suc_v] = D[v] + d(v, suc_v)
+        for suc_v, w in succs_w(v):  # O(|V|)
+            if suc_v not in fixed and D[v] + w < D.get(suc_v, infinity):
+                D[suc_v] = D[v] + w
                 bp[suc_v] = v
 
 
@@ -64,8 +99,9 @@ def traverse_dijkstra_dict[T](g: IGraph[T],
 def traverse_dijkstra_heapmap[T](g: IGraph[T],
                                  d: WeightingFunction[T],
                                  v_initial: T) -> Iterator[Edge[T]]:
-    D: MinHeapMap[T, Weight] = MinHeapMap((v, infinity) for v in g.V)  # O(|V|)
-    D[v_initial] = 0
+    succs_w = weighted_succs(g, d)  # Sucesores con el peso de la arista
+    # Solo contiene los vértices alcanzados y no fijados: los no alcanzables nunca entran
+    D: MinHeapMap[T, Weight] = MinHeapMap({v_initial: 0})
     bp: dict[T, T] = {v_initial: v_initial}
     fixed: set[T] = set()
     while len(D) > 0:
@@ -73,12 +109,108 @@ def traverse_dijkstra_heapmap[T](g: IGraph[T],
         fixed.add(v)
         pred_v = bp[v]
         yield pred_v, v
-        for suc_v in g.succs(v):
-            if suc_v not in fixed and dv + d(v, suc_v) < D[suc_v]:
-                D[suc_v] = dv + d(v, suc_v)  # O(log |V|), O(|E|) veces
+        for suc_v, w in succs_w(v):
+            if suc_v not in fixed and (suc_v not in D or dv + w < D[suc_v]):
+                D[suc_v] = dv + w  # O(log |V|), O(|E|) veces
                 bp[suc_v] = v
 
 
+# Con montículo (heapq) y borrado perezoso: O(|V| + |E| log |E|)
+# En lugar de actualizar la distancia de un vértice en el montículo, se inserta de nuevo y, al extraerlo,
+# se descartan las entradas de los vértices ya fijados. El contador desempata sin comparar vértices.
+# Genera tuplas (u, v, D[v]): la arista con la que se fija v y la distancia de v al vértice inicial
+# Con reverse=True recorre las aristas al revés (por los predecesores): D[v] es la distancia de v al
+# vértice inicial y u es el siguiente vértice en el camino de v hacia él
+def traverse_dijkstra_distances[T](g: IGraph[T],
+                                   d: WeightingFunction[T],
+                                   v_initial: T,
+                                   reverse: bool = False) -> Iterator[tuple[T, T, Weight]]:
+    succs_w = weighted_preds(g, d) if reverse else weighted_succs(g, d)  # Vecinos con el peso de la arista
+    D: dict[T, Weight] = {v_initial: 0}  # Mejor distancia conocida de cada vértice alcanzado
+    fixed: set[T] = set()
+    tiebreak = count()
+    heap: list[tuple[Weight, int, T, T]] = [(0, next(tiebreak), v_initial, v_initial)]
+    while len(heap) > 0:
+        dv, _, v, pred_v = heappop(heap)  # O(log |E|), O(|E|) veces
+        if v in fixed:  # Entrada obsoleta
+            continue
+        fixed.add(v)
+        yield pred_v, v, dv
+        for suc_v, w in succs_w(v):
+            if suc_v not in fixed and dv + w < D.get(suc_v, infinity):
+                D[suc_v] = dv + w
+                heappush(heap, (dv + w, next(tiebreak), suc_v, v))  # O(log |E|)
+
+
+# Con montículo (heapq) y borrado perezoso: O(|V| + |E| log |E|)
+def traverse_dijkstra_heapq[T](g: IGraph[T],
+                               d: WeightingFunction[T],
+                               v_initial: T) -> Iterator[Edge[T]]:
+    for u, v, _ in traverse_dijkstra_distances(g, d, v_initial):
+        yield u, v
+
+
+# Con cubetas (algoritmo de Dial): O(|E| + D), donde D es la distancia del vértice alcanzable más lejano
+# Solo para pesos enteros no negativos (ValueError si encuentra uno negativo). La cubeta i tiene los vértices
+# alcanzados con distancia i y se recorren en orden, sin comparar distancias. Con pesos enteros pequeños (como
+# mucho C), D <= (|V| - 1) C y el coste es casi lineal. Cada cubeta se libera tras recorrerla.
+def traverse_dijkstra_dial[T](g: IGraph[T],
+                              d: WeightingFunction[T],
+                              v_initial: T) -> Iterator[Edge[T]]:
+    succs_w = weighted_succs(g, d)  # Sucesores con el peso de la arista
+    D: dict[T, int] = {v_initial: 0}
+    fixed: set[T] = set()
+    buckets: list[Optional[list[Edge[T]]]] = [[(v_initial, v_initial)]]  # Aristas (pred_v, v)
+    pending = 1  # Aristas en las cubetas
+    dv = 0
+    while pending > 0:
+        bucket = buckets[dv]
+        i = 0
+        while i < len(bucket):  # Con pesos 0 la cubeta crece mientras se recorre
+            pred_v, v = bucket[i]
+            i += 1
+            pending -= 1
+            if v in fixed:  # Entrada obsoleta
+                continue
+            fixed.add(v)
+            yield pred_v, v
+            for suc_v, w in succs_w(v):
+                if w < 0:
+                    raise ValueError(f"traverse_dijkstra_dial - Negative weight {w} in edge {(v, suc_v)}")
+                d_suc = dv + w
+                if d_suc < D.get(suc_v, infinity) and suc_v not in fixed:
+                    D[suc_v] = d_suc
+                    if d_suc >= len(buckets):
+                        buckets.extend([] for _ in range(d_suc + 1 - len(buckets)))
+                    buckets[d_suc].append((v, suc_v))
+                    pending += 1
+        buckets[dv] = None
+        dv += 1
+
+
+# Con montículo radix (RadixHeap) y borrado perezoso: O(|E| + |V| log C), donde C es el peso máximo
+# Solo para pesos enteros no negativos: las distancias extraídas de un Dijkstra no decrecen, que es lo que
+# necesita RadixHeap. A diferencia de traverse_dijkstra_dial(), no depende de lo grandes que sean las distancias.
+def traverse_dijkstra_radix[T](g: IGraph[T],
+                               d: WeightingFunction[T],
+                               v_initial: T) -> Iterator[Edge[T]]:
+    succs_w = weighted_succs(g, d)  # Sucesores con el peso de la arista
+    D: dict[T, int] = {v_initial: 0}
+    fixed: set[T] = set()
+    heap: RadixHeap[tuple[int, T, T]] = RadixHeap([(0, v_initial, v_initial)], key=lambda item: item[0])
+    while len(heap) > 0:
+        dv, v, pred_v = heap.extract_opt()  # O(log C) amortizado
+        if v in fixed:  # Entrada obsoleta
+            continue
+        fixed.add(v)
+        yield pred_v, v
+        for suc_v, w in succs_w(v):
+            d_suc = dv + w
+            if d_suc < D.get(suc_v, infinity) and suc_v not in fixed:
+                D[suc_v] = d_suc
+                heap.add((d_suc, suc_v, v))  # O(1); ValueError si w < 0
+
+
 # Con diccionario: O(|V|^2)
 # En la práctica el coste es O(|V|) para grafos densos y O(sqrt(|V|) para grafos dispersos.
 def traverse_dijkstra_metric_dict[T](g: IGraph[T],
@@ -86,6 +218,7 @@ def traverse_dijkstra_metric_dict[T](g: IGraph[T],
                                      eu_dist: Callable[[T, T], float],  # Function: Euclidean distance
                                      v_initial: T,
                                      v_final: T) -> Iterator[Edge[T]]:
+    succs_w = weighted_succs(g, wf)  # Sucesores con el peso de la arista
     D: dict[T, Weight] = dict((v, infinity) for v in g.V)
     D[v_initial] = 0
     bp: dict[T, T] = {v_initial: v_initial}
@@ -98,12 +231,58 @@ def traverse_dijkstra_metric_dict[T](g: IGraph[T],
         if v == v_final:
             break
         del bp[v]
-        for suc_v in g.succs(v):
-            if suc_v not in fixed and D[v] + wf(v, suc_v) < D[suc_v]:
-                D[suc_v] = D[v] + wf(v, suc_v)
+        for suc_v, w in succs_w(v):
+            if suc_v not in fixed and D[v] + w < D[suc_v]:
+                D[suc_v] = D[v] + w
                 bp[suc_v] = v
 
 
+# A*: Dijkstra con montículo (heapq) ordenado por D[v] + eu_dist(v, v_final) y borrado perezoso.
+# Termina al fijar v_final. Con una cota inferior consistente (p.e. la distancia euclídea en un grafo
+# métrico) fija los mismos vértices que traverse_dijkstra_metric_dict() (salvo empates), pero sin
+# recalcular la cota de todos los vértices abiertos en cada paso: O((|V| + |E|) log |E|) en el peor caso.
+# - cache: guarda la cota de cada vértice, de modo que eu_dist se evalúa una sola vez por vértice
+# - stats: si se da un diccionario, en stats['expanded'] se lleva la cuenta de vértices expandidos (fijados)
+def traverse_astar[T](g: IGraph[T],
+                      wf: WeightingFunction[T],
+                      eu_dist: Callable[[T, T], float],  # Function: Euclidean distance
+                      v_initial: T,
+                      v_final: T,
+                      cache: bool = True,
+                      stats: Optional[dict[str, int]] = None) -> Iterator[Edge[T]]:
+    succs_w = weighted_succs(g, wf)  # Sucesores con el peso de la arista
+    H: dict[T, float] = {}
+
+    def h(v: T) -> float:
+        if not cache:
+            return eu_dist(v, v_final)
+        if v not in H:
+            H[v] = eu_dist(v, v_final)
+        return H[v]
+
+    if stats is not None:
+        stats['expanded'] = 0
+    D: dict[T, Weight] = {v_initial: 0}
+    fixed: set[T] = set()
+    tiebreak = count()
+    heap: list[tuple[float, int, T, T]] = [(h(v_initial), next(tiebreak), v_initial, v_initial)]
+    while len(heap) > 0:
+        _, _, v, pred_v = heappop(heap)
+        if v in fixed:  # Entrada obsoleta
+            continue
+        fixed.add(v)
+        if stats is not None:
+            stats['expanded'] += 1
+        yield pred_v, v
+        if v == v_final:
+            break
+        dv = D[v]
+        for suc_v, w in succs_w(v):
+            if suc_v not in fixed and dv + w < D.get(suc_v, infinity):
+                D[suc_v] = dv + w
+                heappush(heap, (dv + w + h(suc_v), next(tiebreak), suc_v, v))
+
+
 if __name__ == '__main__':
     from algoritmia.datastructures.graphs import UndirectedGraph
 
@@ -0,0 +1,364 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, KeysView, Sequence
+from typing import Optional, Self
+
+from algoritmia.datastructures.graphs import IGraph, Edge, VertexIndex, WeightingFunction, Weight
+
+# CSRGraph: grafo inmutable almacenado en formato CSR (compressed sparse row).
+# - Los vértices se numeran de 0 a |V|-1 (en orden de aparición) con un VertexIndex.
+# - Los sucesores del vértice i son los vértices _s_tgt[_s_off[i]:_s_off[i + 1]], ordenados.
+# - En un digrafo los predecesores se guardan igual en _p_off y _p_tgt. En un grafo no dirigido
+#   cada arista aparece en la fila de sus dos vértices y los predecesores son los sucesores.
+# - Como en IGraph, se descartan las auto aristas (v, v) y las aristas repetidas (sin avisar).
+# Ofrece la misma interfaz de lectura que IGraph, por lo que los recorredores y los algoritmos
+# de caminos y de árboles de recubrimiento funcionan sobre él sin cambios.
+# Además ofrece una interfaz por enteros (vertex_index, succ_ids, pred_ids) para los algoritmos
+# que trabajan con listas y arrays indexados por vértice.
+# Los arrays pueden ser array.array o memoryview (p.e. sobre un fichero proyectado en memoria).
+# source: el fichero del que lo cargó load_graph() (ver FileSource), o None.
+#
+# CSRWeightingFunction: función de pesos de un CSRGraph. Guarda los pesos en arrays alineados
+# con los sucesores (y los predecesores) de cada vértice. Como en CSRGraph, source es el fichero
+# del que se cargaron, o None.
+
+# Fichero del que se cargó un grafo: ruta absoluta, tamaño y fecha de modificación (st_mtime_ns).
+# El tamaño y la fecha permiten comprobar que el fichero no ha cambiado desde que se cargó.
+type FileSource = tuple[str, int, int]
+
+
+# Tipo de los elementos de los arrays de vértices: 4 bytes si es posible, 8 si no
+def _typecode(n: int) -> str:
+    return 'i' if n < 2 ** 31 else 'q'
+
+
+# Construye los arrays CSR (offsets, targets) a partir de dos arrays paralelos de origen y destino
+# (y, si se dan, los pesos alineados con targets). Se descartan las auto aristas.
+# Cada fila queda ordenada y sin repetidos (de una arista repetida se queda el último peso)
+# O(|V| + |E| log |E|)
+def _build_csr(n: int, src: Sequence[int], dst: Sequence[int],
+               w: Optional[array] = None) -> tuple[array, array, Optional[array]]:
+    count = [0] * (n + 1)
+    for u, v in zip(src, dst):
+        if u != v:
+            count[u + 1] += 1
+    for i in range(n):
+        count[i + 1] += count[i]
+    pos = count[:-1]
+    tgt = array(_typecode(n), bytes(array(_typecode(n)).itemsize * count[n]))
+    wt = None if w is None else array(w.typecode, bytes(w.itemsize * count[n]))
+    for k, (u, v) in enumerate(zip(src, dst)):
+        if u != v:
+            tgt[pos[u]] = v
+            if w is not None:
+                wt[pos[u]] = w[k]
+            pos[u] += 1
+
+    off = array('q', [0])
+    targets = array(_typecode(n))
+    weights = None if w is None else array(w.typecode)
+    for i in range(n):
+        if w is None:
+            targets.extend(sorted(set(tgt[count[i]:count[i + 1]])))
+        else:
+            row = dict(zip(tgt[count[i]:count[i + 1]], wt[count[i]:count[i + 1]]))
+            for j in sorted(row):
+                targets.append(j)
+                weights.append(row[j])
+        off.append(len(targets))
+    return off, targets, weights
+
+
+# Une, fila a fila, los arrays CSR de las aristas en un sentido (f_*) y en el otro (b_*) de un grafo no dirigido.
+# Una arista presente en los dos sentidos debe tener el mismo peso (ValueError si no), como en WeightingFunction
+# O(|V| + |E|)
+def _merge_symmetric[T](vertex_index: VertexIndex[T],
+                        f_off: array, f_tgt: array, f_w: array,
+                        b_off: array, b_tgt: array, b_w: array) -> tuple[array, array, array]:
+    off = array('q', [0])
+    targets = array(f_tgt.typecode)
+    weights = array(f_w.typecode)
+    for i in range(len(vertex_index)):
+        a, a_end = f_off[i], f_off[i + 1]
+        b, b_end = b_off[i], b_off[i + 1]
+        while a < a_end or b < b_end:
+            if b == b_end or (a < a_end and f_tgt[a] < b_tgt[b]):
+                targets.append(f_tgt[a])
+                weights.append(f_w[a])
+                a += 1
+            elif a == a_end or b_tgt[b] < f_tgt[a]:
+                targets.append(b_tgt[b])
+                weights.append(b_w[b])
+                b += 1
+            else:
+                if f_w[a] != b_w[b]:
+                    u, v = vertex_index.label(i), vertex_index.label(f_tgt[a])
+                    raise ValueError(f"build_csr - Weights are symmetrical but {(u, v)} and {(v, u)} "
+                                     f"have different weights: {f_w[a]} != {b_w[b]}")
+                targets.append(f_tgt[a])
+                weights.append(f_w[a])
+                a += 1
+                b += 1
+        off.append(len(targets))
+    return off, targets, weights
+
+
+# Crea un CSRGraph (y su función de pesos, si se dan los pesos) a partir de arrays paralelos con los
+# enteros (según vertex_index) del origen y del destino de cada arista, y sus pesos
+# Se descartan las auto aristas y las aristas repetidas (de una arista repetida en el mismo sentido se queda el
+# último peso). En los grafos no dirigidos, (u, v) y (v, u) con pesos distintos lanzan ValueError.
+# O(|V| + |E| log |E|)
+def build_csr[T](vertex_index: VertexIndex[T], src: Sequence[int], dst: Sequence[int],
+                 weights: Optional[array] = None,
+                 directed: bool = False) -> tuple["CSRGraph[T]", Optional["CSRWeightingFunction[T]"]]:
+    n = len(vertex_index)
+    if directed:
+        s_off, s_tgt, s_w = _build_csr(n, src, dst, weights)
+        p_off, p_tgt, p_w = _build_csr(n, dst, src, weights)
+    elif weights is None:
+        s_off, s_tgt, s_w = _build_csr(n, src + dst, dst + src)
+        p_off, p_tgt, p_w = s_off, s_tgt, s_w
+    else:  # Cada sentido por separado, para comparar los pesos de (u, v) y (v, u)
+        s_off, s_tgt, s_w = _merge_symmetric(vertex_index, *_build_csr(n, src, dst, weights),
+                                             *_build_csr(n, dst, src, weights))
+        p_off, p_tgt, p_w = s_off, s_tgt, s_w
+    g = CSRGraph.from_csr(vertex_index, s_off, s_tgt, p_off, p_tgt, directed=directed)
+    return g, None if weights is None else CSRWeightingFunction(g, s_w, p_w)
+
+
+class CSRGraph[T](IGraph[T]):
+    source: Optional[FileSource] = None
+
+    # O(|V| + |E| log |E|)
+    def __init__(self, V: Optional[Iterable[T]] = None, E: Iterable[Edge[T]] = (), directed: bool = False):
+        self._directed = directed
+        self._build(V, E, 'count')
+
+    # Construcción masiva como IGraph.from_edges(), pero a través de los arrays CSR: O(|V| + |E| log |E|)
+    # Las aristas repetidas se detectan al ordenar las filas, así que con validate='strict' el error no
+    # indica cuál es. Con 'none' se descartan igualmente.
+    @classmethod
+    def from_edges(cls, E: Iterable[Edge[T]], V: Optional[Iterable[T]] = None,
+                   validate: str = 'count', directed: bool = False) -> tuple[Self, dict[str, int]]:
+        if validate not in ('strict', 'count', 'none'):
+            raise ValueError(f"{cls.__name__} - Unknown validate mode '{validate}'")
+        g = cls.__new__(cls)
+        g._directed = directed
+        counts = g._build(V, E, validate)
+        return g, counts
+
+    # Crea el índice de vértices self._index y los arrays CSR. Devuelve el número de aristas descartadas
+    def _build(self, V: Optional[Iterable[T]], E: Iterable[Edge[T]], validate: str) -> dict[str, int]:
+        name = self.__class__.__name__
+        self._index: VertexIndex[T] = VertexIndex(() if V is None else V)
+
+        src = array('q')
+        dst = array('q')
+        auto_edges = 0
+        for e in E:
+            u, v = e
+            if V is None:
+                iu, iv = self._index.add(u), self._index.add(v)
+            else:
+                if u not in self._index:
+                    raise TypeError(f"{name} - Vertex {u} from edge {e} is not in the vertex set")
+                if v not in self._index:
+                    raise TypeError(f"{name} - Vertex {v} from edge {e} is not in the vertex set")
+                iu, iv = self._index[u], self._index[v]
+            if iu == iv:
+                if validate == 'strict':
+                    raise ValueError(f"{name} - Auto edge {e}")
+                auto_edges += 1
+                continue
+            src.append(iu)
+            dst.append(iv)
+
+        n = len(self._index)
+        if self._directed:
+            self._s_off, self._s_tgt, _ = _build_csr(n, src, dst)
+            self._p_off, self._p_tgt, _ = _build_csr(n, dst, src)
+            repeated_edges = len(src) - len(self._s_tgt)
+        else:
+            self._s_off, self._s_tgt, _ = _build_csr(n, src + dst, dst + src)
+            self._p_off, self._p_tgt = self._s_off, self._s_tgt
+            repeated_edges = len(src) - len(self._s_tgt) // 2
+        if validate == 'strict' and repeated_edges > 0:
+            raise ValueError(f"{name} - {repeated_edges} repeated edges")
+        return {'auto_edges': auto_edges, 'repeated_edges': repeated_edges}
+
+    # O(|V| + |E| log |E|)
+    @classmethod
+    def from_graph(cls, g: IGraph[T]) -> "CSRGraph[T]":
+        return cls(V=g.V, E=g.E, directed=g.is_directed())
+
+    # O(1): crea el grafo directamente a partir de los arrays CSR, sin copiarlos ni comprobarlos.
+    # Cada fila debe estar ordenada y sin repetidos. En los digrafos son necesarios p_off y p_tgt.
+    @classmethod
+    def from_csr(cls, vertex_index: VertexIndex[T],
+                 s_off: Sequence[int], s_tgt: Sequence[int],
+                 p_off: Optional[Sequence[int]] = None, p_tgt: Optional[Sequence[int]] = None,
+                 directed: bool = False) -> "CSRGraph[T]":
+        if len(s_off) != len(vertex_index) + 1:
+            raise ValueError(f"{cls.__name__} - Expected {len(vertex_index) + 1} offsets, got {len(s_off)}")
+        if directed and (p_off is None or p_tgt is None):
+            raise ValueError(f"{cls.__name__} - A directed graph needs p_off and p_tgt")
+        g = cls.__new__(cls)
+        g._directed = directed
+        g._index = vertex_index
+        g._s_off, g._s_tgt = s_off, s_tgt
+        g._p_off, g._p_tgt = (p_off, p_tgt) if directed else (s_off, s_tgt)
+        return g
+
+    # O(1): arrays CSR (s_off, s_tgt, p_off, p_tgt). En los grafos no dirigidos p_* son s_*
+    def csr_arrays(self) -> tuple[Sequence[int], Sequence[int], Sequence[int], Sequence[int]]:
+        return self._s_off, self._s_tgt, self._p_off, self._p_tgt
+
+    # O(log out_degree(u)): posición de la arista (u, v) en los arrays de sucesores, o -1 si no existe
+    def _slot(self, u: T, v: T) -> int:
+        if u not in self._index or v not in self._index:
+            return -1
+        i, j = self._index[u], self._index[v]
+        hi = self._s_off[i + 1]
+        k = bisect_left(self._s_tgt, j, self._s_off[i], hi)
+        return k if k < hi and self._s_tgt[k] == j else -1
+
+    # O(1)
+    def is_directed(self) -> bool:
+        return self._directed
+
+    # O(1): vista de solo lectura sobre los vértices
+    @property
+    def V(self) -> KeysView[T]:
+        return self._index.keys()
+
+    # O(|E|): la lista de aristas se genera a partir de las filas
+    @property
+    def E(self) -> list[Edge[T]]:
+        label, off, tgt = self._index.label, self._s_off, self._s_tgt
+        edges: list[Edge[T]] = []
+        for i in range(len(self._index)):
+            for j in tgt[off[i]:off[i + 1]]:
+                if self._directed or i < j:
+                    edges.append((label(i), label(j)))
+        return edges
+
+    # O(1)
+    @property
+    def vertex_index(self) -> VertexIndex[T]:
+        return self._index
+
+    # O(1): vista sin copia de los enteros de los sucesores del vértice i
+    def succ_ids(self, i: int) -> memoryview:
+        return memoryview(self._s_tgt)[self._s_off[i]:self._s_off[i + 1]]
+
+    # O(1): vista sin copia de los enteros de los predecesores del vértice i
+    def pred_ids(self, i: int) -> memoryview:
+        return memoryview(self._p_tgt)[self._p_off[i]:self._p_off[i + 1]]
+
+    # O(out_degree(v))
+    def succs(self, v: T) -> list[T]:
+        return self._index.labels(self.succ_ids(self._index[v]))
+
+    # O(in_degree(v))
+    def preds(self, v: T) -> list[T]:
+        return self._index.labels(self.pred_ids(self._index[v]))
+
+    # O(1)*
+    def out_degree(self, u: T) -> int:
+        i = self._index[u]
+        return self._s_off[i + 1] - self._s_off[i]
+
+    # O(1)*
+    def in_degree(self, v: T) -> int:
+        i = self._index[v]
+        return self._p_off[i + 1] - self._p_off[i]
+
+    # O(1)*
+    def contains_vertex(self, v: T) -> bool:
+        return v in self._index
+
+    # O(log out_degree(u))
+    def contains_edge(self, e: Edge[T]) -> bool:
+        return self._slot(*e) >= 0
+
+    # O(1): al ser inmutable, el propio grafo sirve como instantánea (y su versión siempre es 0)
+    def snapshot(self) -> Self:
+        return self
+
+    def add_vertex(self, v: T):
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    def remove_vertex(self, v: T):
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    def add_edge(self, e: Edge[T]):
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    def remove_edge(self, e: Edge[T]):
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+
+class CSRWeightingFunction[T]:
+    source: Optional[FileSource] = None
+
+    # O(1): s_w (y p_w en los digrafos) son los pesos alineados con los arrays de sucesores (y predecesores)
+    def __init__(self, g: CSRGraph[T], s_w: Sequence[Weight], p_w: Optional[Sequence[Weight]] = None):
+        if g.is_directed() and p_w is None:
+            raise ValueError(f"{self.__class__.__name__} - A directed graph needs p_w")
+        self._g = g
+        self._version = g.version  # Ver weighted_succs() en graphs.py
+        self._s_w = s_w
+        self._p_w = p_w if g.is_directed() else s_w
+        self.symmetrical = not g.is_directed()
+
+    # O(|V| + |E|)
+    @classmethod
+    def from_weighting_function(cls, g: CSRGraph[T], wf: WeightingFunction[T]) -> "CSRWeightingFunction[T]":
+        label = g.vertex_index.label
+        n = len(g.vertex_index)
+        s_w = [wf(label(i), label(j)) for i in range(n) for j in g.succ_ids(i)]
+        p_w = [wf(label(j), label(i)) for i in range(n) for j in g.pred_ids(i)] if g.is_directed() else None
+        code = 'q' if all(type(w) is int for w in s_w) else 'd'
+        return cls(g, array(code, s_w), None if p_w is None else array(code, p_w))
+
+    # O(1): arrays de pesos (s_w, p_w) alineados con los arrays CSR del grafo
+    def weight_arrays(self) -> tuple[Sequence[Weight], Sequence[Weight]]:
+        return self._s_w, self._p_w
+
+    # O(log out_degree(u))
+    def __call__(self, u: T | Edge[T], v: Optional[T] = None) -> Weight:
+        if v is None:
+            u, v = u
+        k = self._g._slot(u, v)
+        if k < 0:
+            raise KeyError(repr((u, v)))
+        return self._s_w[k]
+
+    # O(out_degree(v)): pares (sucesor, peso)
+    def succs_with_weights(self, v: T) -> list[tuple[T, Weight]]:
+        i = self._g.vertex_index[v]
+        s_off, _, _, _ = self._g.csr_arrays()
+        return list(zip(self._g.succs(v), self._s_w[s_off[i]:s_off[i + 1]]))
+
+    # O(in_degree(v)): pares (predecesor, peso)
+    def preds_with_weights(self, v: T) -> list[tuple[T, Weight]]:
+        i = self._g.vertex_index[v]
+        _, _, p_off, _ = self._g.csr_arrays()
+        return list(zip(self._g.preds(v), self._p_w[p_off[i]:p_off[i + 1]]))
+
+    # O(log out_degree(u))
+    def __getitem__(self, e: Edge[T]) -> Weight:
+        return self(e)
+
+    # O(log out_degree(u))
+    def __contains__(self, e: Edge[T]) -> bool:
+        return self._g._slot(*e) >= 0
+
+
+if __name__ == '__main__':
+    from algoritmia.datastructures.graphs import UndirectedGraph
+
+    g = UndirectedGraph(E=[(0, 1), (1, 2), (2, 0), (2, 3)])
+    csr = CSRGraph.from_graph(g)
+    print(csr)
+    print(csr.succs(2), csr.out_degree(2), csr.contains_edge((3, 2)))
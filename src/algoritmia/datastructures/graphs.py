@@ -1,7 +1,8 @@
+import copy
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
-from typing import Optional
+from collections.abc import Callable, Iterable, Iterator, KeysView
+from typing import Optional, Self
 
 # T is a generic with the vertex type
 type Edge[T] = tuple[T, T]  # Edge is a generic type
@@ -13,6 +14,16 @@ type Weight = int | float  # Edge weight
 #    - Si el grafo es no dirigido, (u, v) y (v, u) se consideran la misma arista y solo se almacena la primera
 #      en la lista de aristas.
 # 2. Se descartan las auto aristas (v, v)
+#
+# Versiones, diario e instantáneas:
+# - version: entero que crece en uno con cada cambio (vértice o arista añadido o eliminado). Las cachés
+#   pueden guardar la versión con la que calcularon un resultado y comprobar si sigue siendo válido.
+# - start_journal(): empieza a anotar los cambios. changes_since(version) devuelve los cambios posteriores
+#   a esa versión como tuplas (versión, operación, vértice o arista), donde la operación es 'add_vertex',
+#   'remove_vertex', 'add_edge' o 'remove_edge'. Al eliminar un vértice se anotan antes sus aristas.
+#   Con ellos, los algoritmos incrementales pueden reparar solo lo que ha cambiado.
+# - snapshot(): copia del grafo en O(1) que comparte los datos con el original (copia al escribir). El
+#   primero de los dos que se modifica hace la copia de sus datos, O(|V| + |E|).
 
 
 # UndirectedGraph, Digraph -----------------------------------------------------
@@ -20,6 +31,13 @@ type Weight = int | float  # Edge weight
 
 # Abstract class (no instances)
 class IGraph[T](ABC):
+    # Valores iniciales de la versión, del diario y del contador de grafos que comparten datos (copia al
+    # escribir). Son atributos de clase para que los grafos que no llaman al constructor también los tengan.
+    _version: int = 0
+    _journal: Optional[list[tuple[int, str, T | Edge[T]]]] = None
+    _journal_start: int = 0
+    _cow: Optional[list[int]] = None
+
     @abstractmethod
     def is_directed(self) -> bool:
         pass
@@ -28,38 +46,142 @@ class IGraph[T](ABC):
     def V(self) -> set[T]:
         return self._v
 
+    # O(1) si el grafo no ha cambiado desde la última llamada, O(|E|) si hay que regenerar la lista
     @property
     def E(self) -> list[Edge[T]]:
-        return self._e
+        if self._e_list is None:
+            self._e_list = list(self._e)
+        return self._e_list
 
     # O(|V| + |E|)
     def __init__(self, V: Optional[Iterable[T]] = None, E: Iterable[Edge[T]] = ()):
-        # Crea el conjunto de vértices self._v
-        if V is None:
-            self._v: set[T] = set(v for e in E for v in e)
-        else:
-            self._v: set[T] = set(V)
-
-        # Crea la lista de aristas self._e y los diccionarios self._s y self._p
-        self._e: list[Edge[T]] = []
+        self._build(V, E, 'warn')
+
+    # Construcción masiva a partir de un iterable de aristas, en una sola pasada: O(|V| + |E|)
+    # Para arrays paralelos de orígenes y destinos, utiliza E=zip(sources, targets)
+    # Según 'validate', las auto aristas y las aristas repetidas:
+    #   - 'strict': lanzan ValueError
+    #   - 'count': se descartan y se cuentan, sin escribir nada en stderr
+    #   - 'none': no se comprueban (el llamador garantiza que no las hay)
+    # Devuelve el grafo y el número de aristas descartadas de cada tipo
+    @classmethod
+    def from_edges(cls, E: Iterable[Edge[T]], V: Optional[Iterable[T]] = None,
+                   validate: str = 'count') -> tuple[Self, dict[str, int]]:
+        if validate not in ('strict', 'count', 'none'):
+            raise ValueError(f"{cls.__name__} - Unknown validate mode '{validate}'")
+        g = cls.__new__(cls)
+        counts = g._build(V, E, validate)
+        return g, counts
+
+    # Crea el conjunto de vértices self._v, las aristas self._e y los diccionarios self._s y self._p
+    # Las aristas se guardan como claves de un diccionario (que conserva el orden de inserción) para
+    # poder borrarlas en O(1). La lista que devuelve E se genera solo cuando se pide.
+    # validate: 'warn' (avisa por stderr, como hace el constructor), 'strict', 'count' o 'none'
+    def _build(self, V: Optional[Iterable[T]], E: Iterable[Edge[T]], validate: str) -> dict[str, int]:
+        if validate == 'none':
+            E = list(E)
+            if V is None:
+                V = set(u for u, _ in E) | set(v for _, v in E)
+        self._v: set[T] = set() if V is None else set(V)
+        self._e: dict[Edge[T], None] = {}
+        self._e_list: Optional[list[Edge[T]]] = None
         self._s: dict[T, set[T]] = dict((v, set()) for v in self._v)
         self._p: dict[T, set[T]] = dict((v, set()) for v in self._v) if self.is_directed() else self._s
+        if validate == 'none':
+            for u, v in E:
+                self._s[u].add(v)
+                self._p[v].add(u)
+            self._e = dict.fromkeys(E)
+            return {'auto_edges': 0, 'repeated_edges': 0}
+
+        name = self.__class__.__name__
+        auto_edges = repeated_edges = 0
         for e in E:
             u, v = e
-            if u not in self._v:
-                raise TypeError(f"{self.__class__.__name__} - Vertex {u} from edge {e} is not in the vertex set")
-            if v not in self._v:
-                raise TypeError(f"{self.__class__.__name__} - Vertex {v} from edge {e} is not in the vertex set")
+            if u not in self._s:
+                if V is not None:
+                    raise TypeError(f"{name} - Vertex {u} from edge {e} is not in the vertex set")
+                self._v.add(u)
+                self._s[u] = set()
+                self._p[u] = set()
+            if v not in self._s:
+                if V is not None:
+                    raise TypeError(f"{name} - Vertex {v} from edge {e} is not in the vertex set")
+                self._v.add(v)
+                self._s[v] = set()
+                self._p[v] = set()
             if u == v:
-                sys.stderr.write(f"{self.__class__.__name__} - WARNING: Discarded auto edge {e}\n")
+                if validate == 'strict':
+                    raise ValueError(f"{name} - Auto edge {e}")
+                if validate == 'warn':
+                    sys.stderr.write(f"{name} - WARNING: Discarded auto edge {e}\n")
+                auto_edges += 1
                 continue
             if v in self._s[u]:
-                sys.stderr.write(f"{self.__class__.__name__} - WARNING: Discarded repeated edge {e}\n")
+                if validate == 'strict':
+                    raise ValueError(f"{name} - Repeated edge {e}")
+                if validate == 'warn':
+                    sys.stderr.write(f"{name} - WARNING: Discarded repeated edge {e}\n")
+                repeated_edges += 1
                 continue
 
             self._s[u].add(v)
             self._p[v].add(u)
-            self._e.append(e)
+            self._e[e] = None
+        return {'auto_edges': auto_edges, 'repeated_edges': repeated_edges}
+
+    # O(1)
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # O(1): empieza a anotar los cambios (y olvida los anotados antes)
+    def start_journal(self):
+        self._journal = []
+        self._journal_start = self._version
+
+    # O(1)
+    def stop_journal(self):
+        self._journal = None
+
+    # O(número de cambios devueltos)
+    def changes_since(self, version: int) -> list[tuple[int, str, T | Edge[T]]]:
+        if self._journal is None:
+            raise ValueError(f"{self.__class__.__name__} - The journal is not active")
+        if not self._journal_start <= version <= self._version:
+            raise ValueError(f"{self.__class__.__name__} - No journal for version {version}")
+        return self._journal[version - self._journal_start:]
+
+    # O(1): las versiones del diario son consecutivas, el cambio i-ésimo tiene la versión _journal_start + i + 1
+    def _record(self, op: str, item: T | Edge[T]):
+        self._version += 1
+        if self._journal is not None:
+            self._journal.append((self._version, op, item))
+
+    # O(1): copia del grafo que comparte los datos con este hasta que uno de los dos cambie
+    # La instantánea tiene la misma versión que el grafo y no tiene diario
+    def snapshot(self) -> Self:
+        if self._cow is None:
+            self._cow = [1]
+        self._cow[0] += 1
+        s = copy.copy(self)
+        s._journal = None
+        return s
+
+    # O(1) si los datos no están compartidos, O(|V| + |E|) si hay que copiarlos. Se llama antes de cada cambio
+    def _detach(self):
+        if self._cow is not None and self._cow[0] > 1:
+            self._cow[0] -= 1
+            self._cow = [1]
+            self._copy_data()
+
+    # O(|V| + |E|): sustituye los datos compartidos por una copia propia
+    def _copy_data(self):
+        self._v = set(self._v)
+        self._s = dict((v, set(s)) for v, s in self._s.items())
+        self._p = dict((v, set(p)) for v, p in self._p.items()) if self.is_directed() else self._s
+        self._e = dict(self._e)
+        self._e_list = None
 
     # O(1)*
     def succs(self, v: T) -> set[T]:
@@ -82,46 +204,64 @@ class IGraph[T](ABC):
         if v in self._v: return
         assert v not in self._s, 'add_vertex - Impossible 1'
         assert v not in self._p, 'add_vertex - Impossible 2'
+        self._detach()
         self._v.add(v)
         self._s[v] = set()
         self._p[v] = set()
+        self._record('add_vertex', v)
 
-    # O(|V| + |E|)
+    # O(out_degree(v) + in_degree(v))
     def remove_vertex(self, v: T):
         if v not in self._v: return
         assert v in self._s, 'remove_vertex - Impossible 3'
         assert v in self._p, 'remove_vertex - Impossible 4'
+        self._detach()
         self._v.remove(v)
 
         for suc in self._s[v]:
             self._p[suc].remove(v)  # O(1)*, |V| veces: O(|V|)
+            self._discard_edge(v, suc)  # O(1)*
+            self._record('remove_edge', (v, suc))
         del self._s[v]
         if self.is_directed():
             for pred in self._p[v]:
                 self._s[pred].remove(v)  # O(1)*, |V| veces: O(|V|)
+                self._discard_edge(pred, v)  # O(1)*
+                self._record('remove_edge', (pred, v))
             del self._p[v]
+        self._record('remove_vertex', v)
 
-        self._e = [(u, w) for (u, w) in self._e if u != v and w != v]  # O(|E|)
-
-    # O(1)*
+    # O(1)*: si la arista ya está en el grafo, no hace nada
     def add_edge(self, e: Edge[T]):
+        if self.contains_edge(e): return
         u, v = e
         self.add_vertex(u)
         self.add_vertex(v)
+        self._detach()
 
-        self._e.append(e)
+        self._e[e] = None
+        self._e_list = None
 
         self._s[u].add(v)
         self._p[v].add(u)
+        self._record('add_edge', e)
 
-    # O(|E|)
+    # O(1)*
     def remove_edge(self, e: Edge[T]):
+        if not self.contains_edge(e): return
         u, v = e
-        if u in self._s: self._s[u].discard(v)
-        if v in self._p: self._p[v].discard(u)
-        if e in self._e: self._e.remove(e)  # O(|E|)
-        if not self.is_directed() and (v, u) in self._e:  # O(|E|)
-            self._e.remove((v, u))  # O(|E|)
+        self._detach()
+        self._s[u].discard(v)
+        self._p[v].discard(u)
+        self._discard_edge(u, v)
+        self._record('remove_edge', e)
+
+    # O(1)*: elimina la arista (u, v) de self._e (y la (v, u) si el grafo no es dirigido)
+    def _discard_edge(self, u: T, v: T):
+        self._e.pop((u, v), None)
+        if not self.is_directed():
+            self._e.pop((v, u), None)
+        self._e_list = None
 
     # O(1)*
     def contains_vertex(self, v: T) -> bool:
@@ -155,31 +295,113 @@ class Digraph[T](IGraph[T]):
 
 
 class WeightingFunction[T](dict[Edge[T], Weight], Callable[[T | Edge[T], Optional[T]], Weight]):
+    _version: int = 0  # Crece con cada cambio de los pesos, como IGraph.version
+
     # O(|data|) = O(|E|)
     def __init__(self, data: Iterable[tuple[Edge[T], Weight]] | dict[Edge[T], Weight], symmetrical: bool = False):
         super().__init__(data)
         self.symmetrical = symmetrical
-        to_delete: list[Edge[T]] = []
-        edges: set[Edge[T]] = set()
-        for e in self.keys():
+        self._validate('warn')
+
+    # Construcción masiva, sin escribir nada en stderr: O(|data|)
+    # 'validate' funciona como en IGraph.from_edges(). Las auto aristas se cuentan (y, como en
+    # el constructor, se conserva su peso), las aristas repetidas de una función simétrica se eliminan.
+    # Devuelve la función de pesos y el número de aristas de cada tipo
+    @classmethod
+    def from_items(cls, data: Iterable[tuple[Edge[T], Weight]] | dict[Edge[T], Weight], symmetrical: bool = False,
+                   validate: str = 'count') -> tuple[Self, dict[str, int]]:
+        if validate not in ('strict', 'count', 'none'):
+            raise ValueError(f"{cls.__name__} - Unknown validate mode '{validate}'")
+        wf = cls.__new__(cls)
+        dict.__init__(wf, data)
+        wf.symmetrical = symmetrical
+        counts = wf._validate(validate)
+        return wf, counts
+
+    # Las auto aristas (u, u) y las parejas (u, v), (v, u) son justo las claves cuya inversa también es
+    # clave: se obtienen con una intersección de conjuntos y solo se recorren esas.
+    def _validate(self, validate: str) -> dict[str, int]:
+        if validate == 'none':
+            return {'auto_edges': 0, 'repeated_edges': 0}
+        candidates = self.keys() & set((v, u) for (u, v) in self.keys())
+        auto_edges = repeated_edges = 0
+        kept: set[Edge[T]] = set()
+        for e in [e for e in self.keys() if e in candidates]:  # En orden de inserción
             u, v = e
             if u == v:
-                sys.stderr.write(
-                    f"WeightingFunction - WARNING: Discarded auto edge {e} (with weight {self[e]}).\n")
+                if validate == 'strict':
+                    raise ValueError(f"WeightingFunction - Auto edge {e}")
+                if validate == 'warn':
+                    sys.stderr.write(
+                        f"WeightingFunction - WARNING: Discarded auto edge {e} (with weight {self[e]}).\n")
+                auto_edges += 1
                 continue
-            if symmetrical:
+            if self.symmetrical:
                 e2 = v, u
-                if e2 in edges:
+                if e2 in kept:
                     if self[e2] != self[e]:
                         m = f"Weights are symmetrical but {e2} and {e} have differents weights: {self[e2]} != {self[e]}"
                         raise ValueError(m)
-                    sys.stderr.write(
-                        f"WeightingFunction - WARNING: Discarded repeated edge {e} (with weight {self[e]}).\n")
-                    to_delete.append(e)  # dejar solo una arista en grafos no dirigidos
+                    if validate == 'strict':
+                        raise ValueError(f"WeightingFunction - Repeated edge {e}")
+                    if validate == 'warn':
+                        sys.stderr.write(
+                            f"WeightingFunction - WARNING: Discarded repeated edge {e} (with weight {self[e]}).\n")
+                    dict.__delitem__(self, e)  # dejar solo una arista en grafos no dirigidos (sin cambiar la versión)
+                    repeated_edges += 1
                 else:
-                    edges.add(e)
-        for e in to_delete:
-            del self[e]
+                    kept.add(e)
+        return {'auto_edges': auto_edges, 'repeated_edges': repeated_edges}
+
+    # O(1)
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # Los métodos que cambian el diccionario incrementan la versión
+    # O(1)*
+    def __setitem__(self, e: Edge[T], w: Weight):
+        super().__setitem__(e, w)
+        self._version += 1
+
+    # O(1)*
+    def __delitem__(self, e: Edge[T]):
+        super().__delitem__(e)
+        self._version += 1
+
+    # O(1)*
+    def pop(self, *args):
+        w = super().pop(*args)
+        self._version += 1
+        return w
+
+    # O(1)
+    def popitem(self) -> tuple[Edge[T], Weight]:
+        item = super().popitem()
+        self._version += 1
+        return item
+
+    # O(1)*
+    def setdefault(self, e: Edge[T], w: Weight = None) -> Weight:
+        if e not in self:
+            self._version += 1
+        return super().setdefault(e, w)
+
+    # O(|data|)
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._version += 1
+
+    # O(|data|)
+    def __ior__(self, data) -> Self:
+        super().__ior__(data)
+        self._version += 1
+        return self
+
+    # O(|E|)
+    def clear(self):
+        super().clear()
+        self._version += 1
 
     # O(1)*
     def __call__(self, u: T | Edge[T], v: Optional[T] = None) -> Weight:
@@ -195,6 +417,169 @@ class WeightingFunction[T](dict[Edge[T], Weight], Callable[[T | Edge[T], Optiona
             raise KeyError(repr((u, v)) + " nor " + repr((v, u)))
         raise KeyError(repr((u, v)))
 
+    # O(|V| + |E|): ver CompiledWeightingFunction
+    def compile(self, g: IGraph[T]) -> "CompiledWeightingFunction[T]":
+        return CompiledWeightingFunction(g, self)
+
+
+# CompiledWeightingFunction: los pesos de las aristas de un grafo guardados junto a sus sucesores
+# (un diccionario de sucesor a peso por vértice). Cada consulta es un único acceso sin crear tuplas,
+# también en las funciones simétricas, y succs_with_weights(v) da los sucesores con sus pesos.
+# Refleja el grafo en el momento de crearla: guarda el grafo y su versión, y weighted_succs() solo usa los
+# pesos guardados con ese mismo grafo sin cambios. Si el grafo cambia, hay que volver a compilarla.
+class CompiledWeightingFunction[T](Callable[[T | Edge[T], Optional[T]], Weight]):
+    # O(|V| + |E|)
+    def __init__(self, g: IGraph[T], d: WeightingFunction[T]):
+        self._g = g
+        self._version = g.version
+        self._s: dict[T, dict[T, Weight]] = dict((u, dict((v, d(u, v)) for v in g.succs(u))) for u in g.V)
+        if g.is_directed():
+            self._p: dict[T, dict[T, Weight]] = dict((v, dict((u, self._s[u][v]) for u in g.preds(v))) for v in g.V)
+        else:
+            self._p = self._s
+        self.symmetrical = d.symmetrical
+
+    # O(1)*
+    def __call__(self, u: T | Edge[T], v: Optional[T] = None) -> Weight:
+        if v is None:
+            u, v = u
+        return self._s[u][v]
+
+    # O(1)*: pares (sucesor, peso)
+    def succs_with_weights(self, v: T) -> Iterable[tuple[T, Weight]]:
+        return self._s[v].items()
+
+    # O(1)*: pares (predecesor, peso)
+    def preds_with_weights(self, v: T) -> Iterable[tuple[T, Weight]]:
+        return self._p[v].items()
+
+
+# Sucesores (y predecesores) de un vértice con los pesos de sus aristas. Si la función de pesos los guarda
+# junto a los sucesores (CompiledWeightingFunction, CSRWeightingFunction) y se creó a partir de g, sin cambios
+# desde entonces, se usan directamente. Con otro grafo (una vista, un grafo modificado...) se recorren los
+# sucesores de g y se consulta el peso de cada arista.
+# O(1)
+def weighted_succs[T](g: IGraph[T], d: Callable[[T, T], Weight]) -> Callable[[T], Iterable[tuple[T, Weight]]]:
+    if hasattr(d, 'succs_with_weights') and _weights_match(g, d):
+        return d.succs_with_weights
+    return lambda v: [(w, d(v, w)) for w in g.succs(v)]
+
+
+# O(1)
+def weighted_preds[T](g: IGraph[T], d: Callable[[T, T], Weight]) -> Callable[[T], Iterable[tuple[T, Weight]]]:
+    if hasattr(d, 'preds_with_weights') and _weights_match(g, d):
+        return d.preds_with_weights
+    return lambda v: [(u, d(u, v)) for u in g.preds(v)]
+
+
+# O(1): si los pesos guardados en d son los del grafo g en su versión actual
+def _weights_match(g, d) -> bool:
+    return getattr(d, '_g', None) is g and getattr(d, '_version', None) == getattr(g, 'version', None)
+
+
+# VertexIndex -----------------------------------------------------------------------
+
+
+# Asigna a cada vértice un entero denso (0, 1, 2, ...) en orden de inserción.
+# Permite a los algoritmos trabajar con listas y arrays indexados por entero en lugar de
+# diccionarios indexados por los vértices, y devolver después las etiquetas originales.
+class VertexIndex[T]:
+    # O(|vertices|)
+    def __init__(self, vertices: Iterable[T] = ()):
+        self._labels: list[T] = []
+        self._ids: dict[T, int] = {}
+        for v in vertices:
+            self.add(v)
+
+    # O(1)*: devuelve el entero del vértice, asignándole uno nuevo si no lo tenía
+    def add(self, v: T) -> int:
+        i = self._ids.get(v)
+        if i is None:
+            i = self._ids[v] = len(self._labels)
+            self._labels.append(v)
+        return i
+
+    # O(1)*
+    def __getitem__(self, v: T) -> int:
+        return self._ids[v]
+
+    # O(1)
+    def label(self, i: int) -> T:
+        return self._labels[i]
+
+    # O(|vertices|)
+    def ids(self, vertices: Iterable[T]) -> list[int]:
+        ids = self._ids
+        return [ids[v] for v in vertices]
+
+    # O(|ids|)
+    def labels(self, ids: Iterable[int]) -> list[T]:
+        labels = self._labels
+        return [labels[i] for i in ids]
+
+    # O(1): vista de solo lectura de los vértices
+    def keys(self) -> KeysView[T]:
+        return self._ids.keys()
+
+    # O(1)*
+    def __contains__(self, v: T) -> bool:
+        return v in self._ids
+
+    # O(1)
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    # Recorre los vértices en orden de entero
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._labels)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._labels!r})"
+
+
+# VertexIndex de los enteros 0..n-1, en el que cada vértice es su propio entero: O(1) en memoria
+class RangeVertexIndex(VertexIndex[int]):
+    def __init__(self, n: int = 0):
+        self._n = n
+
+    def add(self, v: int) -> int:
+        if v == self._n:
+            self._n += 1
+        elif not 0 <= v < self._n:
+            raise ValueError(f"{self.__class__.__name__} - Expected vertex {self._n}, got {v}")
+        return v
+
+    def __getitem__(self, v: int) -> int:
+        if type(v) is int and 0 <= v < self._n:
+            return v
+        raise KeyError(v)
+
+    def label(self, i: int) -> int:
+        if 0 <= i < self._n:
+            return i
+        raise IndexError(i)
+
+    def ids(self, vertices: Iterable[int]) -> list[int]:
+        return [self[v] for v in vertices]
+
+    def labels(self, ids: Iterable[int]) -> list[int]:
+        return list(ids)
+
+    def keys(self) -> range:
+        return range(self._n)
+
+    def __contains__(self, v: int) -> bool:
+        return type(v) is int and 0 <= v < self._n
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._n))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._n})"
+
 
 if __name__ == '__main__':
     g = Digraph(E=[(1, 2)])
@@ -0,0 +1,170 @@
+import copy
+from collections.abc import Callable, Collection, Iterable, Iterator, Set
+from typing import Optional, Self
+
+from algoritmia.datastructures.graphs import IGraph, Edge
+
+# SubgraphView: vista de solo lectura de una parte de un grafo, sin copiarlo.
+# - vertices: los vértices de la vista, como colección (se guarda un conjunto con ellos) o como
+#   predicado (p.e. lambda v: está dentro de un rectángulo). Si es None, todos los del grafo.
+# - edge_filter: predicado sobre las aristas (u, v). Si es None, todas las aristas entre vértices
+#   de la vista. En un grafo no dirigido puede recibir la arista en cualquiera de los dos sentidos,
+#   por lo que debe ser simétrico.
+# Los sucesores, predecesores y aristas se filtran al vuelo sobre el grafo original: crear la vista
+# es O(1) (O(|vertices|) si se da una colección) y los cambios en el grafo original se ven en la vista.
+# Ofrece la interfaz de lectura de IGraph, por lo que los recorredores, los algoritmos de caminos y los
+# de árboles de recubrimiento funcionan sobre ella sin cambios, también con pesos compilados del grafo
+# original (CompiledWeightingFunction, CSRWeightingFunction): weighted_succs() ve que no son de la vista y
+# consulta el peso de cada arista filtrada. Se pueden crear vistas de vistas.
+# Las versiones y el diario son los del grafo original (ver IGraph).
+
+
+# Vista de solo lectura del conjunto de vértices
+class _ViewVertices[T](Set):
+    def __init__(self, view: "SubgraphView[T]"):
+        self._view = view
+
+    def __contains__(self, v) -> bool:
+        return self._view.contains_vertex(v)
+
+    def __iter__(self) -> Iterator[T]:
+        view = self._view
+        source = view._vertices if view._vertices is not None else view.graph.V
+        return (v for v in source if view.contains_vertex(v))
+
+    # O(|V|)
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+# Vista de solo lectura de las aristas. En un grafo no dirigido cada arista aparece una vez
+class _ViewEdges[T](Collection):
+    def __init__(self, view: "SubgraphView[T]"):
+        self._view = view
+
+    def __contains__(self, e) -> bool:
+        return self._view.contains_edge(e)
+
+    def __iter__(self) -> Iterator[Edge[T]]:
+        view = self._view
+        return (e for e in view.graph.E if view._keep_edge(e))
+
+    # O(|E|)
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class SubgraphView[T](IGraph[T]):
+    # O(1), O(|vertices|) si vertices es una colección
+    def __init__(self, g: IGraph[T],
+                 vertices: Optional[Iterable[T] | Callable[[T], bool]] = None,
+                 edge_filter: Optional[Callable[[Edge[T]], bool]] = None):
+        self.graph = g
+        self._vertices: Optional[set[T]] = None
+        self._vertex_filter: Optional[Callable[[T], bool]] = None
+        if callable(vertices):
+            self._vertex_filter = vertices
+        elif vertices is not None:
+            self._vertices = set(vertices)
+        self._edge_filter = edge_filter
+
+    def _keep_edge(self, e: Edge[T]) -> bool:
+        u, v = e
+        return self.contains_vertex(u) and self.contains_vertex(v) and \
+            (self._edge_filter is None or self._edge_filter(e))
+
+    # O(1)
+    def is_directed(self) -> bool:
+        return self.graph.is_directed()
+
+    @property
+    def V(self) -> Set[T]:
+        return _ViewVertices(self)
+
+    @property
+    def E(self) -> Collection[Edge[T]]:
+        return _ViewEdges(self)
+
+    # O(1): la versión y el diario son los del grafo original, que es el que cambia
+    @property
+    def version(self) -> int:
+        return self.graph.version
+
+    def start_journal(self):
+        self.graph.start_journal()
+
+    def stop_journal(self):
+        self.graph.stop_journal()
+
+    def changes_since(self, version: int) -> list[tuple[int, str, T | Edge[T]]]:
+        return self.graph.changes_since(version)
+
+    # O(1): la misma vista sobre una instantánea del grafo original
+    def snapshot(self) -> Self:
+        s = copy.copy(self)
+        s.graph = self.graph.snapshot()
+        return s
+
+    # O(out_degree(v)) en el grafo original
+    def succs(self, v: T) -> list[T]:
+        if not self.contains_vertex(v):
+            raise KeyError(v)
+        return [w for w in self.graph.succs(v) if self._keep_edge((v, w))]
+
+    # O(in_degree(v)) en el grafo original
+    def preds(self, v: T) -> list[T]:
+        if not self.contains_vertex(v):
+            raise KeyError(v)
+        return [u for u in self.graph.preds(v) if self._keep_edge((u, v))]
+
+    # O(out_degree(u)) en el grafo original
+    def out_degree(self, u: T) -> int:
+        return len(self.succs(u))
+
+    # O(in_degree(v)) en el grafo original
+    def in_degree(self, v: T) -> int:
+        return len(self.preds(v))
+
+    # O(1)*
+    def contains_vertex(self, v: T) -> bool:
+        if not self.graph.contains_vertex(v):  # El predicado solo se evalúa sobre vértices del grafo
+            return False
+        if self._vertices is not None:
+            return v in self._vertices
+        return self._vertex_filter is None or self._vertex_filter(v)
+
+    # O(1)*
+    def contains_edge(self, e: Edge[T]) -> bool:
+        return self._keep_edge(e) and self.graph.contains_edge(e)
+
+    def add_vertex(self, v: T):
+        raise TypeError(f"{self.__class__.__name__} is a read-only view")
+
+    def remove_vertex(self, v: T):
+        raise TypeError(f"{self.__class__.__name__} is a read-only view")
+
+    def add_edge(self, e: Edge[T]):
+        raise TypeError(f"{self.__class__.__name__} is a read-only view")
+
+    def remove_edge(self, e: Edge[T]):
+        raise TypeError(f"{self.__class__.__name__} is a read-only view")
+
+
+if __name__ == '__main__':
+    from algoritmia.data.iberia import iberia, coords2d
+
+    # Ciudades dentro de un rectángulo, sin la carretera entre Madrid y Toledo
+    def in_box(v: str) -> bool:
+        x, y = coords2d[v]
+        return -200 <= x <= 200 and -200 <= y <= 200
+
+    closed = {('Madrid', 'Toledo'), ('Toledo', 'Madrid')}
+    region = SubgraphView(iberia, vertices=in_box, edge_filter=lambda e: e not in closed)
+    print(len(region.V), len(region.E))
+    print(region.succs('Madrid'))
@@ -0,0 +1,197 @@
+from collections.abc import Iterable, Iterator, Set, Collection
+
+from algoritmia.datastructures.graphs import UndirectedGraph, Edge
+
+# GridGraph: laberinto de rows x cols celdas como grafo no dirigido implícito.
+# - Los vértices son las celdas (fila, columna). El (0, 0) es la celda superior izquierda.
+# - Solo puede haber arista entre celdas vecinas: la arista existe si entre ellas no hay muro.
+# - Los muros se guardan en dos arrays de bits (bytearray), uno por dirección:
+#     _east[k]:  la celda k = r * cols + c está abierta hacia (r, c + 1)
+#     _south[k]: la celda k está abierta hacia (r + 1, c)
+#   Ocupan rows * cols / 4 bytes en total, frente a un conjunto de Python por celda en UndirectedGraph.
+# - Los sucesores se calculan al vuelo, por lo que los recorredores, Dijkstra y LabyrinthViewer
+#   funcionan sin cambios. Se pueden abrir y cerrar muros (add_edge, remove_edge), pero no se
+#   pueden añadir ni eliminar celdas.
+# - Como en IGraph, cada muro abierto o cerrado incrementa la versión (y se anota en el diario) y
+#   snapshot() comparte los arrays de bits hasta que se modifica uno de los dos grafos.
+
+type Cell = tuple[int, int]
+
+
+def _test(bits: bytearray, k: int) -> bool:
+    return bits[k >> 3] >> (k & 7) & 1 == 1
+
+
+def _set(bits: bytearray, k: int):
+    bits[k >> 3] |= 1 << (k & 7)
+
+
+def _clear(bits: bytearray, k: int):
+    bits[k >> 3] &= ~(1 << (k & 7))
+
+
+# Vista de solo lectura del conjunto de celdas
+class _GridCells(Set):
+    def __init__(self, rows: int, cols: int):
+        self._rows, self._cols = rows, cols
+
+    def __contains__(self, v) -> bool:
+        return isinstance(v, tuple) and len(v) == 2 and \
+            type(v[0]) is int and type(v[1]) is int and 0 <= v[0] < self._rows and 0 <= v[1] < self._cols
+
+    def __iter__(self) -> Iterator[Cell]:
+        for r in range(self._rows):
+            for c in range(self._cols):
+                yield r, c
+
+    def __len__(self) -> int:
+        return self._rows * self._cols
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+
+# Vista de solo lectura de los pasillos (aristas). Cada arista aparece una vez: ((r, c), (r, c + 1)) o
+# ((r, c), (r + 1, c))
+class _GridEdges(Collection):
+    def __init__(self, g: "GridGraph"):
+        self._g = g
+
+    def __contains__(self, e) -> bool:
+        return self._g.contains_edge(e)
+
+    def __iter__(self) -> Iterator[Edge[Cell]]:
+        g = self._g
+        k = 0
+        for r in range(g.rows):
+            for c in range(g.cols):
+                if _test(g._east, k):
+                    yield (r, c), (r, c + 1)
+                if _test(g._south, k):
+                    yield (r, c), (r + 1, c)
+                k += 1
+
+    def __len__(self) -> int:
+        return int.from_bytes(self._g._east).bit_count() + int.from_bytes(self._g._south).bit_count()
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class GridGraph(UndirectedGraph[Cell]):
+    # O(rows * cols / 8 + |E|): todas las celdas empiezan cerradas y se abren los pasillos de E
+    def __init__(self, rows: int, cols: int, E: Iterable[Edge[Cell]] = ()):
+        if rows <= 0 or cols <= 0:
+            raise ValueError(f"{self.__class__.__name__} - Wrong size {rows}x{cols}")
+        self.rows, self.cols = rows, cols
+        size = (rows * cols + 7) // 8
+        self._east = bytearray(size)
+        self._south = bytearray(size)
+        self._v = _GridCells(rows, cols)
+        for e in E:  # Construcción: no son cambios, no incrementan la versión
+            bits, k = self._wall(e)
+            _set(bits, k)
+
+    # O(|V| + |E|): las dimensiones se obtienen de las celdas del grafo
+    @classmethod
+    def from_graph(cls, g: UndirectedGraph[Cell]) -> "GridGraph":
+        return cls(max(r for r, _ in g.V) + 1, max(c for _, c in g.V) + 1, g.E)
+
+    # Devuelve la posición del muro entre u y v: (array de bits, índice)
+    def _wall(self, e: Edge[Cell]) -> tuple[bytearray, int]:
+        u, v = e
+        for w in u, v:
+            if w not in self._v:
+                raise TypeError(f"{self.__class__.__name__} - Vertex {w} from edge {e} is not in the vertex set")
+        (ru, cu), (rv, cv) = min(u, v), max(u, v)
+        if ru == rv and cv == cu + 1:
+            return self._east, ru * self.cols + cu
+        if cu == cv and rv == ru + 1:
+            return self._south, ru * self.cols + cu
+        raise ValueError(f"{self.__class__.__name__} - Cells {u} and {v} are not neighbours")
+
+    @property
+    def V(self) -> Set[Cell]:
+        return self._v
+
+    @property
+    def E(self) -> Collection[Edge[Cell]]:
+        return _GridEdges(self)
+
+    # O(1)
+    def succs(self, v: Cell) -> list[Cell]:
+        r, c = v
+        cols = self.cols
+        if not (0 <= r < self.rows and 0 <= c < cols):
+            raise KeyError(v)
+        k = r * cols + c
+        east, south = self._east, self._south
+        res = []
+        if r > 0 and _test(south, k - cols): res.append((r - 1, c))
+        if c > 0 and _test(east, k - 1): res.append((r, c - 1))
+        if _test(east, k): res.append((r, c + 1))
+        if _test(south, k): res.append((r + 1, c))
+        return res
+
+    # O(1)
+    def preds(self, v: Cell) -> list[Cell]:
+        return self.succs(v)
+
+    # O(1)
+    def out_degree(self, u: Cell) -> int:
+        return len(self.succs(u))
+
+    # O(1)
+    def in_degree(self, v: Cell) -> int:
+        return len(self.succs(v))
+
+    # O(rows * cols / 8)
+    def _copy_data(self):
+        self._east = bytearray(self._east)
+        self._south = bytearray(self._south)
+
+    # O(1): abre el muro entre dos celdas vecinas
+    def add_edge(self, e: Edge[Cell]):
+        bits, k = self._wall(e)
+        if _test(bits, k): return
+        self._detach()
+        bits, k = self._wall(e)  # _detach puede haber cambiado los arrays
+        _set(bits, k)
+        self._record('add_edge', e)
+
+    # O(1): cierra el muro entre dos celdas vecinas
+    def remove_edge(self, e: Edge[Cell]):
+        bits, k = self._wall(e)
+        if not _test(bits, k): return
+        self._detach()
+        bits, k = self._wall(e)  # _detach puede haber cambiado los arrays
+        _clear(bits, k)
+        self._record('remove_edge', e)
+
+    def add_vertex(self, v: Cell):
+        if v not in self._v:
+            raise TypeError(f"{self.__class__.__name__} - Can not add cells to a {self.rows}x{self.cols} grid")
+
+    def remove_vertex(self, v: Cell):
+        raise TypeError(f"{self.__class__.__name__} - Can not remove cells from a grid")
+
+    # O(1)
+    def contains_vertex(self, v: Cell) -> bool:
+        return v in self._v
+
+    # O(1)
+    def contains_edge(self, e: Edge[Cell]) -> bool:
+        try:
+            bits, k = self._wall(e)
+        except (TypeError, ValueError):
+            return False
+        return _test(bits, k)
+
+
+if __name__ == '__main__':
+    corridors = [((0, 0), (0, 1)), ((0, 2), (0, 3)), ((1, 0), (1, 1)), ((0, 1), (0, 2)),
+                 ((2, 0), (1, 0)), ((2, 1), (2, 2)), ((2, 2), (2, 3)), ((0, 1), (1, 1)),
+                 ((0, 2), (1, 2)), ((0, 3), (1, 3)), ((1, 1), (2, 1)), ((1, 2), (2, 2))]
+    labyrinth = GridGraph(3, 4, corridors)
+    print(labyrinth)
+    print(labyrinth.succs((1, 1)))
@@ -67,3 +67,55 @@ class MergeFindSet[T](IMergeFindSet[T]):
 
     def __repr__(self) -> str:
         return '{}({!r})'.format(self.__class__.__name__, tuple(self))
+
+
+# MergeFindSet para los enteros 0..n-1 (por ejemplo, los de un VertexIndex).
+# Utiliza listas en lugar de diccionarios.
+class DenseMergeFindSet(IMergeFindSet[int]):
+    def __init__(self, n: int = 0):
+        self._parent: list[int] = list(range(n))
+        self._rank: list[int] = [1] * n
+        self._length = n
+
+    def add(self, x: int):
+        if x != len(self._parent):
+            raise ValueError(f"{self.__class__.__name__} - Expected element {len(self._parent)}, got {x}")
+        self._parent.append(x)
+        self._rank.append(1)
+        self._length += 1
+
+    def merge(self, x: int, y: int):
+        u = self.find(x)
+        v = self.find(y)
+        if u != v:
+            self._length -= 1
+            rank = self._rank
+            if rank[u] < rank[v]:
+                self._parent[u] = v
+            elif rank[u] > rank[v]:
+                self._parent[v] = u
+            else:
+                self._parent[v] = u
+                rank[u] += 1
+
+    def find(self, x: int) -> int:
+        parent = self._parent
+        r = x
+        while r != parent[r]:
+            r = parent[r]
+        while x != parent[x]:
+            parent[x], x = r, parent[x]
+        return r
+
+    def __iter__(self) -> Iterator[Iterable[int]]:
+        aux = {}
+        for key in range(len(self._parent)):
+            aux.setdefault(self.find(key), []).append(key)
+        for s in aux.values():
+            yield s
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(self.__class__.__name__, tuple(self))
@@ -1,5 +1,5 @@
 from abc import abstractmethod, ABC
-from collections.abc import Callable, Iterator, Sequence, Sized
+from collections.abc import Callable, Iterable, Iterator, Sequence, Sized
 from itertools import chain, repeat
 
 
@@ -83,3 +83,68 @@ class MinHeap[T](IPriorityQueue[T]):
 
 class MaxHeap[T](MinHeap[T]):
     _opt = max
+
+
+# RadixHeap: cola de prioridad monótona para claves enteras no negativas, como las distancias de Dijkstra con
+# pesos enteros. La clave de cada elemento que se añade no puede ser menor que la del último extraído (last).
+# El elemento de clave k está en la cubeta (k ^ last).bit_length(): la 0 tiene los de clave last y la i > 0,
+# los que difieren de last como mucho en el bit i-1. Cuando la cubeta 0 se vacía, last pasa a ser la clave
+# mínima de la primera cubeta no vacía y sus elementos se reparten entre las cubetas inferiores.
+# Cada elemento baja de cubeta como mucho log2(C) veces, donde C es la diferencia entre la mayor clave y last:
+# add() es O(1) y extract_opt() O(log C) amortizado, sin comparar los elementos entre sí.
+# Los elementos con la misma clave se extraen en cualquier orden.
+class RadixHeap[T](IPriorityQueue[T]):
+    def __init__(self, data: Iterable[T] = (), key: Callable[[T], int] = lambda item: item):
+        self._key = key
+        self._last = 0
+        self._buckets: list[list[T]] = [[]]
+        self._size = 0
+        for item in data:
+            self.add(item)
+
+    # O(1)
+    def add(self, item: T):
+        k = self._key(item)
+        if k < self._last:
+            raise ValueError(f"{self.__class__.__name__} - Key {k} is smaller than the last extracted key {self._last}")
+        i = (k ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= i:
+            buckets.append([])
+        buckets[i].append(item)
+        self._size += 1
+
+    # O(tamaño de la primera cubeta no vacía)
+    def opt(self) -> T:
+        if self._size == 0:
+            raise IndexError('opt from an empty heap')
+        if len(self._buckets[0]) > 0:
+            return self._buckets[0][-1]
+        return min(next(b for b in self._buckets if len(b) > 0), key=self._key)
+
+    # O(log C) amortizado
+    def extract_opt(self) -> T:
+        if self._size == 0:
+            raise IndexError('extract opt from an empty heap')
+        buckets = self._buckets
+        if len(buckets[0]) == 0:
+            i = 1
+            while len(buckets[i]) == 0:
+                i += 1
+            bucket, buckets[i] = buckets[i], []
+            key = self._key
+            last = self._last = min(map(key, bucket))
+            for item in bucket:
+                buckets[(key(item) ^ last).bit_length()].append(item)
+        self._size -= 1
+        return buckets[0].pop()
+
+    def __iter__(self) -> Iterator[T]:
+        for bucket in self._buckets:
+            yield from bucket
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(self.__class__.__name__, sorted(self, key=self._key))
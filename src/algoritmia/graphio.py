@@ -0,0 +1,345 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from ast import literal_eval
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Optional
+
+from algoritmia.datastructures.csrgraphs import CSRGraph, CSRWeightingFunction, FileSource, build_csr
+from algoritmia.datastructures.graphs import (IGraph, UndirectedGraph, Digraph, WeightingFunction, Weight,
+                                              VertexIndex, RangeVertexIndex)
+
+# Lectura y escritura de grafos en ficheros.
+#
+# Formatos de texto (solo lectura). Se leen línea a línea, sin cargar el fichero entero en memoria,
+# y construyen en una sola pasada un IGraph y su WeightingFunction o, con csr=True, un CSRGraph y
+# su CSRWeightingFunction (cuyos arrays ocupan mucha menos memoria):
+#   - DIMACS (9th DIMACS Implementation Challenge): ficheros .gr ('a u v peso') y .co ('v id x y')
+#   - Lista de aristas: 'u v [peso]' por línea, separados por tabuladores o espacios
+#   - Formato 'A:B:distancia' de algoritmia/data/iberia.py
+#
+# Formato binario (versión 1), pensado para abrirse con mmap sin analizar nada:
+#   - Cabecera de 40 bytes: ver _HEADER.
+#   - Secciones, cada una alineada a 8 bytes:
+#       s_off (int64, |V|+1), s_tgt (int32 o int64, m), [s_w (int64 o float64, m)]
+#       solo digrafos: p_off, p_tgt, [p_w]
+#       [coordenadas (float64, 2|V|)]
+#       tabla de etiquetas de los vértices (ver _write_labels)
+#   m es el número de entradas de las filas: |E| en los digrafos y 2|E| en los grafos no dirigidos.
+#   Los enteros y reales se guardan en el orden de bytes de la máquina que escribe el fichero.
+
+type Pos2D = tuple[float, float]
+
+_MAGIC = b'ALGGRAPH'
+_FORMAT_VERSION = 1
+# magic, version, byte order, flags, |V|, m, label kind, typecode de s_tgt, typecode de pesos
+_HEADER = struct.Struct('=8sHcBQQBcc9x')
+_DIRECTED, _WEIGHTS, _COORDS = 1, 2, 4
+
+# Tipos de tabla de etiquetas
+_LABELS_RANGE = 0  # Los vértices son los enteros 0..|V|-1: no hay tabla
+_LABELS_INT = 1  # int64 por vértice
+_LABELS_STR = 2  # offsets int64 (|V|+1) y cadenas utf-8
+_LABELS_LITERAL = 3  # offsets int64 (|V|+1) y repr() utf-8 de cada vértice (se lee con ast.literal_eval)
+
+
+# CoordinateView: diccionario de solo lectura de vértice a coordenadas sobre un array de float64
+class CoordinateView[T](Mapping[T, Pos2D]):
+    def __init__(self, vertex_index: VertexIndex[T], xy: Sequence[float]):
+        self._index = vertex_index
+        self._xy = xy
+
+    def __getitem__(self, v: T) -> Pos2D:
+        i = 2 * self._index[v]
+        return self._xy[i], self._xy[i + 1]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# ----------------------------------------------------------------
+# Formato binario
+# ----------------------------------------------------------------
+
+def _pad(f, size: int):
+    if size % 8 != 0:
+        f.write(bytes(8 - size % 8))
+
+
+def _write_section(f, data: array | memoryview):
+    size = len(data) * data.itemsize
+    f.write(data)
+    _pad(f, size)
+
+
+def _typecode(data: array | memoryview) -> str:
+    return data.format if isinstance(data, memoryview) else data.typecode
+
+
+def _label_kind(labels: Sequence) -> int:
+    if all(type(v) is int for v in labels):
+        if all(i == v for i, v in enumerate(labels)):
+            return _LABELS_RANGE
+        return _LABELS_INT
+    if all(type(v) is str for v in labels):
+        return _LABELS_STR
+    for v in labels:
+        try:
+            stored = literal_eval(repr(v)) == v
+        except (ValueError, SyntaxError):
+            stored = False
+        if not stored:
+            raise TypeError(f"save_graph - Vertex {v!r} can not be stored (use str, int, float or tuples of them)")
+    return _LABELS_LITERAL
+
+
+def _write_labels(f, labels: Sequence, kind: int):
+    if kind == _LABELS_INT:
+        _write_section(f, array('q', labels))
+    elif kind in (_LABELS_STR, _LABELS_LITERAL):
+        encoded = [(v if kind == _LABELS_STR else repr(v)).encode('utf-8') for v in labels]
+        off = array('q', [0])
+        for b in encoded:
+            off.append(off[-1] + len(b))
+        _write_section(f, off)
+        blob = b''.join(encoded)
+        f.write(blob)
+        _pad(f, len(blob))
+
+
+def _read_labels(mv: memoryview, pos: int, n: int, kind: int) -> tuple[VertexIndex, int]:
+    if kind == _LABELS_RANGE:
+        return RangeVertexIndex(n), pos
+    if kind == _LABELS_INT:
+        return VertexIndex(mv[pos:pos + 8 * n].cast('q')), pos + 8 * n
+    off = mv[pos:pos + 8 * (n + 1)].cast('q')
+    pos += 8 * (n + 1)
+    blob = mv[pos:pos + off[n]]
+    decode = (lambda b: str(b, 'utf-8')) if kind == _LABELS_STR else (lambda b: literal_eval(str(b, 'utf-8')))
+    index = VertexIndex(decode(blob[off[i]:off[i + 1]]) for i in range(n))
+    return index, pos + off[n] + (-off[n]) % 8
+
+
+# Guarda el grafo (y, opcionalmente, sus pesos y las coordenadas de sus vértices) en formato binario
+# Los vértices deben ser int, str, float o tuplas de ellos
+# O(|V| + |E| log |E|) si g no es un CSRGraph, O(|V| + |E|) si lo es
+def save_graph[T](path: str, g: IGraph[T],
+                  wf: Optional[WeightingFunction[T] | CSRWeightingFunction[T]] = None,
+                  coords: Optional[Mapping[T, Pos2D]] = None):
+    csr = g if isinstance(g, CSRGraph) else CSRGraph.from_graph(g)
+    if wf is not None and not isinstance(wf, CSRWeightingFunction):
+        wf = CSRWeightingFunction.from_weighting_function(csr, wf)
+    index = csr.vertex_index
+    n = len(index)
+    labels = list(index)
+    kind = _LABELS_RANGE if isinstance(index, RangeVertexIndex) else _label_kind(labels)
+    flags = (_DIRECTED if csr.is_directed() else 0) | (_WEIGHTS if wf is not None else 0) | \
+            (_COORDS if coords is not None else 0)
+    s_off, s_tgt, p_off, p_tgt = csr.csr_arrays()
+    s_w, p_w = wf.weight_arrays() if wf is not None else (None, None)
+    t_code = _typecode(s_tgt).encode()
+    w_code = b'-' if s_w is None else _typecode(s_w).encode()
+
+    with open(path, 'wb') as f:
+        byteorder = b'<' if sys.byteorder == 'little' else b'>'
+        f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, byteorder, flags, n, len(s_tgt), kind, t_code, w_code))
+        _write_section(f, s_off)
+        _write_section(f, s_tgt)
+        if s_w is not None:
+            _write_section(f, s_w)
+        if csr.is_directed():
+            _write_section(f, p_off)
+            _write_section(f, p_tgt)
+            if p_w is not None:
+                _write_section(f, p_w)
+        if coords is not None:
+            _write_section(f, array('d', (c for v in index for c in coords[v])))
+        _write_labels(f, labels, kind)
+
+
+# Abre un grafo guardado con save_graph() proyectando el fichero en memoria (mmap)
+# Los arrays del grafo, de los pesos y de las coordenadas son vistas del fichero: no se copian ni se
+# analizan, y varios procesos que abran el mismo fichero comparten sus páginas a través del sistema operativo.
+# Solo la tabla de etiquetas se lee (salvo si los vértices son los enteros 0..|V|-1).
+# No sobrescribas el fichero mientras haya grafos abiertos sobre él.
+# El atributo source del grafo y de los pesos identifica el fichero (ver FileSource en csrgraphs.py): las
+# vistas de mmap no se pueden enviar a otros procesos, así que distance_matrix() hace que cada proceso vuelva
+# a abrir el fichero, comprobando antes que sigue siendo el mismo.
+# Devuelve el grafo, sus pesos (o None) y las coordenadas (o None)
+def load_graph(path: str) -> tuple[CSRGraph, Optional[CSRWeightingFunction], Optional[CoordinateView]]:
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if st.st_size < _HEADER.size:  # mmap no admite ficheros vacíos
+            raise ValueError(f"load_graph - '{path}' is not a graph file")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    mv = memoryview(mm)
+    magic, version, byteorder, flags, n, m, kind, t_code, w_code = _HEADER.unpack_from(mv)
+    if magic != _MAGIC:
+        raise ValueError(f"load_graph - '{path}' is not a graph file")
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"load_graph - Unsupported format version {version} in '{path}'")
+    if byteorder != (b'<' if sys.byteorder == 'little' else b'>'):
+        raise ValueError(f"load_graph - '{path}' was written with a different byte order")
+    pos = _HEADER.size
+
+    def section(code: str, length: int) -> memoryview:
+        nonlocal pos
+        size = struct.calcsize(code) * length
+        view = mv[pos:pos + size].cast(code)
+        pos += size + (-size) % 8
+        return view
+
+    t_code, w_code = t_code.decode(), w_code.decode()
+    directed = bool(flags & _DIRECTED)
+    s_off, s_tgt = section('q', n + 1), section(t_code, m)
+    s_w = section(w_code, m) if flags & _WEIGHTS else None
+    p_off = p_tgt = p_w = None
+    if directed:
+        p_off, p_tgt = section('q', n + 1), section(t_code, m)
+        p_w = section(w_code, m) if flags & _WEIGHTS else None
+    xy = section('d', 2 * n) if flags & _COORDS else None
+    index, pos = _read_labels(mv, pos, n, kind)
+
+    g = CSRGraph.from_csr(index, s_off, s_tgt, p_off, p_tgt, directed=directed)
+    wf = CSRWeightingFunction(g, s_w, p_w) if s_w is not None else None
+    coords = CoordinateView(index, xy) if xy is not None else None
+    g.source = os.path.abspath(path), st.st_size, st.st_mtime_ns
+    if wf is not None:
+        wf.source = g.source
+    return g, wf, coords
+
+
+# El FileSource actual de la ruta, o None si no existe. Si no es igual al source de un grafo cargado con
+# load_graph(), el fichero ha cambiado desde entonces
+def file_source(path: str) -> Optional[FileSource]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return os.path.abspath(path), st.st_size, st.st_mtime_ns
+
+
+# ----------------------------------------------------------------
+# Formatos de texto
+# ----------------------------------------------------------------
+
+type Source = str | Iterable[str]  # Ruta de un fichero o iterable de líneas (p.e. un fichero abierto)
+
+
+def _lines(source: Source) -> Iterator[str]:
+    if isinstance(source, str):
+        with open(source, encoding='utf-8') as f:
+            yield from f
+    else:
+        yield from source
+
+
+# Construye el grafo y la función de pesos (si weighted) a partir de un iterable de ternas (u, v, peso)
+def _build[T](triples: Iterable[tuple[T, T, Optional[Weight]]], directed: bool, weighted: bool,
+              weight_code: str, csr: bool, V: Optional[Iterable[T]] = None) -> tuple[IGraph[T], Optional[Callable]]:
+    if csr:
+        index: VertexIndex[T] = VertexIndex(() if V is None else V)
+        src, dst = array('q'), array('q')
+        weights = array(weight_code) if weighted else None
+        for u, v, w in triples:
+            if V is not None and (u not in index or v not in index):
+                raise TypeError(f"CSRGraph - Vertex from edge {(u, v)} is not in the vertex set")
+            src.append(index.add(u))
+            dst.append(index.add(v))
+            if weighted:
+                weights.append(w)
+        return build_csr(index, src, dst, weights, directed)
+
+    data: dict[tuple[T, T], Optional[Weight]] = {}
+    for u, v, w in triples:
+        data[u, v] = w
+    g, _ = (Digraph if directed else UndirectedGraph).from_edges(data.keys(), V=V, validate='count')
+    if not weighted:
+        return g, None
+    wf, _ = WeightingFunction.from_items(data, symmetrical=not directed, validate='count')
+    return g, wf
+
+
+# Lee un grafo en formato DIMACS (dirigido, vértices 1..n y pesos enteros) y, si se da co_source,
+# las coordenadas de sus vértices
+# Devuelve el grafo, sus pesos y las coordenadas (o None)
+def read_dimacs(gr_source: Source, co_source: Optional[Source] = None,
+                csr: bool = False) -> tuple[IGraph[int], Callable, Optional[Mapping[int, Pos2D]]]:
+    lines = _lines(gr_source)
+    n: Optional[int] = None
+    for line in lines:  # La línea 'p sp n m' precede a las aristas
+        if line.startswith('p'):
+            n = int(line.split()[2])
+            break
+    if n is None:
+        raise ValueError("read_dimacs - Missing problem line 'p sp n m'")
+
+    def arcs() -> Iterator[tuple[int, int, int]]:
+        for line in lines:
+            if line.startswith('a'):
+                _, u, v, w = line.split()
+                yield int(u), int(v), int(w)
+
+    g, wf = _build(arcs(), True, True, 'q', csr, V=range(1, n + 1))
+
+    coords = None
+    if co_source is not None:
+        xy = array('d', bytes(16 * n))
+        for line in _lines(co_source):
+            if line.startswith('v'):
+                _, v, x, y = line.split()
+                i = 2 * (int(v) - 1)
+                xy[i], xy[i + 1] = float(x), float(y)
+        coords = CoordinateView(g.vertex_index, xy) if csr else \
+            dict((v, (xy[2 * v - 2], xy[2 * v - 1])) for v in range(1, n + 1))
+    return g, wf, coords
+
+
+# Lee una lista de aristas: una por línea, 'u v [peso]' separados por 'sep' (por defecto, espacios o
+# tabuladores). Se ignoran las líneas vacías y las que empiezan por '#'.
+# vertex_type y weight_type convierten los campos de texto (p.e. int)
+# Devuelve el grafo y sus pesos (None si weighted es False)
+def read_edge_list[T](source: Source, directed: bool = False, weighted: bool = True,
+                      vertex_type: Callable[[str], T] = str, weight_type: Callable[[str], Weight] = float,
+                      sep: Optional[str] = None, csr: bool = False) -> tuple[IGraph[T], Optional[Callable]]:
+    def triples() -> Iterator[tuple[T, T, Optional[Weight]]]:
+        for line in _lines(source):
+            line = line.strip()
+            if line == '' or line.startswith('#'):
+                continue
+            fields = line.split(sep)
+            yield vertex_type(fields[0]), vertex_type(fields[1]), weight_type(fields[2]) if weighted else None
+
+    return _build(triples(), directed, weighted, 'q' if weight_type is int else 'd', csr)
+
+
+# Lee aristas en el formato 'A:B:distancia' de algoritmia/data/iberia.py
+# Devuelve el grafo y sus pesos
+def read_colon_format(source: Source, directed: bool = False,
+                      csr: bool = False) -> tuple[IGraph[str], Callable]:
+    def triples() -> Iterator[tuple[str, str, float]]:
+        for line in _lines(source):
+            line = line.strip()
+            if line != '':
+                city_a, city_b, distance = line.split(':')
+                yield city_a, city_b, float(distance)
+
+    return _build(triples(), directed, True, 'd', csr)
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+
+    from algoritmia.data.iberia import iberia, km, coords2d
+
+    filename = os.path.join(tempfile.gettempdir(), 'iberia.graph')
+    save_graph(filename, iberia, km, coords2d)
+    g0, km0, coords0 = load_graph(filename)
+    city = g0.succs('Madrid')[0]
+    print(len(g0.V), len(g0.E), city, km0('Madrid', city), km('Madrid', city), coords0['Madrid'])
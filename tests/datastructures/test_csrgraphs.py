@@ -0,0 +1,74 @@
+import unittest
+
+from algoritmia.algorithms.mst import kruskal, prim
+from algoritmia.algorithms.traverse import traverse_bf, traverse_dijkstra_heapmap
+from algoritmia.datastructures.csrgraphs import CSRGraph, CSRWeightingFunction
+from algoritmia.datastructures.graphs import UndirectedGraph, Digraph, WeightingFunction
+
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        self.edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0), (0, 3), (3, 0), (0, 2), (0, 4), (0, 7)]
+        self.dg = Digraph(V=range(8), E=self.edges)
+        self.ug = UndirectedGraph(E=[(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0), (0, 7)])
+        self.csr_dg = CSRGraph.from_graph(self.dg)
+        self.csr_ug = CSRGraph.from_graph(self.ug)
+
+    def test_same_read_api(self):
+        for g, csr in (self.dg, self.csr_dg), (self.ug, self.csr_ug):
+            self.assertEqual(g.is_directed(), csr.is_directed())
+            self.assertEqual(set(g.V), set(csr.V))
+            self.assertEqual(len(g.E), len(csr.E))
+            for u in g.V:
+                self.assertEqual(set(g.succs(u)), set(csr.succs(u)))
+                self.assertEqual(set(g.preds(u)), set(csr.preds(u)))
+                self.assertEqual(g.out_degree(u), csr.out_degree(u))
+                self.assertEqual(g.in_degree(u), csr.in_degree(u))
+            for e in g.E:
+                self.assertTrue(csr.contains_edge(e))
+        self.assertTrue(self.csr_ug.contains_edge((7, 0)))
+        self.assertFalse(self.csr_dg.contains_edge((7, 0)))
+        self.assertFalse(self.csr_dg.contains_edge((6, 0)))
+
+    def test_from_edges(self):
+        g = CSRGraph(E=[('a', 'b'), ('b', 'a'), ('b', 'b'), ('b', 'c')])
+        self.assertEqual(set(g.V), {'a', 'b', 'c'})
+        self.assertEqual(len(g.E), 2)
+        self.assertEqual(sorted(g.succs('b')), ['a', 'c'])
+        self.assertRaises(TypeError, CSRGraph, [1, 2], [(1, 3)])
+        g, counts = CSRGraph.from_edges([('a', 'b'), ('b', 'a'), ('b', 'b'), ('b', 'c')])
+        self.assertIsInstance(g, CSRGraph)
+        self.assertEqual(counts, {'auto_edges': 1, 'repeated_edges': 1})
+        self.assertEqual(sorted(g.succs('b')), ['a', 'c'])
+        self.assertTrue(g.contains_edge(('c', 'b')))
+        g, counts = CSRGraph.from_edges(zip([0, 1, 1], [1, 0, 2]), V=range(4), directed=True)
+        self.assertEqual(counts, {'auto_edges': 0, 'repeated_edges': 0})
+        self.assertEqual((len(g.V), len(g.E), g.preds(0)), (4, 3, [1]))
+        self.assertRaises(ValueError, CSRGraph.from_edges, [(0, 1), (1, 0)], validate='strict')
+        self.assertRaises(ValueError, CSRGraph.from_edges, [(0, 0)], validate='strict')
+        self.assertRaises(ValueError, CSRGraph.from_edges, [(0, 1)], validate='warn')
+        self.assertRaises(TypeError, CSRGraph.from_edges, [(0, 5)], V=range(3))
+
+    def test_immutable(self):
+        self.assertRaises(TypeError, self.csr_ug.add_edge, (1, 7))
+        self.assertRaises(TypeError, self.csr_ug.remove_edge, (0, 1))
+        self.assertRaises(TypeError, self.csr_ug.add_vertex, 9)
+        self.assertRaises(TypeError, self.csr_ug.remove_vertex, 0)
+
+    def test_algorithms(self):
+        self.assertEqual(set(v for _, v in traverse_bf(self.csr_dg, 0)),
+                         set(v for _, v in traverse_bf(self.dg, 0)))
+        wf = WeightingFunction({e: sum(e) for e in self.ug.E}, symmetrical=True)
+        self.assertEqual(set(v for _, v in traverse_dijkstra_heapmap(self.csr_ug, wf, 0)),
+                         set(v for _, v in traverse_dijkstra_heapmap(self.ug, wf, 0)))
+        for mst in kruskal, prim:
+            self.assertEqual(sum(wf(e) for e in mst(self.csr_ug, wf).E),
+                             sum(wf(e) for e in mst(self.ug, wf).E))
+        csr_wf = CSRWeightingFunction.from_weighting_function(self.csr_ug, wf)
+        self.assertEqual(sum(wf(e) for e in prim(self.csr_ug, csr_wf).E), sum(wf(e) for e in prim(self.ug, wf).E))
+        self.assertEqual(sorted(csr_wf.succs_with_weights(0)), [(1, 1), (5, 5), (7, 7)])
+        self.assertEqual(sorted(csr_wf.preds_with_weights(0)), [(1, 1), (5, 5), (7, 7)])
+
+
+if __name__ == "__main__":
+    unittest.main()
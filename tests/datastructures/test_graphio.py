@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+
+from algoritmia.data.iberia import iberia, km, coords2d
+from algoritmia.datastructures.csrgraphs import CSRGraph
+from algoritmia.datastructures.graphs import Digraph, UndirectedGraph, WeightingFunction
+from algoritmia.graphio import save_graph, load_graph, file_source, read_dimacs, read_edge_list, read_colon_format
+
+
+class TestBinaryFormat(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'g.graph')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def assertSameGraph(self, g, g2):
+        self.assertEqual(g.is_directed(), g2.is_directed())
+        self.assertEqual(set(g.V), set(g2.V))
+        self.assertEqual(len(g.E), len(g2.E))
+        for v in g.V:
+            self.assertEqual(set(g.succs(v)), set(g2.succs(v)))
+            self.assertEqual(set(g.preds(v)), set(g2.preds(v)))
+
+    def test_iberia(self):
+        save_graph(self.path, iberia, km, coords2d)
+        g, wf, coords = load_graph(self.path)
+        self.assertIsInstance(g, CSRGraph)
+        self.assertSameGraph(iberia, g)
+        for (u, v) in iberia.E:
+            self.assertEqual(km(u, v), wf(u, v))
+            self.assertEqual(km(v, u), wf((v, u)))
+        self.assertEqual(dict(coords), coords2d)
+        self.assertRaises(KeyError, wf, 'Madrid', 'Lisboa')
+
+    def test_source(self):
+        save_graph(self.path, iberia, km)
+        g, wf, _ = load_graph(self.path)
+        self.assertEqual(g.source, (os.path.abspath(self.path), os.path.getsize(self.path),
+                                    os.stat(self.path).st_mtime_ns))
+        self.assertEqual(wf.source, g.source)
+        self.assertEqual(file_source(self.path), g.source)
+        self.assertIsNone(CSRGraph.from_graph(iberia).source)
+        other = self.path + '.new'  # Se sustituye el fichero: g sigue viendo el anterior
+        save_graph(other, UndirectedGraph(E=[(0, 1)]))
+        os.replace(other, self.path)
+        self.assertNotEqual(file_source(self.path), g.source)
+        self.assertIsNone(file_source(other))
+        del g, wf
+
+    def test_digraph_labels(self):
+        for k, edges in enumerate(([(0, 1), (1, 2), (2, 0), (0, 3)],
+                                   [(10, 11), (11, 12), (12, 10)],
+                                   [((0, 0), (0, 1)), ((0, 1), (1, 1)), ((1, 1), (0, 0))])):
+            dg = Digraph(E=edges)
+            wf = WeightingFunction({e: i + 1 for i, e in enumerate(edges)})
+            path = f'{self.path}{k}'
+            save_graph(path, dg, wf)
+            g, g_wf, coords = load_graph(path)
+            self.assertSameGraph(dg, g)
+            self.assertIsNone(coords)
+            for e in edges:
+                self.assertEqual(wf(e), g_wf(e))
+            self.assertRaises(KeyError, g_wf, (edges[0][1], edges[0][0]))
+
+    def test_without_weights(self):
+        ug = UndirectedGraph(E=[('a', 'b'), ('b', 'c')])
+        save_graph(self.path, CSRGraph.from_graph(ug))
+        g, wf, coords = load_graph(self.path)
+        self.assertSameGraph(ug, g)
+        self.assertIsNone(wf)
+        self.assertRaises(TypeError, save_graph, self.path, UndirectedGraph(E=[(object(), 1)]))
+
+    def test_not_a_graph_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'x' * 100)
+        self.assertRaises(ValueError, load_graph, self.path)
+        for data in b'', b'ALGGRAPH':  # Vacío o más corto que la cabecera
+            with open(self.path, 'wb') as f:
+                f.write(data)
+            with self.assertRaisesRegex(ValueError, 'is not a graph file'):
+                load_graph(self.path)
+
+
+class TestTextFormats(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.gr = os.path.join(self.tmpdir.name, 'g.gr')
+        with open(self.gr, 'w') as f:
+            f.write("c Ejemplo\np sp 4 5\na 1 2 7\na 2 3 1\na 3 1 2\na 1 3 9\na 1 2 7\n")
+        self.co = os.path.join(self.tmpdir.name, 'g.co')
+        with open(self.co, 'w') as f:
+            f.write("c Ejemplo\np aux sp co 4\nv 1 10 20\nv 2 11 21\nv 3 12 22\nv 4 13 23\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_dimacs(self):
+        for csr in False, True:
+            g, wf, coords = read_dimacs(self.gr, self.co, csr=csr)
+            self.assertEqual(isinstance(g, CSRGraph), csr)
+            self.assertTrue(g.is_directed())
+            self.assertEqual(set(g.V), {1, 2, 3, 4})
+            self.assertEqual(len(g.E), 4)
+            self.assertEqual(set(g.succs(1)), {2, 3})
+            self.assertEqual(wf(1, 3), 9)
+            self.assertEqual(wf(3, 1), 2)
+            self.assertEqual(coords[4], (13.0, 23.0))
+        g, wf, coords = read_dimacs(["p sp 2 1", "a 1 2 3"])
+        self.assertIsNone(coords)
+        self.assertRaises(ValueError, read_dimacs, ["a 1 2 3"])
+
+    def test_edge_list(self):
+        lines = ["# u v w", "a\tb\t1.5", "", "b\tc\t2", "c\ta\t4"]
+        for csr in False, True:
+            g, wf = read_edge_list(lines, csr=csr)
+            self.assertFalse(g.is_directed())
+            self.assertEqual(len(g.E), 3)
+            self.assertEqual(wf('b', 'a'), 1.5)
+            g, wf = read_edge_list(["1 2", "2 3"], directed=True, weighted=False, vertex_type=int, csr=csr)
+            self.assertIsNone(wf)
+            self.assertEqual(set(g.preds(2)), {1})
+            # Repetida en el mismo sentido: se queda el último peso. En sentido contrario con otro peso: error
+            g, wf = read_edge_list(["0 1 5", "0 1 3", "1 0 3"], csr=csr)
+            self.assertEqual((len(g.E), wf('0', '1'), wf('1', '0')), (1, 3, 3))
+            self.assertRaises(ValueError, read_edge_list, ["0 1 5", "1 0 7", "0 1 3"], csr=csr)
+
+    def test_colon_format(self):
+        lines = ["Castelló:Sagunt:43", "Sagunt:València:50.5", "València:Sagunt:50.5"]
+        for csr in False, True:
+            g, wf = read_colon_format(iter(lines), csr=csr)
+            self.assertEqual(len(g.E), 2)
+            self.assertEqual(wf('València', 'Sagunt'), 50.5)
+            self.assertEqual(wf('Sagunt', 'Castelló'), 43)
+        for csr in False, True:
+            self.assertRaises(ValueError, read_colon_format, ["A:B:1", "B:A:2"], csr=csr)
+
+
+if __name__ == "__main__":
+    unittest.main()
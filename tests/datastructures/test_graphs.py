@@ -3,7 +3,8 @@
 import unittest
 
 from algoritmia.datastructures.graphs import (UndirectedGraph, Digraph,
-                                              WeightingFunction)
+                                              WeightingFunction, VertexIndex, weighted_succs, weighted_preds)
+from algoritmia.datastructures.graphviews import SubgraphView
 
 
 class TestDigraphs(unittest.TestCase):
@@ -119,6 +120,18 @@ class TestUndirectedGraph(unittest.TestCase):
         self.g7.remove_vertex(0)
         self.assertEqual(4, len(self.g7.E))
 
+    def test_remove_keeps_edge_order(self):
+        g = UndirectedGraph(E=self.edges)
+        self.assertEqual(g.E, self.edges)
+        g.remove_edge((2, 1))
+        g.remove_vertex(4)
+        self.assertEqual(g.E, [e for e in self.edges if e != (1, 2) and 4 not in e])
+        g.add_edge((4, 1))
+        self.assertEqual(g.E[-1], (4, 1))
+        for e in list(g.E):
+            g.remove_edge(e)
+        self.assertEqual(g.E, [])
+
     def test_V_len(self):
         for g in self.g1, self.g1bis:
             self.assertEqual(len(g.V), 8)
@@ -258,6 +271,141 @@ class TestWeightingFunction(unittest.TestCase):
         self.assertEqual(self.rep(0, 1), 10)
         self.assertEqual(self.rep(1, 0), 10)
 
+    def test_compile(self):
+        dg = Digraph(E=[(0, 1), (1, 2), (2, 0)])
+        wf = WeightingFunction({(0, 1): 5, (1, 2): 3, (2, 0): 1})
+        cwf = wf.compile(dg)
+        for e in dg.E:
+            self.assertEqual(cwf(e), wf(e))
+        self.assertEqual(list(cwf.succs_with_weights(1)), [(2, 3)])
+        self.assertEqual(list(cwf.preds_with_weights(1)), [(0, 5)])
+        self.assertRaises(KeyError, cwf, 1, 0)
+        ug = UndirectedGraph(E=[(1, 2), (1, 1)])
+        cwf = self.sym.compile(ug)
+        self.assertEqual(cwf(2, 1), 3)
+        self.assertEqual(sorted(cwf.succs_with_weights(2)), sorted(cwf.preds_with_weights(2)))
+
+    def test_compiled_other_graph(self):
+        g = UndirectedGraph(E=[(0, 1), (1, 2), (0, 2)])
+        wf = WeightingFunction({(0, 1): 1, (1, 2): 1, (0, 2): 10}, symmetrical=True)
+        cwf = wf.compile(g)
+        self.assertEqual(sorted(weighted_succs(g, cwf)(0)), [(1, 1), (2, 10)])
+        view = SubgraphView(g, edge_filter=lambda e: set(e) != {0, 1})
+        self.assertEqual(list(weighted_succs(view, cwf)(0)), [(2, 10)])
+        self.assertEqual(list(weighted_preds(view, cwf)(1)), [(2, 1)])
+        g.remove_edge((0, 1))  # Cambia la versin: los pesos compilados ya no valen
+        self.assertEqual(list(weighted_succs(g, cwf)(0)), [(2, 10)])
+        self.assertEqual(list(weighted_preds(g, cwf)(0)), [(2, 10)])
+
+    def test_version(self):
+        wf = WeightingFunction({(0, 1): 5, (1, 2): 3})
+        self.assertEqual(wf.version, 0)
+        wf[2, 0] = 1
+        wf[0, 1] = 4
+        del wf[1, 2]
+        self.assertEqual(wf.version, 3)
+        wf.setdefault((0, 1), 7)
+        self.assertEqual(wf.version, 3)
+        wf.update({(1, 2): 3})
+        wf.pop((1, 2))
+        wf |= {(1, 2): 2}
+        self.assertEqual(wf.version, 6)
+        wf2, _ = WeightingFunction.from_items([((0, 1), 5), ((1, 0), 5)], symmetrical=True)
+        self.assertEqual((wf2.version, len(wf2)), (0, 1))
+
+
+class TestFromEdges(unittest.TestCase):
+    def setUp(self):
+        self.edges = [(0, 1), (1, 2), (2, 2), (1, 0), (2, 3), (1, 2)]
+
+    def test_count(self):
+        g, counts = UndirectedGraph.from_edges(self.edges)
+        self.assertIsInstance(g, UndirectedGraph)
+        self.assertEqual(counts, {'auto_edges': 1, 'repeated_edges': 2})
+        self.assertEqual(set(g.V), {0, 1, 2, 3})
+        self.assertEqual(g.E, [(0, 1), (1, 2), (2, 3)])
+        self.assertEqual(g.succs(1), {0, 2})
+        g, counts = Digraph.from_edges(iter(self.edges))
+        self.assertEqual(counts, {'auto_edges': 1, 'repeated_edges': 1})
+        self.assertEqual(len(g.E), 4)
+        self.assertEqual(g.preds(0), {1})
+
+    def test_strict_and_none(self):
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, self.edges, validate='strict')
+        self.assertRaises(TypeError, UndirectedGraph.from_edges, [(0, 5)], V=range(3))
+        self.assertRaises(ValueError, UndirectedGraph.from_edges, [(0, 1)], validate='warn')
+        g, counts = Digraph.from_edges(zip([0, 1, 2], [1, 2, 0]), validate='none')
+        self.assertEqual(counts, {'auto_edges': 0, 'repeated_edges': 0})
+        self.assertEqual(g.E, [(0, 1), (1, 2), (2, 0)])
+        self.assertEqual(g.preds(0), {2})
+        g, _ = UndirectedGraph.from_edges([(0, 1)], V=range(3), validate='strict')
+        self.assertEqual(len(g.V), 3)
+
+    def test_weighting_function_from_items(self):
+        data = [((0, 1), 10), ((0, 0), 1), ((1, 0), 10), ((0, 2), 2)]
+        wf, counts = WeightingFunction.from_items(data, symmetrical=True)
+        self.assertEqual(counts, {'auto_edges': 1, 'repeated_edges': 1})
+        self.assertFalse((1, 0) in wf)
+        self.assertEqual(wf(1, 0), 10)
+        self.assertRaises(ValueError, WeightingFunction.from_items, data, True, 'strict')
+        self.assertRaises(ValueError, WeightingFunction.from_items, [((0, 1), 1), ((1, 0), 2)], True)
+        wf, counts = WeightingFunction.from_items(data, validate='none')
+        self.assertEqual(len(wf), 4)
+
+
+class TestVersionsAndSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.ug = UndirectedGraph(E=[(0, 1), (1, 2), (2, 0)])
+        self.dg = Digraph(E=[(0, 1), (1, 2), (2, 0)])
+
+    def test_version_and_journal(self):
+        self.assertEqual(self.ug.version, 0)
+        self.ug.start_journal()
+        self.ug.add_edge((1, 0))  # Ya existe: no es un cambio
+        self.assertEqual(self.ug.version, 0)
+        self.ug.add_edge((2, 3))
+        self.assertEqual(self.ug.version, 2)
+        self.ug.remove_edge((5, 6))
+        self.ug.remove_vertex(0)
+        self.assertEqual(self.ug.changes_since(0)[:2], [(1, 'add_vertex', 3), (2, 'add_edge', (2, 3))])
+        self.assertEqual(set(e for _, op, e in self.ug.changes_since(2) if op == 'remove_edge'), {(0, 1), (0, 2)})
+        self.assertEqual(self.ug.changes_since(2)[-1], (5, 'remove_vertex', 0))
+        self.assertEqual(self.ug.changes_since(self.ug.version), [])
+        self.assertRaises(ValueError, self.ug.changes_since, 6)
+        self.ug.stop_journal()
+        self.assertRaises(ValueError, self.ug.changes_since, 0)
+
+    def test_snapshot(self):
+        for g in self.ug, self.dg:
+            s = g.snapshot()
+            self.assertEqual(s.version, g.version)
+            g.remove_edge((0, 1))
+            g.add_vertex(7)
+            self.assertTrue(s.contains_edge((0, 1)))
+            self.assertFalse(7 in s.V)
+            self.assertEqual(len(s.E), 3)
+            s2 = s.snapshot()
+            s.remove_vertex(2)
+            self.assertEqual(set(s2.V), {0, 1, 2})
+            self.assertEqual(set(s.preds(1)), {0})
+            self.assertEqual(len(g.E), 2)
+
+
+class TestVertexIndex(unittest.TestCase):
+    def test_index(self):
+        index = VertexIndex(['Madrid', 'Bilbao', 'Madrid'])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index['Madrid'], 0)
+        self.assertEqual(index.add('Soria'), 2)
+        self.assertEqual(index.add('Bilbao'), 1)
+        self.assertEqual(index.label(2), 'Soria')
+        self.assertEqual(index.ids(['Soria', 'Madrid']), [2, 0])
+        self.assertEqual(index.labels([1, 0]), ['Bilbao', 'Madrid'])
+        self.assertEqual(list(index), ['Madrid', 'Bilbao', 'Soria'])
+        self.assertTrue('Soria' in index)
+        self.assertFalse('Teruel' in index)
+        self.assertRaises(KeyError, index.__getitem__, 'Teruel')
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,85 @@
+import unittest
+
+from algoritmia.algorithms.mst import kruskal, prim
+from algoritmia.algorithms.shortest_path import shortest_path_positive_weighted_graph
+from algoritmia.algorithms.traverse import traverse_bf, traverse_df
+from algoritmia.datastructures.graphs import UndirectedGraph, Digraph, WeightingFunction
+from algoritmia.datastructures.csrgraphs import CSRGraph, CSRWeightingFunction
+from algoritmia.datastructures.graphviews import SubgraphView
+
+
+class TestSubgraphView(unittest.TestCase):
+    def setUp(self):
+        self.edges = [(0, 1), (1, 2), (2, 3), (3, 0), (0, 4), (4, 5)]
+        self.ug = UndirectedGraph(E=self.edges)
+        self.dg = Digraph(E=self.edges)
+        self.closed = {(0, 1), (1, 0)}
+
+    def test_vertices(self):
+        for vertices in [0, 1, 2, 3], lambda v: v < 4:
+            view = SubgraphView(self.ug, vertices=vertices)
+            self.assertEqual(set(view.V), {0, 1, 2, 3})
+            self.assertEqual(len(view.V), 4)
+            self.assertFalse(4 in view.V)
+            self.assertEqual(set(view.succs(0)), {1, 3})
+            self.assertEqual(view.out_degree(0), 2)
+            self.assertEqual(len(view.E), 4)
+            self.assertFalse(view.contains_edge((0, 4)))
+            self.assertRaises(KeyError, view.succs, 4)
+        self.assertFalse(SubgraphView(self.ug, vertices=[7]).contains_vertex(7))
+
+    def test_edge_filter(self):
+        view = SubgraphView(self.ug, edge_filter=lambda e: e not in self.closed)
+        self.assertEqual(set(view.V), set(self.ug.V))
+        self.assertEqual(len(view.E), len(self.edges) - 1)
+        self.assertFalse(view.contains_edge((1, 0)))
+        self.assertEqual(set(view.succs(1)), {2})
+        dview = SubgraphView(self.dg, vertices=lambda v: v != 3, edge_filter=lambda e: e != (1, 2))
+        self.assertEqual(set(dview.E), {(0, 1), (0, 4), (4, 5)})
+        self.assertEqual(dview.preds(0), [])
+        self.assertEqual(dview.in_degree(1), 1)
+
+    def test_lazy_and_readonly(self):
+        view = SubgraphView(self.ug, vertices=lambda v: v < 4)
+        self.ug.add_edge((1, 3))
+        self.assertTrue(view.contains_edge((3, 1)))
+        self.assertRaises(TypeError, view.add_edge, (0, 2))
+        self.assertRaises(TypeError, view.remove_vertex, 0)
+        nested = SubgraphView(view, edge_filter=lambda e: e not in self.closed)
+        self.assertEqual(set(nested.succs(1)), {2, 3})
+
+    def test_algorithms(self):
+        view = SubgraphView(self.ug, vertices=lambda v: v < 4, edge_filter=lambda e: e not in self.closed)
+        for traverse in traverse_bf, traverse_df:
+            self.assertEqual(set(v for _, v in traverse(view, 0)), {0, 1, 2, 3})
+        wf = WeightingFunction({e: sum(e) for e in self.edges}, symmetrical=True)
+        self.assertEqual(set(kruskal(view, wf).E), {(2, 3), (3, 0), (1, 2)})
+
+    def test_kruskal_filter_calls(self):
+        # len(view.V) recorre los vértices: kruskal no debe calcularlo por cada arista aceptada
+        edges = [(i, i + 1) for i in range(300)]
+        wf = WeightingFunction({e: 1 for e in edges}, symmetrical=True)
+        calls = []
+        view = SubgraphView(UndirectedGraph(E=edges), vertices=lambda v: calls.append(v) or True)
+        self.assertEqual(len(kruskal(view, wf).E), 300)
+        self.assertLess(len(calls), 10 * 301)
+
+    def test_compiled_and_csr_weights(self):
+        # Triángulo 0-1-2: la vista oculta la arista (0, 1) o el vértice 1
+        g = UndirectedGraph(E=[(0, 1), (1, 2), (0, 2)])
+        wf = WeightingFunction({(0, 1): 1, (1, 2): 1, (0, 2): 10}, symmetrical=True)
+        csr = CSRGraph.from_graph(g)
+        for graph, d in (g, wf), (g, wf.compile(g)), (csr, CSRWeightingFunction.from_weighting_function(csr, wf)):
+            self.assertEqual(shortest_path_positive_weighted_graph(graph, d, 0, 2), [0, 1, 2])
+            no_edge = SubgraphView(graph, edge_filter=lambda e: set(e) != {0, 1})
+            for strategy in 'heapmap', 'heapq', 'dict':
+                self.assertEqual(shortest_path_positive_weighted_graph(no_edge, d, 0, 2, strategy), [0, 2])
+            no_vertex = SubgraphView(graph, vertices=[0, 2])
+            self.assertEqual([set(e) for e in prim(no_vertex, d).E], [{0, 2}])
+            self.assertEqual([set(e) for e in prim(no_edge, d).E if 0 in e], [{0, 2}])
+            self.assertEqual([set(e) for e in kruskal(no_vertex, d).E], [{0, 2}])
+            self.assertEqual(sorted(map(sorted, kruskal(no_edge, d).E)), [[0, 2], [1, 2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
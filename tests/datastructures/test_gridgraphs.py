@@ -0,0 +1,61 @@
+import unittest
+
+from algoritmia.algorithms.shortest_path import shortest_path_unweighted_graph
+from algoritmia.algorithms.traverse import traverse_bf, traverse_df
+from algoritmia.datastructures.graphs import UndirectedGraph
+from algoritmia.datastructures.gridgraphs import GridGraph
+
+
+class TestGridGraph(unittest.TestCase):
+    def setUp(self):
+        self.corridors = [((0, 0), (0, 1)), ((0, 2), (0, 3)), ((1, 0), (1, 1)), ((0, 1), (0, 2)),
+                          ((2, 0), (1, 0)), ((2, 1), (2, 2)), ((2, 2), (2, 3)), ((0, 1), (1, 1)),
+                          ((0, 2), (1, 2)), ((0, 3), (1, 3)), ((1, 1), (2, 1)), ((1, 2), (2, 2))]
+        self.ug = UndirectedGraph(E=self.corridors)
+        self.grid = GridGraph(3, 4, self.corridors)
+
+    def test_same_graph(self):
+        self.assertIsInstance(self.grid, UndirectedGraph)
+        self.assertFalse(self.grid.is_directed())
+        self.assertEqual(set(self.grid.V), set(self.ug.V))
+        self.assertEqual(len(self.grid.V), 12)
+        self.assertEqual(len(self.grid.E), len(self.ug.E))
+        for (u, v) in self.ug.E:
+            self.assertTrue((u, v) in self.grid.E)
+            self.assertTrue(self.grid.contains_edge((v, u)))
+        for v in self.ug.V:
+            self.assertEqual(set(self.grid.succs(v)), self.ug.succs(v))
+            self.assertEqual(self.grid.out_degree(v), self.ug.out_degree(v))
+        self.assertEqual(set(GridGraph.from_graph(self.ug).E), set(self.grid.E))
+
+    def test_algorithms(self):
+        for traverse in traverse_bf, traverse_df:
+            self.assertEqual(set(v for _, v in traverse(self.grid, (0, 0))), set(self.ug.V))
+        self.assertEqual(len(shortest_path_unweighted_graph(self.grid, (0, 0), (1, 3))),
+                         len(shortest_path_unweighted_graph(self.ug, (0, 0), (1, 3))))
+
+    def test_walls(self):
+        self.assertFalse(self.grid.contains_edge(((1, 2), (1, 3))))
+        self.grid.add_edge(((1, 3), (1, 2)))
+        self.assertTrue(self.grid.contains_edge(((1, 2), (1, 3))))
+        self.grid.remove_edge(((0, 0), (0, 1)))
+        self.assertEqual(self.grid.succs((0, 0)), [])
+        self.assertEqual(len(self.grid.E), len(self.corridors))
+        self.assertRaises(ValueError, self.grid.add_edge, ((0, 0), (1, 1)))
+        self.assertRaises(TypeError, self.grid.add_edge, ((2, 3), (2, 4)))
+        self.assertRaises(TypeError, self.grid.remove_vertex, (0, 0))
+        self.assertFalse((3, 0) in self.grid.V)
+        self.assertFalse(self.grid.contains_edge(((2, 3), (3, 3))))
+
+    def test_snapshot(self):
+        snapshot = self.grid.snapshot()
+        self.grid.remove_edge(((0, 0), (0, 1)))
+        self.grid.remove_edge(((0, 0), (0, 1)))
+        self.assertEqual(self.grid.version, 1)
+        self.assertEqual(snapshot.version, 0)
+        self.assertEqual(snapshot.succs((0, 0)), [(0, 1)])
+        self.assertEqual(len(snapshot.E), len(self.corridors))
+
+
+if __name__ == "__main__":
+    unittest.main()
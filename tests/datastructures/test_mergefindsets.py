@@ -2,13 +2,14 @@
 
 import unittest
 
-from algoritmia.datastructures.mergefindsets import MergeFindSet
+from algoritmia.datastructures.mergefindsets import MergeFindSet, DenseMergeFindSet
 
 
 class TestMFset(unittest.TestCase):
     def setUp(self):
         self.mf1 = MergeFindSet()
         self.mf2 = MergeFindSet(((i,) for i in range(10)))
+        self.mf3 = DenseMergeFindSet(10)
 
     def test_mfsets(self):
         for i in range(10):
@@ -19,12 +20,14 @@ class TestMFset(unittest.TestCase):
         for i in range(0, 10, 2):
             self.mf1.merge(i, i + 1)
             self.mf2.merge(i, i + 1)
+            self.mf3.merge(i, i + 1)
         for i in range(0, 10, 2):
             self.assertEqual(self.mf1.find(i), self.mf1.find(i + 1))
             self.assertEqual(self.mf2.find(i), self.mf2.find(i + 1))
         for i in range(0, 10 - 3, 4):
             self.mf1.merge(i, i + 3)
             self.mf2.merge(i, i + 3)
+            self.mf3.merge(i, i + 3)
         for i in range(0, 10 - 4, 4):
             self.assertEqual(self.mf1.find(i), self.mf1.find(i + 1))
             self.assertEqual(self.mf1.find(i), self.mf1.find(i + 2))
@@ -32,6 +35,9 @@ class TestMFset(unittest.TestCase):
             self.assertEqual(self.mf2.find(i), self.mf2.find(i + 1))
             self.assertEqual(self.mf2.find(i), self.mf2.find(i + 2))
             self.assertEqual(self.mf2.find(i), self.mf2.find(i + 3))
+            self.assertEqual(self.mf3.find(i), self.mf3.find(i + 3))
+        self.assertEqual(len(self.mf2), len(self.mf3))
+        self.assertEqual(sorted(map(sorted, self.mf2)), sorted(map(sorted, self.mf3)))
 
 
 if __name__ == "__main__":
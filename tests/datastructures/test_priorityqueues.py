@@ -2,7 +2,7 @@
 import unittest
 from random import seed, shuffle
 
-from algoritmia.datastructures.priorityqueues import MinHeap, MaxHeap
+from algoritmia.datastructures.priorityqueues import MinHeap, MaxHeap, RadixHeap
 
 
 class TestHeap(unittest.TestCase):
@@ -63,6 +63,32 @@ class TestHeap(unittest.TestCase):
         self.assertEqual(list(sorted(self.minh2)), list(sorted(eval(repr(self.minh2)))))
 
 
+class TestRadixHeap(unittest.TestCase):
+    def test_monotone(self):
+        a = list(range(50)) * 2
+        seed(0)
+        shuffle(a)
+        h = RadixHeap(a)
+        self.assertEqual(len(h), 100)
+        self.assertEqual(h.opt(), 0)
+        result = []
+        while len(h) > 0:
+            k = h.extract_opt()
+            result.append(k)
+            if k % 7 == 0:
+                h.add(k + 13)
+                result.append(None)
+        self.assertEqual([k for k in result if k is not None], sorted(k for k in result if k is not None))
+        self.assertRaises(IndexError, h.extract_opt)
+        self.assertRaises(IndexError, h.opt)
+        self.assertRaises(ValueError, h.add, 10)  # Menor que la ltima clave extrada
+
+    def test_key(self):
+        h = RadixHeap([(5, 'a'), (1, 'b'), (3, 'c')], key=lambda item: item[0])
+        self.assertEqual(h.opt(), (1, 'b'))
+        self.assertEqual([h.extract_opt() for _ in range(3)], [(1, 'b'), (3, 'c'), (5, 'a')])
+
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testPoint2D']
     unittest.main()
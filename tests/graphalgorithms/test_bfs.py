@@ -0,0 +1,48 @@
+import unittest
+
+from algoritmia.algorithms.bfs import direction_optimizing_bfs, bfs_distances
+from algoritmia.datastructures.csrgraphs import CSRGraph
+from algoritmia.datastructures.graphs import Digraph
+
+
+class TestDirectionOptimizingBFS(unittest.TestCase):
+    def setUp(self):
+        edges = [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4), (5, 6)]
+        self.g = CSRGraph(V=range(7), E=edges, directed=True)
+        self.ug = CSRGraph(E=[(0, i) for i in range(1, 50)] + [(i, i + 1) for i in range(1, 49)] + [(49, 50)])
+
+    def test_levels_and_parents(self):
+        for direction in 'auto', 'top-down', 'bottom-up':
+            parent, level = direction_optimizing_bfs(self.g, 0, direction)
+            self.assertEqual(list(level), [0, 1, 1, 2, 3, -1, -1])
+            self.assertEqual(parent[0], 0)
+            self.assertTrue(parent[3] in (1, 2))
+            self.assertEqual(parent[5], -1)
+            parent, level = direction_optimizing_bfs(self.ug, 0, direction, alpha=1)
+            index = self.ug.vertex_index
+            self.assertEqual(level[index[50]], 2)
+            self.assertEqual(index.label(parent[index[50]]), 49)
+
+    def test_bfs_distances(self):
+        dist, nearest = bfs_distances(self.g, [4, 1, 5])
+        self.assertEqual(list(dist), [-1, 0, -1, 1, 0, 0, 1])
+        self.assertEqual(list(nearest), [-1, 1, -1, 1, 0, 2, 2])
+        for batch in 1, 2, 64:
+            rows = bfs_distances(self.g, [0, 2, 5], 'matrix', batch)
+            self.assertEqual([list(row) for row in rows], [[0, 1, 1, 2, 3, -1, -1],
+                                                           [-1, -1, 0, 1, 2, -1, -1],
+                                                           [-1, -1, -1, -1, -1, 0, 1]])
+        sources = list(range(0, 51, 3))
+        rows = bfs_distances(self.ug, sources, 'matrix')
+        for source, row in zip(sources, rows):
+            self.assertEqual(row, direction_optimizing_bfs(self.ug, source)[1])
+
+    def test_errors(self):
+        self.assertRaises(ValueError, direction_optimizing_bfs, self.g, 0, 'sideways')
+        self.assertRaises(TypeError, direction_optimizing_bfs, Digraph(E=[(0, 1)]), 0)
+        self.assertRaises(ValueError, bfs_distances, self.g, [0], 'all')
+        self.assertRaises(TypeError, bfs_distances, Digraph(E=[(0, 1)]), [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import random
+import tempfile
+import unittest
+
+from algoritmia.algorithms.contraction_hierarchies import ContractionHierarchy
+from algoritmia.algorithms.traverse import traverse_dijkstra_distances
+from algoritmia.data.iberia import iberia, km
+from algoritmia.datastructures.graphs import Digraph, UndirectedGraph, WeightingFunction
+from algoritmia.utils import infinity
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3), (3, 0)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9, (3, 0): 2})
+
+    def assertShortestPaths(self, g, wf, ch):
+        for s in g.V:
+            dist = {v: dv for _, v, dv in traverse_dijkstra_distances(g, wf, s)}
+            for t in g.V:
+                cost, path = ch.shortest_path(s, t)
+                if t not in dist:
+                    self.assertEqual((cost, path), (infinity, []))
+                    continue
+                self.assertAlmostEqual(cost, dist[t])
+                self.assertAlmostEqual(ch.distance(s, t), dist[t])
+                self.assertEqual((path[0], path[-1]), (s, t))
+                self.assertAlmostEqual(sum(wf(u, v) for u, v in zip(path, path[1:])), cost)
+
+    def test_small(self):
+        ch = ContractionHierarchy.from_graph(self.dg, self.wf)
+        self.assertEqual(ch.shortest_path(0, 3), (8, [0, 2, 1, 3]))
+        self.assertEqual(ch.shortest_path(4, 0), (infinity, []))
+        self.assertShortestPaths(self.dg, self.wf, ch)
+
+    def test_random(self):
+        rnd = random.Random(0)
+        for directed in False, True:
+            for _ in range(10):
+                edges = {(rnd.randrange(20), rnd.randrange(20)): rnd.randint(1, 10) for _ in range(50)}
+                edges = {(u, v): w for (u, v), w in edges.items() if u != v and (directed or (v, u) not in edges)}
+                g = (Digraph if directed else UndirectedGraph)(V=range(20), E=edges)
+                wf = WeightingFunction(edges, symmetrical=not directed)
+                self.assertShortestPaths(g, wf, ContractionHierarchy.from_graph(g, wf, witness_limit=3))
+
+    def test_iberia(self):
+        ch = ContractionHierarchy.from_graph(iberia, km)
+        self.assertGreater(ch.shortcuts, 0)
+        cities = sorted(iberia.V)[::20]
+        for s in cities:
+            dist = {v: dv for _, v, dv in traverse_dijkstra_distances(iberia, km, s)}
+            for t in cities:
+                self.assertAlmostEqual(ch.distance(s, t), dist[t])
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for g, wf in (self.dg, self.wf), (iberia, km):
+                ch = ContractionHierarchy.from_graph(g, wf)
+                path = os.path.join(tmp, 'ch.bin')
+                ch.save(path)
+                loaded = ContractionHierarchy.load(path)
+                self.assertEqual(loaded.shortcuts, ch.shortcuts)
+                vertices = sorted(g.V)[::10]
+                for s in vertices:
+                    for t in vertices:
+                        self.assertEqual(loaded.shortest_path(s, t), ch.shortest_path(s, t))
+                del loaded
+            bad = os.path.join(tmp, 'bad.bin')
+            with open(bad, 'wb') as f:
+                f.write(b'0' * 64)
+            self.assertRaises(ValueError, ContractionHierarchy.load, bad)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from algoritmia.algorithms.distances import (distance_matrix, dijkstra_tree, dijkstra_within, dijkstra_k_nearest,
+                                             _init_worker_from_file)
+from algoritmia.algorithms.shortest_path import shortest_path_positive_weighted_graph
+from algoritmia.algorithms.traverse import traverse_dijkstra_distances
+from algoritmia.data.iberia import iberia, km
+from algoritmia.datastructures.graphs import Digraph, WeightingFunction
+from algoritmia.graphio import save_graph, load_graph
+from algoritmia.utils import infinity
+
+
+class TestDistanceMatrix(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9})
+
+    def test_small(self):
+        m = distance_matrix(self.dg, self.wf, [0, 2, 5], [3, 1, 0, 3])
+        self.assertEqual([list(row) for row in m], [[8, 7, 0, 8],
+                                                    [5, 4, infinity, 5],
+                                                    [infinity, infinity, infinity, infinity]])
+        self.assertEqual([list(row) for row in distance_matrix(self.dg, self.wf, [0], [])], [[]])
+        self.assertRaises(KeyError, distance_matrix, self.dg, self.wf, [0], [9])
+        self.assertRaises(KeyError, distance_matrix, self.dg, self.wf, [9], [0])
+
+    def test_iberia(self):
+        cities = sorted(iberia.V)[::15]
+        m = distance_matrix(iberia, km, cities, cities)
+        for s, row in zip(cities, m):
+            dist = {v: dv for _, v, dv in traverse_dijkstra_distances(iberia, km, s)}
+            for t, dv in zip(cities, row):
+                self.assertAlmostEqual(dv, dist[t])
+        self.assertEqual(distance_matrix(iberia, km, cities, cities, workers=2), m)
+
+    def test_load_graph(self):
+        cities = sorted(iberia.V)[::15]
+        m = distance_matrix(iberia, km, cities, cities)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'iberia.bin')
+            save_graph(path, iberia, km)
+            g, wf, _ = load_graph(path)
+            self.assertEqual(distance_matrix(g, wf, cities, cities), m)
+            self.assertEqual(distance_matrix(g, wf, cities, cities, workers=2), m)
+            # Con 'spawn' los procesos no heredan el grafo: vuelven a abrir el fichero
+            method = multiprocessing.get_start_method()
+            multiprocessing.set_start_method('spawn', force=True)
+            try:
+                self.assertEqual(distance_matrix(g, wf, cities, cities, workers=2), m)
+            finally:
+                multiprocessing.set_start_method(method, force=True)
+            # Si el fichero se sustituye, los procesos no lo usan: con 'fork' heredan el grafo cargado
+            other = os.path.join(tmp, 'other.bin')
+            save_graph(other, Digraph(E=[(0, 1)]), WeightingFunction({(0, 1): 1}))
+            os.replace(other, path)
+            self.assertRaises(ValueError, _init_worker_from_file, g.source, {}, 0)
+            if 'fork' in multiprocessing.get_all_start_methods():
+                multiprocessing.set_start_method('fork', force=True)
+                try:
+                    self.assertEqual(distance_matrix(g, wf, cities, cities, workers=2), m)
+                finally:
+                    multiprocessing.set_start_method(method, force=True)
+            del g, wf
+
+
+class TestShortestPathTree(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9})
+
+    def test_small(self):
+        tree = dijkstra_tree(self.dg, self.wf, 0)
+        self.assertEqual(tree.dist, {0: 0, 2: 3, 1: 7, 3: 8})
+        self.assertEqual(tree.parent, {0: 0, 2: 0, 1: 2, 3: 1})
+        self.assertEqual(tree.path_to(3), [0, 2, 1, 3])
+        self.assertEqual(tree.path_to(0), [0])
+        self.assertEqual(tree.distance_to(5), infinity)
+        self.assertNotIn(5, tree)
+        self.assertRaises(KeyError, tree.path_to, 5)
+
+    def test_iberia(self):
+        tree = dijkstra_tree(iberia, km, 'Madrid')
+        self.assertEqual(len(tree.dist), len(iberia.V))
+        for v in sorted(iberia.V)[::25]:
+            path = tree.path_to(v)
+            self.assertEqual(path, shortest_path_positive_weighted_graph(iberia, km, 'Madrid', v))
+            self.assertAlmostEqual(tree.distance_to(v), sum(km(u, w) for u, w in zip(path, path[1:])))
+
+
+class TestBoundedSearches(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9})
+
+    def test_within(self):
+        self.assertEqual(dijkstra_within(self.dg, self.wf, 0, 7), [(0, 0), (2, 3), (1, 7)])
+        self.assertEqual(dijkstra_within(self.dg, self.wf, 0, 100), [(0, 0), (2, 3), (1, 7), (3, 8)])
+        self.assertEqual(dijkstra_within(self.dg, self.wf, 5, 100), [(5, 0)])
+        dist = {v: dv for _, v, dv in traverse_dijkstra_distances(iberia, km, 'Madrid')}
+        ball = dijkstra_within(iberia, km, 'Madrid', 150)
+        self.assertEqual(set(v for v, _ in ball), set(v for v, dv in dist.items() if dv <= 150))
+        self.assertEqual([dv for _, dv in ball], sorted(dv for _, dv in ball))
+
+    def test_k_nearest(self):
+        self.assertEqual(dijkstra_k_nearest(self.dg, self.wf, 0, 2), [(0, 0), (2, 3)])
+        self.assertEqual(dijkstra_k_nearest(self.dg, self.wf, 0, 2, targets=[3, 1, 5]), [(1, 7), (3, 8)])
+        self.assertEqual(dijkstra_k_nearest(self.dg, self.wf, 0, 5, targets=[3, 5]), [(3, 8)])
+        self.assertEqual(dijkstra_k_nearest(self.dg, self.wf, 0, 0), [])
+        self.assertRaises(ValueError, dijkstra_k_nearest, self.dg, self.wf, 0, -1)
+        depots = ['Barcelona', 'Sevilla', 'Bilbao', 'Zaragoza', 'Toledo']
+        dist = {v: dv for _, v, dv in traverse_dijkstra_distances(iberia, km, 'Madrid')}
+        nearest = dijkstra_k_nearest(iberia, km, 'Madrid', 3, targets=depots)
+        self.assertEqual([v for v, _ in nearest], sorted(depots, key=dist.get)[:3])
+
+
+if __name__ == "__main__":
+    unittest.main()
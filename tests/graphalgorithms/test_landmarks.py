@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from algoritmia.algorithms.landmarks import LandmarkIndex
+from algoritmia.algorithms.shortest_path import (shortest_path_metric_graph, euclidean_distance,
+                                                 shortest_path_positive_weighted_graph)
+from algoritmia.algorithms.traverse import traverse_dijkstra_distances
+from algoritmia.data.iberia import iberia, km, coords2d
+from algoritmia.datastructures.graphs import Digraph, WeightingFunction
+
+
+class TestLandmarkIndex(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3), (3, 0)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9, (3, 0): 2})
+
+    def assertAdmissible(self, g, wf, alt):
+        for u in g.V:
+            dist = {v: dv for _, v, dv in traverse_dijkstra_distances(g, wf, u)}
+            for v in g.V:
+                bound = alt(u, v)
+                self.assertTrue(0 <= bound <= dist.get(v, float('infinity')) + 1e-9)
+
+    def test_admissible(self):
+        for selection in 'farthest', 'random':
+            alt = LandmarkIndex.from_graph(self.dg, self.wf, k=2, selection=selection, seed=1)
+            self.assertEqual(len(alt.landmarks), 2)
+            self.assertAdmissible(self.dg, self.wf, alt)
+        alt = LandmarkIndex.from_graph(iberia, km, k=4, seed=0)
+        self.assertAdmissible(iberia, km, alt)
+        self.assertRaises(ValueError, LandmarkIndex.from_graph, iberia, km, 4, 'avoid')
+
+    def test_astar(self):
+        alt = LandmarkIndex.from_graph(iberia, km, k=16, seed=0)
+        self.assertEqual(alt.landmarks, LandmarkIndex.from_graph(iberia, km, k=16, seed=0).landmarks)
+        for s, t in ('Cádiz', 'Girona'), ('Madrid', 'Bilbao'), ('Vigo', 'Almería'):
+            stats_alt, stats_euclidean = {}, {}
+            path = shortest_path_metric_graph(iberia, km, alt, s, t, stats=stats_alt)
+            shortest_path_metric_graph(iberia, km, euclidean_distance(coords2d), s, t, stats=stats_euclidean)
+            self.assertEqual(path, shortest_path_positive_weighted_graph(iberia, km, s, t))
+            self.assertLessEqual(stats_alt['expanded'], stats_euclidean['expanded'])
+
+    def test_workers(self):
+        alt = LandmarkIndex.from_graph(self.dg, self.wf, k=3, selection='random', seed=2)
+        alt2 = LandmarkIndex.from_graph(self.dg, self.wf, k=3, selection='random', seed=2, workers=2)
+        self.assertEqual(alt.landmarks, alt2.landmarks)
+        for u in self.dg.V:
+            for v in self.dg.V:
+                self.assertEqual(alt(u, v), alt2(u, v))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for g, wf in (self.dg, self.wf), (iberia, km):
+                alt = LandmarkIndex.from_graph(g, wf, k=3, seed=0)
+                path = os.path.join(tmp, 'alt.bin')
+                alt.save(path)
+                loaded = LandmarkIndex.load(path)
+                self.assertEqual(loaded.landmarks, alt.landmarks)
+                for u in g.V:
+                    for v in list(g.V)[:10]:
+                        self.assertEqual(loaded(u, v), alt(u, v))
+                del loaded
+            bad = os.path.join(tmp, 'bad.bin')
+            with open(bad, 'wb') as f:
+                f.write(b'0' * 64)
+            self.assertRaises(ValueError, LandmarkIndex.load, bad)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import pickle
+import random
+import unittest
+import weakref
+
+from algoritmia.algorithms.shortest_path import (shortest_path_unweighted_graph, shortest_path_bidirectional_bfs,
+                                                 shortest_path_positive_weighted_graph, dijkstra_strategy,
+                                                 shortest_path_metric_graph, euclidean_distance,
+                                                 shortest_path_bidirectional_dijkstra, shortest_path_digraph,
+                                                 bellman_ford_tree, negative_cycle)
+from algoritmia.algorithms.traverse import (traverse_dijkstra_dict, traverse_dijkstra_heapmap, traverse_dijkstra_heapq,
+                                            traverse_dijkstra_dial, traverse_dijkstra_radix,
+                                            traverse_dijkstra_distances, traverse_astar)
+from algoritmia.data.iberia import iberia, km, coords2d
+from algoritmia.datastructures.graphs import Digraph, UndirectedGraph, WeightingFunction
+from algoritmia.utils import infinity
+
+
+class TestShortestPathUnweighted(unittest.TestCase):
+    def setUp(self):
+        self.edges = [((0, 0), (0, 1)), ((0, 2), (0, 3)), ((1, 0), (1, 1)), ((1, 1), (1, 2)),
+                      ((2, 0), (2, 1)), ((2, 1), (2, 2)), ((2, 2), (2, 3)), ((0, 1), (1, 1)),
+                      ((0, 2), (1, 2)), ((0, 3), (1, 3)), ((1, 1), (2, 1)), ((1, 2), (2, 2))]
+        self.ug = UndirectedGraph(E=self.edges)
+        self.dg = Digraph(E=[(0, 1), (1, 2), (2, 3), (0, 4), (4, 3), (3, 5), (5, 0)])
+
+    def assertIsPath(self, g, path, v_source, v_target):
+        self.assertEqual(path[0], v_source)
+        self.assertEqual(path[-1], v_target)
+        for u, v in zip(path, path[1:]):
+            self.assertTrue(g.contains_edge((u, v)))
+
+    def test_bidirectional(self):
+        for v_target in self.ug.V:
+            path = shortest_path_unweighted_graph(self.ug, (0, 0), v_target, bidirectional=True)
+            self.assertIsPath(self.ug, path, (0, 0), v_target)
+            self.assertEqual(len(path), len(shortest_path_unweighted_graph(self.ug, (0, 0), v_target)))
+        self.assertEqual(shortest_path_bidirectional_bfs(self.dg, 0, 3), [0, 4, 3])
+        self.assertEqual(shortest_path_bidirectional_bfs(self.dg, 3, 4), [3, 5, 0, 4])
+        self.assertEqual(shortest_path_bidirectional_bfs(self.dg, 2, 2), [2])
+        self.dg.add_vertex(6)
+        self.assertRaises(KeyError, shortest_path_bidirectional_bfs, self.dg, 0, 6)
+
+
+class TestDijkstra(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9})
+
+    def test_traversers(self):
+        for traverse in (traverse_dijkstra_dict, traverse_dijkstra_heapmap, traverse_dijkstra_heapq,
+                         traverse_dijkstra_dial, traverse_dijkstra_radix):
+            self.assertEqual(list(traverse(self.dg, self.wf, 0)), [(0, 0), (0, 2), (2, 1), (1, 3)])
+        self.assertEqual([dv for _, _, dv in traverse_dijkstra_distances(self.dg, self.wf, 0)], [0, 3, 7, 8])
+
+    def test_strategies(self):
+        self.assertEqual(dijkstra_strategy(iberia), 'heapq')
+        self.assertEqual(dijkstra_strategy(UndirectedGraph(E=[(0, 1), (1, 2), (2, 0)])), 'dict')
+        path = shortest_path_positive_weighted_graph(iberia, km, 'Madrid', 'Bilbao', 'dict')
+        for strategy in 'heapmap', 'heapq', 'auto':
+            self.assertEqual(shortest_path_positive_weighted_graph(iberia, km, 'Madrid', 'Bilbao', strategy), path)
+        self.assertRaises(ValueError, shortest_path_positive_weighted_graph, iberia, km, 'Madrid', 'Bilbao', 'fib')
+        self.assertEqual(dijkstra_strategy(iberia, km), 'heapq')
+        self.assertEqual(dijkstra_strategy(self.dg, self.wf), 'dial')
+        self.assertEqual(dijkstra_strategy(self.dg, self.wf, dial_max_weight=5), 'heapq')
+        self.assertEqual(dijkstra_strategy(self.dg, lambda u, v: 1), 'heapq')
+
+    def test_strategy_cache(self):
+        self.assertEqual(dijkstra_strategy(self.dg, self.wf), 'dial')
+        self.wf[0, 1] = 100  # Cambia la versión de los pesos: se vuelve a decidir
+        self.assertEqual(dijkstra_strategy(self.dg, self.wf), 'heapq')
+        self.wf[0, 1] = 10
+        self.assertEqual(dijkstra_strategy(self.dg, self.wf), 'dial')
+        g = UndirectedGraph(E=[(0, 1), (1, 2), (2, 0)])
+        self.assertEqual(dijkstra_strategy(g), 'dict')
+        g.add_vertex(3)  # Cambia la versión del grafo
+        g.add_vertex(4)
+        self.assertEqual(dijkstra_strategy(g), 'heapq')
+        wf = WeightingFunction({(0, 1): 1, (1, 2): 1, (2, 0): 1}, symmetrical=True)
+        self.assertEqual(dijkstra_strategy(g, wf, dial_max_weight=0), 'heapq')
+        self.assertEqual(dijkstra_strategy(UndirectedGraph(E=[(0, 1), (1, 2), (2, 0)]), wf, dial_max_weight=0), 'dict')
+        self.assertEqual(dijkstra_strategy(g, wf), 'dial')
+        self.assertEqual(dijkstra_strategy(g), 'heapq')  # Otros pesos (ninguno) en el mismo grafo
+        self.assertEqual(dijkstra_strategy(g, lambda u, v: 1), 'heapq')
+
+    def test_strategy_cache_references(self):
+        # La caché no modifica los pesos ni mantiene vivo el grafo
+        size = len(pickle.dumps(km))
+        shortest_path_positive_weighted_graph(iberia, km, 'Madrid', 'Bilbao')
+        self.assertEqual(len(pickle.dumps(km)), size)
+        g = UndirectedGraph(E=[(0, 1), (1, 2)])
+        self.assertEqual(dijkstra_strategy(g, self.wf), 'dial')
+        g_ref = weakref.ref(g)
+        del g
+        self.assertIsNone(g_ref())
+
+    def test_integer_weights(self):
+        rnd = random.Random(0)
+        for _ in range(20):
+            edges = {(rnd.randrange(30), rnd.randrange(30)): rnd.randint(0, 20) for _ in range(100)}
+            edges = {e: w for e, w in edges.items() if e[0] != e[1]}
+            g = Digraph(V=range(30), E=edges)
+            wf = WeightingFunction(edges)
+            expected = {v: dv for _, v, dv in traverse_dijkstra_distances(g, wf, 0)}
+            for traverse in traverse_dijkstra_dial, traverse_dijkstra_radix:
+                dist = {0: 0}
+                for u, v in traverse(g, wf, 0):
+                    if u != v:
+                        dist[v] = dist[u] + wf(u, v)
+                self.assertEqual(dist, expected)
+        for traverse in traverse_dijkstra_dial, traverse_dijkstra_radix:
+            self.assertRaises(ValueError, list, traverse(self.dg, WeightingFunction({**self.wf, (0, 2): -1}), 0))
+        path = shortest_path_positive_weighted_graph(self.dg, self.wf, 0, 3, 'radix')
+        self.assertEqual(shortest_path_positive_weighted_graph(self.dg, self.wf, 0, 3), path)
+
+
+    def test_astar(self):
+        dist = euclidean_distance(coords2d)
+        calls = []
+
+        def counted_dist(u, v):
+            calls.append(u)
+            return dist(u, v)
+
+        stats = {}
+        path = shortest_path_metric_graph(iberia, km, counted_dist, 'Madrid', 'Bilbao', stats=stats)
+        self.assertEqual(path, shortest_path_metric_graph(iberia, km, dist, 'Madrid', 'Bilbao', 'dict'))
+        self.assertEqual(path, shortest_path_positive_weighted_graph(iberia, km, 'Madrid', 'Bilbao'))
+        self.assertEqual(len(calls), len(set(calls)))  # La cota se calcula una vez por vértice
+        self.assertTrue(0 < stats['expanded'] < len(iberia.V) // 4)
+        edges = list(traverse_astar(self.dg, self.wf, lambda u, v: 0, 0, 3))
+        self.assertEqual(edges, [(0, 0), (0, 2), (2, 1), (1, 3)])
+        self.assertRaises(ValueError, shortest_path_metric_graph, iberia, km, dist, 'Madrid', 'Bilbao', 'fib')
+
+
+    def test_bidirectional_dijkstra(self):
+        self.assertEqual(shortest_path_bidirectional_dijkstra(self.dg, self.wf, 0, 3), (8, [0, 2, 1, 3]))
+        self.assertEqual(shortest_path_bidirectional_dijkstra(self.dg, self.wf, 1, 1), (0, [1]))
+        self.assertEqual(shortest_path_bidirectional_dijkstra(self.dg, self.wf, 3, 0), (infinity, []))
+        self.assertEqual(shortest_path_bidirectional_dijkstra(self.dg, self.wf, 0, 5), (infinity, []))
+        stats = {}
+        cost, path = shortest_path_bidirectional_dijkstra(iberia, km, 'Madrid', 'Bilbao', stats)
+        self.assertEqual(path, shortest_path_positive_weighted_graph(iberia, km, 'Madrid', 'Bilbao'))
+        self.assertAlmostEqual(cost, sum(km(u, v) for u, v in zip(path, path[1:])))
+        self.assertTrue(stats['settled'] > 0)
+
+
+class TestBellmanFord(unittest.TestCase):
+    def setUp(self):
+        self.data = {(0, 1): 1, (0, 3): 50, (1, 2): 10, (2, 0): 2,
+                     (2, 3): -3, (3, 1): -2, (3, 2): 100, (3, 4): 4}
+        self.g = Digraph(V=range(6), E=self.data.keys())
+        self.wf = WeightingFunction(self.data)
+
+    def test_small(self):
+        self.assertEqual(shortest_path_digraph(self.g, self.wf, 3, 2), (8, [3, 1, 2]))
+        self.assertEqual(shortest_path_digraph(self.g, self.wf, 3, 5), (infinity, []))
+        for mode in 'rounds', 'spfa':
+            tree = bellman_ford_tree(self.g, self.wf, 3, mode)
+            self.assertEqual(tree.dist, {0: 10, 1: -2, 2: 8, 3: 0, 4: 4})
+            self.assertEqual(tree.path_to(0), [3, 1, 2, 0])
+            self.assertIsNone(negative_cycle(self.g, self.wf, mode=mode))
+        self.assertRaises(ValueError, bellman_ford_tree, self.g, self.wf, 3, 'fib')
+        self.assertRaises(KeyError, bellman_ford_tree, self.g, self.wf, 9)
+
+    def test_negative_cycle(self):
+        self.wf[1, 2] = -1
+        for mode in 'rounds', 'spfa':
+            cycle = negative_cycle(self.g, self.wf, mode=mode)
+            self.assertEqual(sorted(cycle), [1, 2, 3])
+            self.assertLess(sum(self.wf(u, v) for u, v in zip(cycle, cycle[1:] + cycle[:1])), 0)
+            self.assertEqual(sorted(negative_cycle(self.g, self.wf, 0, mode)), [1, 2, 3])
+            self.assertIsNone(negative_cycle(self.g, self.wf, 4, mode))
+            self.assertRaises(ValueError, bellman_ford_tree, self.g, self.wf, 0, mode)
+
+    def test_random(self):
+        rnd = random.Random(0)
+        for _ in range(50):
+            edges = {(rnd.randrange(15), rnd.randrange(15)): rnd.randint(-3, 10) for _ in range(40)}
+            edges = {e: w for e, w in edges.items() if e[0] != e[1]}
+            g = Digraph(V=range(15), E=edges)
+            wf = WeightingFunction(edges)
+            results = [negative_cycle(g, wf, mode=mode) for mode in ('rounds', 'spfa')]
+            self.assertEqual(results[0] is None, results[1] is None)
+            for cycle in results:
+                if cycle is not None:
+                    self.assertLess(sum(wf(u, v) for u, v in zip(cycle, cycle[1:] + cycle[:1])), 0)
+            if results[0] is None:
+                trees = [bellman_ford_tree(g, wf, 0, mode) for mode in ('rounds', 'spfa')]
+                self.assertEqual(trees[0].dist, trees[1].dist)
+                if min(wf.values()) >= 0:
+                    self.assertEqual(trees[0].dist, {v: dv for _, v, dv in traverse_dijkstra_distances(g, wf, 0)})
+
+    def test_long_chain(self):
+        n = 5000
+        g = Digraph(E=[(i, i + 1) for i in range(n)])
+        wf = WeightingFunction(dict(((i, i + 1), -1) for i in range(n)))
+        self.assertEqual(shortest_path_digraph(g, wf, 0, n), (-n, list(range(n + 1))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from algoritmia.algorithms.shortest_path import shortest_path_positive_weighted_graph, euclidean_distance
+from algoritmia.algorithms.shortest_path_cache import ShortestPathCache
+from algoritmia.data.iberia import iberia, km, coords2d
+from algoritmia.datastructures.graphs import Digraph, WeightingFunction
+from algoritmia.utils import infinity
+
+
+class TestShortestPathCache(unittest.TestCase):
+    def setUp(self):
+        self.dg = Digraph(V=range(6), E=[(0, 1), (0, 2), (2, 1), (1, 3), (2, 3)])
+        self.wf = WeightingFunction({(0, 1): 10, (0, 2): 3, (2, 1): 4, (1, 3): 1, (2, 3): 9})
+
+    def test_hits_and_lru(self):
+        cache = ShortestPathCache(self.dg, self.wf, maxsize=2, maxtrees=1)
+        self.assertEqual(cache.path(0, 3), [0, 2, 1, 3])
+        self.assertEqual(cache.distance(0, 3), 8)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.path(0, 1)
+        cache.path(0, 3)  # (0, 1) pasa a ser el menos usado
+        cache.path(2, 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        cache.distance(0, 1)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+        self.assertEqual(cache.tree(2).path_to(3), [2, 1, 3])
+        path = cache.path(0, 3)
+        path.append(5)
+        self.assertEqual(cache.path(0, 3), [0, 2, 1, 3])
+
+    def test_unreachable(self):
+        cache = ShortestPathCache(self.dg, self.wf)
+        self.assertEqual(cache.distance(0, 5), infinity)
+        self.assertRaises(KeyError, cache.path, 0, 5)
+        self.assertRaises(KeyError, cache.path, 0, 9)
+        self.assertRaises(KeyError, cache.path, 9, 0)
+        self.assertRaises(ValueError, ShortestPathCache, self.dg, self.wf, None, -1)
+
+    def test_invalidation(self):
+        cache = ShortestPathCache(self.dg, self.wf)
+        self.assertEqual(cache.distance(0, 3), 8)
+        self.wf[2, 1] = 10
+        self.assertEqual(cache.path(0, 3), [0, 1, 3])
+        self.dg.add_edge((0, 3))
+        self.wf[0, 3] = 2
+        self.assertEqual(cache.path(0, 3), [0, 3])
+        self.dg.remove_edge((0, 3))
+        self.assertEqual(cache.path(0, 3), [0, 1, 3])
+        self.assertEqual(cache.misses, 4)
+
+    def test_metric(self):
+        cache = ShortestPathCache(iberia, km, euclidean_distance(coords2d))
+        for city in 'Bilbao', 'Sevilla', 'Madrid':
+            self.assertEqual(cache.path('Madrid', city),
+                             shortest_path_positive_weighted_graph(iberia, km, 'Madrid', city))
+            self.assertAlmostEqual(cache.distance('Madrid', city), cache.tree('Madrid').distance_to(city))
+
+
+if __name__ == "__main__":
+    unittest.main()
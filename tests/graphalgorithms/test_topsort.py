@@ -15,6 +15,12 @@ class TestTopsorter(unittest.TestCase):
         for (u,v) in G.E:
             self.assertTrue(ts.index(u) < ts.index(v))
 
+    def test_deep_and_cycles(self):
+        G = Digraph(E=[(i, i + 1) for i in range(5000)])
+        self.assertEqual(topological_sort(G), list(range(5001)))
+        self.assertRaises(Exception, topological_sort, Digraph(E=[(0, 1), (1, 2), (2, 1)]))
+        self.assertRaises(Exception, topological_sort, Digraph(E=[(0, 1), (2, 3), (3, 2)]))
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import sys
 import unittest
 from algoritmia.algorithms.traverse import traverse_bf, traverse_df
 from algoritmia.datastructures.graphs import Digraph
@@ -15,6 +16,15 @@ class TestTraversers(unittest.TestCase):
     def test_recursive_preorder_traversal(self):
         self.assertTrue(tuple([v for (u,v) in traverse_df(self.G, 0)]) in ((0, 1, 3, 4, 2), (0, 2, 3, 4, 1)))
 
+    def test_postorder_traversal(self):
+        self.assertTrue(tuple([v for (u,v) in traverse_df(self.G, 0, False)]) in ((4, 3, 1, 2, 0), (4, 3, 2, 1, 0)))
+
+    def test_deep_traversal(self):
+        n = 10 * sys.getrecursionlimit()
+        G = Digraph(E=[(i, i + 1) for i in range(n)])
+        self.assertEqual(len(list(traverse_df(G, 0))), n + 1)
+        self.assertEqual(next(traverse_df(G, 0, False)), (n - 1, n))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']